@@ -0,0 +1,64 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""Utilities shared by the benchmark scripts."""
+
+import gc
+import tracemalloc
+from time import perf_counter
+
+
+def measure(func, *args, repeat=5, **kwargs):
+    """
+    Measure the execution time and the peak memory allocated by a function call.
+
+    Parameters
+    ----------
+    func : callable
+        The function to measure.
+    *args, **kwargs
+        Arguments passed to `func` .
+    repeat : int, optional, default: 5
+        Number of calls used to measure the time. The best time is returned.
+
+    Returns
+    -------
+    time : float
+        Best execution time in seconds.
+    peak : int
+        Peak memory (in bytes) allocated during a single call.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = perf_counter()
+        func(*args, **kwargs)
+        best = min(best, perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def report(title, results):
+    """
+    Print a table of benchmark results.
+
+    Parameters
+    ----------
+    title : str
+        Title of the table.
+    results : list of tuple
+        Tuples ``(label, time, peak)`` as returned by `measure` , with a label.
+    """
+    print(f"\n{title}")  # noqa: T201
+    print(f"{'':<32}{'time (ms)':>12}{'peak (MiB)':>12}")  # noqa: T201
+    for label, time, peak in results:
+        print(f"{label:<32}{time * 1e3:>12.3f}{peak / 2**20:>12.2f}")  # noqa: T201
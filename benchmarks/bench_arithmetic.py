@@ -0,0 +1,79 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the peak memory used by arithmetic operations on large datasets.
+
+The peak memory is also given as a number of dataset sizes: an ideal binary
+operation allocates exactly one new array, and an in-place operation none.
+The default dataset size is 128 MiB (use ``--rows 16384 --cols 8192`` for 1 GiB).
+
+Note that the intermediate results of chained expressions are released only by the
+cyclic garbage collector when the datasets have coordinates (the coordinates and
+their coordset reference each other through their trait observers).
+
+Usage::
+
+    python benchmarks/bench_arithmetic.py [--rows 2048] [--cols 8192]
+"""
+
+import argparse
+
+import numpy as np
+from _common import measure
+
+import spectrochempy as scp
+
+
+def baseline_subtraction(nd):
+    return nd - nd[0]
+
+
+def chained(nd):
+    return (nd - nd[0]) * 2.0 + 1.0
+
+
+def inplace(nd):
+    nd -= nd[0]
+    nd *= 2.0
+    nd += 1.0
+    return nd
+
+
+def ufunc(nd):
+    return np.sqrt(nd)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2048)
+    parser.add_argument("--cols", type=int, default=8192)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    nd = scp.NDDataset(
+        np.random.default_rng(0).random((args.rows, args.cols)),
+        coordset=[np.arange(args.rows, dtype=float), np.arange(args.cols, dtype=float)],
+        units="absorbance",
+    )
+    size = nd.data.nbytes
+
+    print(f"\nDataset shape {nd.shape} ({size / 2**20:.0f} MiB)")  # noqa: T201
+    print(f"{'':<28}{'time (ms)':>12}{'peak (MiB)':>12}{'peak/size':>12}")  # noqa: T201
+    for label, func in [
+        ("nd - nd[0]", baseline_subtraction),
+        ("(nd - nd[0]) * 2 + 1", chained),
+        ("np.sqrt(nd)", ufunc),
+        # the dataset is modified, so this must be the last case
+        ("in-place -=, *=, +=", inplace),
+    ]:
+        time, peak = measure(func, nd, repeat=args.repeat)
+        print(  # noqa: T201
+            f"{label:<28}{time * 1e3:>12.1f}{peak / 2**20:>12.1f}{peak / size:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the AsLS baseline correction of a series of spectra.
+
+Usage::
+
+    python benchmarks/bench_asls.py [--spectra 200] [--points 2000] [--workers 4]
+"""
+
+import argparse
+
+import numpy as np
+from _common import measure
+from _common import report
+from scipy import sparse
+from scipy.sparse.linalg import spsolve
+
+from spectrochempy.processing.baselineprocessing.baselineutils import asls_baseline
+
+
+def _asls_spsolve(Y, lamb, p, tol=1e-3, max_iter=50):
+    # the method used in previous versions: the system is rebuilt and solved with a
+    # general sparse solver at each iteration
+    M, N = Y.shape
+    baselines = np.zeros((M, N))
+    D = sparse.diags([1, -2, 1], [0, -1, -2], shape=(N, N - 2))
+    for i in range(M):
+        w = np.ones(N)
+        w_old = 1e5
+        mi = Y[i].min()
+        y = Y[i] - mi
+        iteration = 0
+        while True:
+            W = sparse.spdiags(w, 0, N, N)
+            C = W + lamb * D.dot(D.transpose())
+            z = spsolve(C, w * y)
+            w = p * (y > z) + (1 - p) * (y < z)
+            change = np.sum(np.abs(w_old - w)) / N
+            if change <= tol or iteration >= max_iter:
+                break
+            w_old = w
+            iteration += 1
+        baselines[i] = z + mi
+    return baselines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--spectra", type=int, default=200)
+    parser.add_argument("--points", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # time series of spectra: a growing band on a curved baseline
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 1, args.points)
+    t = np.linspace(0, 1, args.spectra)[:, np.newaxis]
+    Y = (
+        t * np.exp(-(((x - 0.5) / 0.02) ** 2))
+        + 0.3 * x**2
+        + 0.2 * x
+        + 0.01 * rng.standard_normal((args.spectra, args.points))
+    )
+    lamb, p = 1e6, 0.01
+
+    results = []
+    for label, func in [
+        ("spsolve (previous versions)", lambda: _asls_spsolve(Y, lamb, p)),
+        ("banded", lambda: asls_baseline(Y, lamb, p)),
+        ("banded + warm start", lambda: asls_baseline(Y, lamb, p, warm_start=True)),
+        (
+            f"banded, {args.workers} processes",
+            lambda: asls_baseline(Y, lamb, p, workers=args.workers),
+        ),
+    ]:
+        time, peak = measure(func, repeat=args.repeat)
+        results.append((label, time, peak))
+    report(f"{args.spectra} spectra of {args.points} points", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the repeated access to the (rounded) data of large coordinates.
+
+Usage::
+
+    python benchmarks/bench_coord_data.py [--points 50000] [--calls 200]
+
+The coordinates are a non-linear Raman shift axis (as obtained after calibration).
+"""
+
+import argparse
+
+import numpy as np
+from _common import measure
+from _common import report
+
+import spectrochempy as scp
+from spectrochempy.core.dataset.basearrays.ndarray import NDArray
+from spectrochempy.utils.numutils import get_n_decimals
+
+
+def _data_uncached(self):
+    # the method used in previous versions: the data are rounded at each access
+    data = NDArray.data.fget(self)
+    if data is not None and len(data) > 0 and self._rounding:
+        maxval = np.max(np.abs(data))
+        rounding = 3
+        nd = get_n_decimals(maxval, self.sigdigits) if maxval > 0 else rounding
+        data = np.around(data, max(nd, rounding))
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, default=50000)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    shift = 100.0 + 3400.0 * np.linspace(0.0, 1.0, args.points) ** 1.2
+    x = scp.Coord(shift, units="cm^-1", title="raman shift")
+    ds = scp.NDDataset(rng.random((10, args.points)), coordset=[None, x])
+    locs = rng.uniform(200.0, 3400.0, args.calls)
+
+    cases = {
+        "data": lambda: [x.data for _ in range(args.calls)],
+        "loc2index": lambda: [x.loc2index(loc) for loc in locs],
+        "ds + ds": lambda: [ds + ds for _ in range(args.calls // 10)],
+    }
+    data = scp.Coord.data
+    for name, func in cases.items():
+        results = []
+        try:
+            scp.Coord.data = property(_data_uncached, data.fset)
+            time, peak = measure(func, repeat=args.repeat)
+        finally:
+            scp.Coord.data = data
+        results.append(("rounded at each access", time, peak))
+        time, peak = measure(func, repeat=args.repeat)
+        results.append(("cached", time, peak))
+        report(f"{name}, {args.points} points", results)
+
+    print(  # noqa: T201
+        f"\ncache hits: {x._data_cache_hits}, misses: {x._data_cache_misses}"
+    )
+
+
+if __name__ == "__main__":
+    main()
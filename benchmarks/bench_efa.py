@@ -0,0 +1,80 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the forward/backward eigenvalues of the evolving factor analysis.
+
+Usage::
+
+    python benchmarks/bench_efa.py [--rows 2000] [--columns 50] [--max-components 8]
+"""
+
+import argparse
+
+import numpy as np
+from _common import measure
+from _common import report
+
+import spectrochempy as scp
+
+
+def _efa_svd(X):
+    # the method used in previous versions: a SVD for each sub-matrix
+    M, N = X.shape
+    f = np.zeros((M, min(M, N)))
+    b = np.zeros((M, min(M, N)))
+    for i in range(M):
+        s = np.linalg.svd(X[: i + 1], compute_uv=False)
+        f[i, : s.size] = s**2
+        s = np.linalg.svd(X[i:], compute_uv=False)
+        b[i, : s.size] = s**2
+    return f, b
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--columns", type=int, default=50)
+    parser.add_argument("--max-components", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    # a chromatogram-like dataset of 4 overlapping components with noise
+    rng = np.random.default_rng(0)
+    t = np.linspace(0.0, 400.0, args.rows)[:, None]
+    C = np.exp(
+        -(((t - [[80.0, 150.0, 220.0, 300.0]]) / [[30.0, 40.0, 30.0, 50.0]]) ** 2)
+    )
+    X = C @ rng.random((4, args.columns))
+    X += rng.normal(0.0, 0.01, X.shape)
+    dataset = scp.NDDataset(X)
+
+    f_svd = _efa_svd(X)[0]
+    results = []
+    errors = []
+    for label, func in [
+        ("SVD of each sub-matrix", lambda: _efa_svd(X)),
+        ("incremental", lambda: scp.EFA().fit(dataset)),
+        (
+            f"incremental, max_components={args.max_components}",
+            lambda: scp.EFA(max_components=args.max_components).fit(dataset),
+        ),
+    ]:
+        time, peak = measure(func, repeat=args.repeat)
+        results.append((label, time, peak))
+        out = func()
+        f = out[0] if isinstance(out, tuple) else out.f_ev.data
+        # relative error on the 4 significant eigenvalues
+        err = np.max(np.abs(f[:, :4] - f_svd[:, :4]) / f_svd[:, :4].max())
+        errors.append((label, err))
+
+    report(f"EFA of {args.rows} x {args.columns}", results)
+    print(f"\n{'':<40}{'max error':>12}")  # noqa: T201
+    for label, err in errors:
+        print(f"{label:<40}{err:>12.2e}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
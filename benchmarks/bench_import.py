@@ -0,0 +1,92 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the import time of SpectroChemPy, with and without headless mode.
+
+Usage::
+
+    python benchmarks/bench_import.py [--repeat 5]
+
+Each measure is done in a new Python process: the time is the one needed to import
+SpectroChemPy and create a first dataset, and the peak is the maximum resident memory
+of the process (Unix only).
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from _common import report
+
+_SCRIPT = """
+import json
+import os
+import resource
+import sys
+import threading
+from time import perf_counter
+
+start = perf_counter()
+import spectrochempy as scp
+
+scp.NDDataset([1.0, 2.0, 3.0])
+time = perf_counter() - start
+
+heavy = ["IPython", "matplotlib", "mpl_toolkits"]
+print(json.dumps({
+    "time": time,
+    "peak": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+    "modules": len(sys.modules),
+    "loaded": [name for name in heavy if name in sys.modules],
+    "threads": threading.active_count(),
+}))
+sys.stdout.flush()
+# do not wait for the threads (check of updates, download of the test data...)
+os._exit(0)
+"""
+
+
+def _run(headless):
+    env = dict(os.environ)
+    env.pop("SCPY_HEADLESS", None)
+    if headless:
+        env["SCPY_HEADLESS"] = "1"
+    res = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(res.stdout.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = []
+    details = []
+    for label, headless in [("default", False), ("headless", True)]:
+        runs = [_run(headless) for _ in range(args.repeat + 1)]
+        best = min(runs[1:], key=lambda run: run["time"])  # first run warms caches
+        results.append((label, best["time"], best["peak"]))
+        details.append((label, best))
+
+    report("import spectrochempy and create a dataset", results)
+    print(f"\n{'':<16}{'modules':>10}{'threads':>10}  heavy modules loaded")  # noqa: T201
+    for label, run in details:
+        loaded = ", ".join(run["loaded"]) or "-"
+        print(  # noqa: T201
+            f"{label:<16}{run['modules']:>10}{run['threads']:>10}  {loaded}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the regularized IRIS inversion (as in the IRIS examples).
+
+Usage::
+
+    python benchmarks/bench_iris.py [--channels 155] [--workers 2]
+
+The dataset is a synthetic version of ``irdata/CO@Mo_Al2O3.SPG`` used in
+``examples/analysis/a_decomposition/plot_iris.py`` (19 pressures, langmuir kernel
+with 50 energies, ``reg_par=[-10, 1, 12]`` and ``reg_par=[-6, -2]``).
+"""
+
+import argparse
+
+import numpy as np
+import osqp
+from _common import measure
+from _common import report
+from scipy import sparse
+
+import spectrochempy as scp
+from spectrochempy.analysis.decomposition import iris
+
+
+def _solve_for_lambda_setup(qp, lamda):
+    # the method used in previous versions: a new problem is set up (and P factorized)
+    # for each channel
+    X, K, P0, XtK, S, _, _, _ = qp
+    M, N = K.shape[-1], X.shape[-1]
+    fi = np.zeros((M, N))
+    q = -2 * XtK
+    A = sparse.csc_matrix(np.eye(M))
+    lo = np.zeros(M)
+    up = np.ones(M) * np.inf
+    for j in range(N):
+        P = sparse.csc_matrix(P0 + 2 * lamda * S)
+        qprob = osqp.OSQP()
+        qprob.setup(P, q[j], A, lo, up, alpha=1.0, verbose=False)
+        fi[:, j] = qprob.solve().x
+    resi = X - np.dot(K, fi)
+    return fi, np.sum(resi**2), np.linalg.norm(np.dot(np.dot(fi.T, S), fi))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, default=155)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    # two bands with distributions of adsorption energies
+    rng = np.random.default_rng(0)
+    pressures = [0.003, 0.004, 0.009, 0.014, 0.021, 0.026, 0.036, 0.051, 0.093, 0.150]
+    pressures += [0.203, 0.300, 0.404, 0.503, 0.602, 0.702, 0.801, 0.905, 1.004]
+    p = np.array(pressures)
+    nu = np.linspace(2250.0, 1950.0, args.channels)
+    energies = np.linspace(-8.0, -1.0, 50)
+    theta = np.exp(-energies) * p[:, None] / (1 + np.exp(-energies) * p[:, None])
+    f1 = np.exp(-(((energies - -6.0) / 0.8) ** 2))[:, None]
+    f2 = np.exp(-(((energies - -3.0) / 1.0) ** 2))[:, None]
+    band1 = np.exp(-(((nu - 2100.0) / 15.0) ** 2))
+    band2 = np.exp(-(((nu - 2050.0) / 20.0) ** 2))
+    data = theta @ (f1 * band1 + f2 * band2) * 0.02
+    data += rng.normal(0.0, 1.0e-3, data.shape)
+    X = scp.NDDataset(
+        data,
+        coordset=[
+            scp.Coord(p, title="pressure", units="torr"),
+            scp.Coord(nu, title="wavenumbers", units="cm^-1"),
+        ],
+    )
+    K = scp.IrisKernel(X, "langmuir", q=[-8, -1, 50])
+
+    def fit(reg_par, workers=None):
+        model = scp.IRIS(reg_par=reg_par, workers=workers)
+        model.fit(X, K)
+        return model
+
+    for reg_par in ([-10, 1, 12], [-6, -2]):
+        results = []
+        solve_for_lambda = iris._solve_for_lambda
+        try:
+            iris._solve_for_lambda = _solve_for_lambda_setup
+            time, peak = measure(
+                lambda reg_par=reg_par: fit(reg_par), repeat=args.repeat
+            )
+            ref = fit(reg_par)
+        finally:
+            iris._solve_for_lambda = solve_for_lambda
+        results.append(("setup for each channel", time, peak))
+        time, peak = measure(lambda reg_par=reg_par: fit(reg_par), repeat=args.repeat)
+        results.append(("setup once per lambda", time, peak))
+        new = fit(reg_par)
+        if len(reg_par) == 3:
+            time, peak = measure(
+                lambda reg_par=reg_par: fit(reg_par, args.workers), repeat=args.repeat
+            )
+            results.append(
+                (f"setup once per lambda, {args.workers} workers", time, peak)
+            )
+        report(f"IRIS, reg_par={reg_par}, {args.channels} channels", results)
+        # (the distributions themselves are only determined within the tolerance of
+        # osqp, which is large for the smallest lambdas)
+        diff = np.max(np.abs(new.RSS - ref.RSS) / ref.RSS)
+        print(f"max relative difference of the residuals: {diff:.2e}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
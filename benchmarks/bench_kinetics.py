@@ -0,0 +1,99 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the repeated integration of action mass kinetics (as in a fit).
+
+Usage::
+
+    python benchmarks/bench_kinetics.py [--species 10] [--calls 200]
+
+(the number of species is limited to 26)
+"""
+
+import argparse
+import string
+from functools import partial
+
+import numpy as np
+from _common import measure
+from _common import report
+from scipy.integrate import solve_ivp
+
+from spectrochempy.analysis.kinetic.kineticutilities import ActionMassKinetics
+
+
+def _integrate_exec(kin, t, use_jac=False):
+    # the method used in previous versions: the production rates (and jacobian) are
+    # generated as python source and compiled at each call
+    global_env, locals_env = {}, {}
+    exec(  # noqa: S102
+        f"def f_(self, k, t, C): return{kin._write_production_rates()}",
+        global_env,
+        locals_env,
+    )
+    jac = None
+    if use_jac:
+        exec(  # noqa: S102
+            f"def jac_(self, k, t, C): return{kin._write_jacobian()}",
+            global_env,
+            locals_env,
+        )
+        jac = partial(locals_env["jac_"], kin, kin._arrhenius)
+    C0 = list(kin._init_concentrations.values())
+    return solve_ivp(
+        partial(locals_env["f_"], kin, kin._arrhenius),
+        (t[0], t[-1]),
+        C0,
+        t_eval=t,
+        method="LSODA",
+        atol=1e-6,
+        rtol=1e-3,
+        jac=jac,
+    ).y.T
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--species", type=int, default=10)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # a chain of reversible reactions A <-> B <-> C ... with a dimerization
+    names = list(string.ascii_uppercase[: args.species])
+    n = len(names)
+    reactions = [f"{a} -> {b}" for a, b in zip(names[:-1], names[1:], strict=True)]
+    reactions += [f"{b} -> {a}" for a, b in zip(names[:-1], names[1:], strict=True)]
+    reactions += [f"2 {names[0]} -> {names[1]}"]
+    species = {name: 1.0 if i == 0 else 0.0 for i, name in enumerate(names)}
+    k = np.linspace(0.5, 1.5, len(reactions))
+    kin = ActionMassKinetics(reactions, species, k)
+    t = np.linspace(0.0, 10.0, 100)
+
+    results = []
+    for label, func in [
+        ("exec at each call", lambda: _integrate_exec(kin, t)),
+        ("cached rate law", lambda: kin.integrate(t, return_NDDataset=False)),
+        ("exec at each call, jac", lambda: _integrate_exec(kin, t, True)),
+        (
+            "cached rate law, jac",
+            lambda: kin.integrate(t, return_NDDataset=False, use_jac=True),
+        ),
+    ]:
+
+        def calls(func=func):
+            for _ in range(args.calls):
+                func()
+
+        time, peak = measure(calls, repeat=args.repeat)
+        results.append((label, time, peak))
+    report(
+        f"{args.calls} integrations, {n} species, {len(reactions)} reactions", results
+    )
+
+
+if __name__ == "__main__":
+    main()
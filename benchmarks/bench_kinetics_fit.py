@@ -0,0 +1,88 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the fit of rate parameters on several temperature programs.
+
+Usage::
+
+    python benchmarks/bench_kinetics_fit.py [--conditions 20] [--workers 4]
+"""
+
+import argparse
+
+import numpy as np
+from _common import measure
+from _common import report
+
+from spectrochempy.analysis.kinetic.kineticutilities import ActionMassKinetics
+
+
+class _Ramp:
+    # a linear temperature program (a class, not a lambda, to be usable in any case)
+    def __init__(self, T0, rate):
+        self.T0 = T0
+        self.rate = rate
+
+    def __call__(self, t):
+        return self.T0 + self.rate * t
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--conditions", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    # A -> B -> C on temperature ramps of various rates
+    reactions = ("A -> B", "B -> C")
+    k_exp = np.array(((1.0e8, 52.0e3), (1.0e8, 50.0e3)))
+    n = args.conditions
+    species = [{"A": 1.0, "B": 0.0, "C": 0.0}] * n
+    T = [_Ramp(290.0, rate) for rate in np.linspace(0.5, 3.0, n)]
+    time = [np.linspace(0.0, 10.0, 50)] * n
+    C_exp = ActionMassKinetics(reactions, species, k_exp, T=T).integrate(
+        time, k_dt=0.01
+    )
+
+    results = []
+    fits = []
+    for label, optimizer_kwargs, workers in [
+        ("Nelder-Mead", {}, None),
+        (f"Nelder-Mead, {args.workers} workers", {}, args.workers),
+        ("L-BFGS-B, sensitivities", {"jac": True}, None),
+        (
+            f"L-BFGS-B, sensitivities, {args.workers} workers",
+            {"jac": True},
+            args.workers,
+        ),
+    ]:
+
+        def fit(optimizer_kwargs=optimizer_kwargs, workers=workers):
+            k_guess = np.array(((1.5e8, 52.0e3), (1.0e8, 55.0e3)))
+            kin = ActionMassKinetics(reactions, species, k_guess, T=T)
+            return kin.fit_to_concentrations(
+                C_exp,
+                iexp=[0, 1, 2],
+                i2iexp=[0, 1, 2],
+                dict_param_to_optimize={"k[0].A": 1.1e8, "k[1].Ea": 49.0e3},
+                optimizer_kwargs=optimizer_kwargs | {"options": {"disp": False}},
+                ivp_solver_kwargs={"k_dt": 0.01, "workers": workers},
+            )[2]
+
+        time_, peak = measure(fit, repeat=args.repeat)
+        results.append((label, time_, peak))
+        res = fit()
+        fits.append((label, res.nfev, *res.x))
+
+    report(f"{n} temperature programs", results)
+    print(f"\n{'':<48}{'nfev':>8}{'A':>12}{'Ea':>12}")  # noqa: T201
+    for label, nfev, A, Ea in fits:
+        print(f"{label:<48}{nfev:>8}{A:>12.4g}{Ea:>12.5g}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of linear coordinates stored as an array and as a range.
+
+Usage::
+
+    python benchmarks/bench_linear_coord.py [--points 65536] [--calls 1000]
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from _common import measure
+from _common import report
+
+import spectrochempy as scp
+
+
+def _as_array(coord):
+    # linear coordinates as stored in previous versions: the full array
+    coord._data  # noqa: B018
+    coord._deferred = None
+    return coord
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, default=65536)
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    x = np.linspace(4000.0, 400.0, args.points)
+    locs = rng.uniform(500.0, 3900.0, args.calls)
+    coords = {
+        "array": _as_array(scp.Coord(x, units="cm^-1", title="wavenumbers")),
+        "range": scp.Coord(x, units="cm^-1", title="wavenumbers"),
+    }
+
+    cases = {
+        "copy": lambda c: [c.copy() for _ in range(args.calls)],
+        "slicing": lambda c: [c[10 : args.points // 2 : 2] for _ in range(args.calls)],
+        "loc2index": lambda c: [c.loc2index(loc) for loc in locs],
+    }
+    for name, func in cases.items():
+        results = []
+        for label, coord in coords.items():
+            time, peak = measure(
+                lambda func=func, coord=coord: func(coord), repeat=args.repeat
+            )
+            results.append((label, time, peak))
+        report(f"{args.calls} x {name}, {args.points} points", results)
+
+    # size of the saved datasets (a single spectrum)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        print(f"\n{'':<32}{'scp size (kiB)':>16}")  # noqa: T201
+        for label in coords:
+            nd = scp.NDDataset(rng.random((1, args.points)), coordset=[None, x])
+            if label == "array":
+                _as_array(nd.x)
+            f = nd.save_as(Path(tmpdir) / label, confirm=False)
+            print(f"{label:<32}{f.stat().st_size / 2**10:>16.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the non-negative least squares solvers of MCRALS.
+
+Usage::
+
+    python benchmarks/bench_mcrals_nnls.py [--rows 500] [--cols 4000] [--components 4]
+"""
+
+import argparse
+
+import numpy as np
+from _common import measure
+from _common import report
+
+from spectrochempy.analysis.decomposition.mcrals import _fnnls
+from spectrochempy.analysis.decomposition.mcrals import _nnls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--cols", type=int, default=4000)
+    parser.add_argument("--components", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # synthetic X = C @ St + noise, with non-negative profiles
+    rng = np.random.default_rng(0)
+    C = rng.random((args.rows, args.components))
+    St = rng.random((args.components, args.cols))
+    X = C @ St + 0.05 * rng.normal(size=(args.rows, args.cols))
+
+    # one ALS iteration solves for C (rows targets) then for St (cols targets)
+    cases = {
+        "solve C": (St.T, X.T),
+        "solve St": (C, X),
+    }
+    for name, (A, B) in cases.items():
+        results = []
+        for label, solver in [
+            ("nnls (per column)", _nnls),
+            ("fnnls (batched)", _fnnls),
+        ]:
+            time, peak = measure(solver, A, B, repeat=args.repeat)
+            results.append((label, time, peak))
+        diff = np.abs(_nnls(A, B) - _fnnls(A, B)).max()
+        report(f"{name} - {B.shape[1]} targets (max difference: {diff:.1e})", results)
+
+
+if __name__ == "__main__":
+    main()
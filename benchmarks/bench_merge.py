@@ -0,0 +1,66 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the merging of series of spectra read from individual files.
+
+Usage::
+
+    python benchmarks/bench_merge.py [--spectra 2000] [--points 5000]
+"""
+
+import argparse
+
+import numpy as np
+from _common import measure
+from _common import report
+
+import spectrochempy as scp
+from spectrochempy.core.readers.importer import merge_datasets
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--spectra", type=int, default=2000)
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # spectra with the structure of those read from omnic .spa files,
+    # in a random acquisition order
+    rng = np.random.default_rng(0)
+    x = scp.Coord.linspace(
+        4000.0, 400.0, args.points, title="wavenumbers", units="cm^-1"
+    )
+    datasets = []
+    for i, timestamp in enumerate(rng.permutation(args.spectra)):
+        ds = scp.NDDataset(rng.random((1, args.points)), units="absorbance")
+        y = scp.Coord(
+            [float(timestamp)],
+            title="acquisition timestamp (GMT)",
+            units="s",
+            labels=[f"spectrum{i}.spa"],
+        )
+        ds.set_coordset(y=y, x=x.copy())
+        datasets.append(ds)
+
+    def concatenate_and_sort():
+        # the method used in previous versions
+        dataset = scp.concatenate(datasets, axis=0)
+        dataset.sort(dim=0, inplace=True)
+        return dataset
+
+    results = []
+    for label, func in [
+        ("concatenate + sort", concatenate_and_sort),
+        ("merge_datasets", lambda: merge_datasets(datasets)),
+    ]:
+        time, peak = measure(func, repeat=args.repeat)
+        results.append((label, time, peak))
+    report(f"{args.spectra} spectra of {args.points} points", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the least-squares curve fitting with and without analytic jacobian.
+
+Usage::
+
+    python benchmarks/bench_optimize_jacobian.py [--lines 8] [--points 2000]
+"""
+
+import argparse
+
+import numpy as np
+from _common import measure
+from _common import report
+
+import spectrochempy as scp
+from spectrochempy.analysis.curvefitting import optimize
+
+
+class _Counter:
+    # count the calls of the residual and jacobian functions of Optimize
+    def __init__(self):
+        self.njev = 0
+        self._get_jacobian = optimize.Optimize._get_jacobian
+
+        def _get_jacobian(instance, X):
+            self.njev += 1
+            return self._get_jacobian(instance, X)
+
+        optimize.Optimize._get_jacobian = _get_jacobian
+
+    def reset(self):
+        optimize.ncalls = 0
+        self.njev = 0
+
+    @property
+    def nfev(self):
+        return optimize.ncalls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=8)
+    parser.add_argument("--points", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # a spectrum made of lorentzian and gaussian lines on a linear baseline
+    rng = np.random.default_rng(0)
+    x = np.linspace(4000.0, 1000.0, args.points)
+    positions = np.linspace(1200.0, 3800.0, args.lines)
+    y = 0.2 + 1.0e-4 * x + rng.normal(0.0, 0.01, x.size)
+    script = ""
+    for i, pos in enumerate(positions):
+        width = 40.0 + 10.0 * (i % 3)
+        if i % 2:
+            y += np.exp(-(((x - pos) / (width / 1.6651)) ** 2))
+            shape = "gaussianmodel"
+        else:
+            y += 1.0 / (1.0 + ((x - pos) / (width / 2.0)) ** 2)
+            shape = "lorentzianmodel"
+        script += f"""
+        MODEL: LINE_{i}
+        shape: {shape}
+            $ ampl: 0.8, 0.0, none
+            $ pos: {pos + 10.0}, {pos - 50.0}, {pos + 50.0}
+            $ width: 50.0, 5.0, 200.0
+        """
+    X = scp.NDDataset(y[None], coordset=[None, scp.Coord(x, title="wavenumbers")])
+
+    counter = _Counter()
+    results = []
+    calls = []
+    for label, use_jacobian in [
+        ("finite differences", False),
+        ("analytic jacobian", True),
+    ]:
+
+        def fit(use_jacobian=use_jacobian):
+            fitter = optimize.Optimize(
+                autobase=True, use_jacobian=use_jacobian, log_level="WARNING"
+            )
+            fitter.script = script
+            fitter.fit(X)
+            return fitter
+
+        time, peak = measure(fit, repeat=args.repeat)
+        results.append((label, time, peak))
+        counter.reset()
+        fitter = fit()
+        chi2 = np.sum((y - fitter.inverse_transform().data.squeeze()) ** 2)
+        calls.append((label, counter.nfev, counter.njev, chi2))
+
+    title = f"{args.lines} lines, {args.points} points, {3 * args.lines} parameters"
+    report(title, results)
+    print(f"\n{'':<32}{'nfev':>12}{'njev':>12}{'chi2':>12}")  # noqa: T201
+    for label, nfev, njev, chi2 in calls:
+        print(f"{label:<32}{nfev:>12}{njev:>12}{chi2:>12.4g}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the selection of the pure variables in SIMPLISMA.
+
+Usage::
+
+    python benchmarks/bench_simplisma.py [--rows 50] [--columns 8000] [--components 8]
+"""
+
+import argparse
+
+import numpy as np
+from _common import measure
+from _common import report
+
+import spectrochempy as scp
+from spectrochempy import SIMPLISMA
+
+
+def _weights_loop(Xscaled, maxPIndex):
+    # the method used in previous versions: the whole COO matrix is computed and the
+    # submatrix of each variable is built element by element
+    M, N = Xscaled.shape
+    COO = Xscaled.T @ Xscaled / M
+    w = np.zeros((len(maxPIndex), N))
+    for j in range(1, len(maxPIndex)):
+        for i in range(N):
+            Mji = np.zeros((j + 1, j + 1))
+            idx = [i] + maxPIndex[0:j]
+            for line in range(j + 1):
+                for col in range(j + 1):
+                    Mji[line, col] = COO[idx[line], idx[col]]
+            w[j, i] = np.linalg.det(Mji)
+    return w
+
+
+def _weights_batched(Xscaled, maxPIndex):
+    M, N = Xscaled.shape
+    COO_diag = np.sum(Xscaled**2, axis=0) / M
+    w = np.zeros((len(maxPIndex), N))
+    for j in range(1, len(maxPIndex)):
+        COO_j = Xscaled.T @ Xscaled[:, maxPIndex[0:j]] / M
+        Mj = np.empty((N, j + 1, j + 1))
+        Mj[:, 0, 0] = COO_diag
+        Mj[:, 0, 1:] = COO_j
+        Mj[:, 1:, 0] = COO_j
+        Mj[:, 1:, 1:] = COO_j[maxPIndex[0:j]]
+        w[j] = np.linalg.det(Mj)
+    return w
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--columns", type=int, default=8000)
+    parser.add_argument("--components", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    # mixtures of gaussian bands
+    rng = np.random.default_rng(0)
+    n = args.components
+    x = np.linspace(0.0, 1.0, args.columns)
+    St = np.exp(-(((x - rng.random((n, 1))) / 0.02) ** 2))
+    C = rng.random((args.rows, n))
+    X = C @ St + rng.normal(0.0, 1.0e-3, (args.rows, args.columns))
+    X -= min(X.min(), 0.0)
+    dataset = scp.NDDataset(X)
+
+    # (the cost of the weights does not depend on the pure variables, taken here at
+    # the maxima of the bands)
+    maxPIndex = [int(i) for i in np.argmax(St, axis=1)]
+
+    # the scaled dataset, as computed in SIMPLISMA
+    sigma, mu = np.std(X, axis=0), np.mean(X, axis=0)
+    alpha = 0.03 * np.max(mu)
+    Xscaled = X / np.sqrt(mu**2 + (sigma + alpha) ** 2)
+
+    results = []
+    for label, func in [
+        ("COO matrix and weights, loops", lambda: _weights_loop(Xscaled, maxPIndex)),
+        (
+            "COO columns, batched determinants",
+            lambda: _weights_batched(Xscaled, maxPIndex),
+        ),
+        ("SIMPLISMA fit", lambda: SIMPLISMA(n_components=n, tol=0.0).fit(dataset)),
+    ]:
+        time, peak = measure(func, repeat=args.repeat)
+        results.append((label, time, peak))
+    report(f"{n} components, {args.rows} x {args.columns}", results)
+    w1 = _weights_loop(Xscaled, maxPIndex)
+    w2 = _weights_batched(Xscaled, maxPIndex)
+    diff = np.max(np.abs(w1 - w2)) / np.max(np.abs(w1))
+    print(f"max relative difference of the weights: {diff:.2e}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
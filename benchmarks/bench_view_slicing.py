@@ -0,0 +1,57 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the slicing of large 2D datasets, by copy and by view.
+
+Usage::
+
+    python benchmarks/bench_view_slicing.py [--rows 5000] [--cols 5000]
+"""
+
+import argparse
+
+import numpy as np
+from _common import measure
+from _common import report
+
+import spectrochempy as scp
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--cols", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    nd = scp.NDDataset(
+        np.random.default_rng(0).random((args.rows, args.cols)),
+        coordset=[np.arange(args.rows, dtype=float), np.arange(args.cols, dtype=float)],
+        units="absorbance",
+    )
+    nd[10] = scp.MASKED
+    half = args.rows // 2
+
+    cases = {
+        "single row": lambda ds: ds[half],
+        "single column": lambda ds: ds[:, half],
+        "block of rows": lambda ds: ds[: args.rows // 10],
+        "iteration on 20 rows": lambda ds: [ds[i] for i in range(20)],
+    }
+
+    for name, case in cases.items():
+        results = []
+        # the whole dataset was copied before slicing in previous versions
+        time, peak = measure(lambda c=case: c(nd.copy()), repeat=args.repeat)
+        results.append(("whole copy, then slice", time, peak))
+        for label, sliced in [("copy", nd), ("view", nd.view)]:
+            time, peak = measure(case, sliced, repeat=args.repeat)
+            results.append((label, time, peak))
+        report(f"{name} - dataset shape {nd.shape}", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+"""
+Benchmark of the Whittaker-Eilers smoothing of all the rows of a 2D dataset.
+
+Usage::
+
+    python benchmarks/bench_whittaker.py [--spectra 5000] [--points 1000]
+"""
+
+import argparse
+
+import numpy as np
+import scipy.sparse as sparse
+from _common import measure
+from _common import report
+from scipy.sparse.linalg import splu
+
+import spectrochempy as scp
+from spectrochempy.extern.whittaker_smooth import speyediff
+from spectrochempy.extern.whittaker_smooth import whittaker_factor
+
+
+def _smooth_row(y, lmbd, d):
+    # the method used in previous versions: one factorization per row
+    m = len(y)
+    E = sparse.eye(m, format="csc")
+    D = speyediff(m, d, format="csc")
+    return splu(E + lmbd * D.conj().T.dot(D)).solve(y)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--spectra", type=int, default=5000)
+    parser.add_argument("--points", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    dataset = scp.NDDataset(rng.random((args.spectra, args.points)))
+
+    def per_row():
+        return np.apply_along_axis(_smooth_row, -1, dataset.data, 1.5, 2)
+
+    def factorize_once():
+        whittaker_factor.cache_clear()
+        return dataset.whittaker(lamb=1.5, order=2)
+
+    results = []
+    for label, func in [
+        ("factorization per row", per_row),
+        ("single factorization", factorize_once),
+        ("cached factorization", lambda: dataset.whittaker(lamb=1.5, order=2)),
+    ]:
+        time, peak = measure(func, repeat=args.repeat)
+        results.append((label, time, peak))
+    report(f"{args.spectra} spectra of {args.points} points", results)
+
+
+if __name__ == "__main__":
+    main()
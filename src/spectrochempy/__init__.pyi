@@ -10,6 +10,7 @@ __all__ = [
     "analysis",
     "application",
     "core",
+    "diagnostics",
     "extern",
     "ipython",
     "processing",
@@ -19,6 +20,7 @@ __all__ = [
 from . import analysis
 from . import application
 from . import core
+from . import diagnostics
 from . import extern
 from . import ipython
 from . import processing
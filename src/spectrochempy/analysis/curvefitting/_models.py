@@ -129,6 +129,16 @@ class polynomialbaseline:
         c.extend(c_)
         return ampl * np.polyval(np.array(tuple(c))[::-1], x - x[int(x.size / 2)])
 
+    def jacobian(self, x, ampl, *c_):
+        """Return the derivatives of `f` with respect to each parameter."""
+        xc = x - x[int(x.size / 2)]
+        c = [0.0, 0.0]
+        c.extend(c_)
+        powers = [xc ** (i + 2) for i in range(len(c_))]
+        return np.array(
+            [np.polyval(np.array(tuple(c))[::-1], xc)] + [ampl * p for p in powers]
+        )
+
 
 # #===============================================================================
 # # Gaussian2DModel
@@ -183,6 +193,20 @@ class gaussianmodel:
         w = w * abs(x[1] - x[0])
         return ampl * w
 
+    def jacobian(self, x, ampl, pos, width):
+        """Return the derivatives of `f` with respect to each parameter."""
+        gb = width / 2.3548
+        tsq = (x - pos) * 2**-0.5 / gb
+        w = np.exp(-tsq * tsq) * (2 * np.pi) ** -0.5 / gb
+        w = w * abs(x[1] - x[0])
+        return np.array(
+            [
+                w,
+                ampl * w * 2**0.5 * tsq / gb,
+                ampl * w * (2 * tsq * tsq - 1) / width,
+            ]
+        )
+
 
 # ======================================================================================
 # LorentzianModel
@@ -214,6 +238,20 @@ class lorentzianmodel:
         w = w * abs(x[1] - x[0])
         return ampl * w
 
+    def jacobian(self, x, ampl, pos, width):
+        """Return the derivatives of `f` with respect to each parameter."""
+        lb = width / 2.0
+        den = x * x - 2 * x * pos + pos * pos + lb * lb
+        w = lb / np.pi / den
+        w = w * abs(x[1] - x[0])
+        return np.array(
+            [
+                w,
+                ampl * w * 2 * (x - pos) / den,
+                ampl * w * (den - 2 * lb * lb) / (2 * lb * den),
+            ]
+        )
+
 
 # ======================================================================================
 # VoigtModel
@@ -254,6 +292,11 @@ class voigtmodel:
     def f(x, ampl, pos, width, ratio, **kargs):
         return asymmetricvoigtmodel().f(x, ampl, pos, width, ratio, asym=0.0)
 
+    @staticmethod
+    def jacobian(x, ampl, pos, width, ratio):
+        """Return the derivatives of `f` with respect to each parameter."""
+        return asymmetricvoigtmodel().jacobian(x, ampl, pos, width, ratio, 0.0)[:4]
+
 
 # ======================================================================================
 # Asymmetric Voigt Model
@@ -294,6 +337,57 @@ class asymmetricvoigtmodel:
         w = w * abs(x[1] - x[0])
         return ampl * w
 
+    def jacobian(self, x, ampl, pos, width, ratio, asym):
+        """
+        Return the derivatives of `f` with respect to each parameter.
+
+        At asym = 0, the derivative with respect to asym is the right derivative.
+        """
+        from scipy.special import wofz
+
+        # width g and its derivatives with respect to width, pos and asym
+        if asym >= 0.0:
+            s = sigmoidmodel().f(x, 1.0, pos, asym / width)
+            g = 2.0 * width * s
+            ds = s * (1.0 - s)
+            dg = [2.0 * (s + ds * asym * (x - pos) / width), 2.0 * asym * ds]
+            dg.append(-2.0 * (x - pos) * ds)
+        else:
+            g = np.full_like(x, width)
+            dg = [np.ones_like(x), np.zeros_like(x), np.zeros_like(x)]
+        dx = abs(x[1] - x[0])
+
+        if ratio < 1.0e-16:
+            # lorentzian of width (1 - ratio) * g
+            _, dfpos, dfw = lorentzianmodel().jacobian(x, ampl, pos, (1.0 - ratio) * g)
+            dfdg = dfw * (1.0 - ratio)
+            dfratio = -dfw * g
+            dfampl = lorentzianmodel().f(x, 1.0, pos, (1.0 - ratio) * g)
+        else:
+            gb = ratio * g / 2.3548
+            lb = (1.0 - ratio) * g / 2.0
+            z = ((x - pos) + 1.0j * lb) * 2**-0.5 / gb
+            w = wofz(z)
+            # derivative of the Faddeeva function
+            dw = -2.0 * z * w + 2.0j / np.pi**0.5
+            c = (2.0 * np.pi) ** -0.5 * dx
+            dfampl = w.real * c / gb
+            dfpos = -ampl * c * (dw * 2**-0.5).real / gb**2
+            dflb = ampl * c * (dw * 1.0j * 2**-0.5).real / gb**2
+            dfgb = -ampl * c * (w.real + (dw * z).real) / gb**2
+            dfdg = dflb * (1.0 - ratio) / 2.0 + dfgb * ratio / 2.3548
+            dfratio = -dflb * g / 2.0 + dfgb * g / 2.3548
+
+        return np.array(
+            [
+                dfampl,
+                dfpos + dfdg * dg[1],
+                dfdg * dg[0],
+                dfratio,
+                dfdg * dg[2],
+            ]
+        )
+
 
 # ======================================================================================
 # Sigmoid Model
@@ -323,6 +417,13 @@ class sigmoidmodel:
         w = 1.0 / (1.0 + np.exp(asym * (x - pos) / ampl))
         return ampl * w
 
+    def jacobian(self, x, ampl, pos, asym):
+        """Return the derivatives of `f` with respect to each parameter."""
+        u = asym * (x - pos) / ampl
+        w = 1.0 / (1.0 + np.exp(u))
+        dw = w * (1.0 - w)
+        return np.array([w + dw * u, asym * dw, -(x - pos) * dw])
+
 
 # ======================================================================================
 # User defined model
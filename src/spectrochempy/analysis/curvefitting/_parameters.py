@@ -242,7 +242,7 @@ class FitParameters(UserDict):
                 # With only min defined
                 pei = lob - 1.0 + np.sqrt(item**2 + 1.0)
             else:
-                pei = pi
+                pei = item
             pe.append(pei)
 
         if len(pe) == 1:
@@ -252,6 +252,41 @@ class FitParameters(UserDict):
 
         return pe
 
+    # ----------------------------------------------------------------------------------
+    def external_derivative(self, key, pi):
+        """
+        Return the derivative of the external value with respect to the internal one.
+
+        Parameters
+        ----------
+        key : str
+            Name of the parameter.
+        pi : float
+            Internal value of the parameter.
+
+        Returns
+        -------
+        float
+            Derivative of the value returned by `to_external` at `pi` .
+        """
+        key = str(key)
+        if key not in self.data:
+            raise KeyError(f"parameter `{key}` is not found")
+
+        lob = self.lob[key]
+        upb = self.upb[key]
+
+        is_lob = lob is not None and lob > -0.1 / sys.float_info.epsilon
+        is_upb = lob is not None and upb < +0.1 / sys.float_info.epsilon
+
+        if is_lob and is_upb:
+            return ((upb - lob) / 2.0) * np.cos(pi)
+        if is_upb:
+            return -pi / np.sqrt(pi**2 + 1.0)
+        if is_lob:
+            return pi / np.sqrt(pi**2 + 1.0)
+        return 1.0
+
     def copy(self):
         import copy as cpy
 
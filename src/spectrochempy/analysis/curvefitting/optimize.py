@@ -6,9 +6,10 @@
 __all__ = ["Optimize"]
 __configurables__ = __all__
 
+import functools
 import inspect
-import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import traitlets as tr
@@ -20,9 +21,12 @@ from spectrochempy.analysis.curvefitting import _models as models_
 from spectrochempy.analysis.curvefitting._parameters import FitParameters
 from spectrochempy.application.application import info_
 from spectrochempy.application.application import warning_
+from spectrochempy.core.dataset.nddataset import NDDataset
 from spectrochempy.extern.traittypes import Array
 from spectrochempy.utils.decorators import signature_has_configurable_traits
 from spectrochempy.utils.docutils import docprocess
+from spectrochempy.utils.exceptions import NotFittedError
+from spectrochempy.utils.system import get_n_workers
 
 
 # ======================================================================================
@@ -32,7 +36,9 @@ class Optimize(DecompositionAnalysis):
         """
     Non-linear Least-Square Optimization and Curve-Fitting.
 
-    Works on a 1D or 2D dataset.
+    Works on a 1D or 2D dataset. The rows of a 2D dataset are fitted one by one with
+    the same script, and the parameters obtained for each row are given by
+    `fit_parameters` .
 
     # TODO: complete this description
 
@@ -98,12 +104,42 @@ class Optimize(DecompositionAnalysis):
         help="Initial amplitude setting mode.",
     ).tag(config=True)
 
+    use_jacobian = tr.Bool(
+        default_value=True,
+        help="Whether to pass the analytic jacobian of the models to the "
+        "`least_squares` solver. It is used only if all models provide a "
+        "jacobian, otherwise it is estimated by finite differences.",
+    ).tag(config=True)
+
+    row_warm_start = tr.Bool(
+        default_value=True,
+        help="For 2D datasets, whose rows are fitted one by one, whether the fit of "
+        "each row starts from the parameters fitted for the previous row. If "
+        "`False` , all rows start from the parameters of the script.",
+    ).tag(config=True)
+
+    workers = tr.Integer(
+        default_value=None,
+        allow_none=True,
+        help="Number of processes used to fit the rows of 2D datasets. The rows are "
+        "split into contiguous blocks fitted in parallel (with `row_warm_start` , the "
+        "first row of each block starts from the parameters of the script). If "
+        "`None` or 1, the rows are fitted sequentially. -1 means using all the "
+        "available processors.",
+    ).tag(config=True)
+
     # ----------------------------------------------------------------------------------
     # Runtime Parameters (in addition to those of AnalysisConfigurable)
     # ----------------------------------------------------------------------------------
     usermodels = tr.Dict(default_value={}, help="User defined models.")
     fp = tr.Instance(FitParameters, allow_none=True)
     modeldata = tr.List(Array())
+    _keys = tr.List(help="Names of the fitted parameters.")
+    _values = Array(help="Values of the fitted parameters for each row.")
+    _plan = tr.Any(
+        allow_none=True,
+        help="Evaluation plan of the models, compiled from the fit parameters.",
+    )
 
     # ----------------------------------------------------------------------------------
     # Initialization
@@ -145,12 +181,11 @@ class Optimize(DecompositionAnalysis):
         # sequence = kargs.get('sequence', 'ideal_pulse')
         # self.sequence = PulseSequence(type=sequence)
 
-        # for now, we only work with 1D data
-        if X.ndim > 1 and all(np.array(X.shape) > 1):
-            raise NotImplementedError("Only 1D data are supported for now")
+        # 2D data are fitted row by row
+        X = np.atleast_2d(X)
 
         # create model data
-        modeldata, modelnames, model_A, model_a, model_b = self._get_modeldata(X)
+        modeldata, modelnames, model_A, model_a, model_b = self._get_modeldata(X[0])
 
         global niter, everyiter, ncalls, chi2
         ncalls = 0
@@ -231,6 +266,10 @@ class Optimize(DecompositionAnalysis):
 
             return data - mdata
 
+        def fun_jacobian(params, X):
+            # jacobian of the residuals
+            return -self._get_jacobian(X)
+
         def fun_chi2(params, X):  # , *constraints):
             """Return sum((y - x)**2)."""
             global chi2
@@ -263,19 +302,68 @@ class Optimize(DecompositionAnalysis):
             else fun_residuals
         )
 
-        if not self.dry:
-            fp, fopt = _optimize(
-                func,
-                fp,
-                args=(X,),
-                maxfun=self.max_fun_calls,
-                maxiter=self.max_iter,
-                method=self.method,
-                constraints=self.constraints,
-                callback=callback,
+        jac = None
+        if (
+            self.use_jacobian
+            and self._plan.has_jacobian
+            and self.method in ["leastsq", "least_squares"]
+        ):
+            jac = fun_jacobian
+
+        workers = get_n_workers(self.workers)
+        if workers > 1 and X.shape[0] > 1 and not self.dry:
+            # blocks of rows are fitted in separate processes
+            blocks = np.array_split(np.arange(X.shape[0]), min(workers, X.shape[0]))
+            Xrows = self.X[~self._get_masked_rc(self._X_mask)[0]]
+            config = dict(self.params(), workers=None)
+            with ProcessPoolExecutor(max_workers=len(blocks)) as executor:
+                futures = [
+                    executor.submit(
+                        _fit_block,
+                        config,
+                        self.usermodels,
+                        Xrows[block[0] : block[-1] + 1],
+                    )
+                    for block in blocks
+                ]
+                results = [future.result() for future in futures]
+            total, A, a, b, values = (
+                np.concatenate(item) for item in zip(*results, strict=True)
             )
 
-        # replace the previous script with new fp parameters
+        else:
+            # starting values, restored for each row if there is no warm start
+            start = dict(fp.data)
+            total = np.zeros(X.shape)
+            A, a, b = np.zeros((3, X.shape[0]))
+            values = np.zeros((X.shape[0], len(self._plan.keys)))
+            for i, row in enumerate(X):
+                if not self.row_warm_start:
+                    fp.data.update(start)
+                if not self.dry:
+                    fp, fopt = _optimize(
+                        func,
+                        fp,
+                        args=(row,),
+                        maxfun=self.max_fun_calls,
+                        maxiter=self.max_iter,
+                        method=self.method,
+                        constraints=self.constraints,
+                        callback=callback,
+                        jac=jac,
+                    )
+                modeldata, _, A[i], a[i], b[i] = self._get_modeldata(row)
+                total[i] = modeldata[-1]
+                values[i] = self._plan.values(fp)
+
+        # parameters of all rows
+        self._keys = list(self._plan.keys)
+        self._values = values
+
+        # replace the previous script with new fp parameters (those of the last row)
+        for key, value in zip(self._plan.keys, values[-1], strict=True):
+            if not fp.reference[key]:
+                fp.data[key] = value
         self.script = str(fp)
 
         # log.info the results
@@ -291,19 +379,16 @@ class Optimize(DecompositionAnalysis):
         # reset dry and continue to show starting model
         self.dry = False
 
-        # return fit results
-        modeldata, names, A, a, b = self._get_modeldata(X)
-        if X.squeeze().ndim == 1:
-            # C in this case is just the A for all species
-            # (not very useful here but it will be necessary for 2D
-            C = np.ones((1, self._n_components)) * A  # TODO: check this
-            # we eventually add baseline to the components
-            start = 0 if self.autobase else 1
-            components = modeldata[start:-1]
-            total = modeldata[-1]
-        else:
-            # todo
-            raise NotImplementedError("Fit not implemented for nD data yet!")
+        # return fit results (the components are those of the last row)
+        modeldata, names, A[-1], a[-1], b[-1] = self._get_modeldata(X[-1])
+        total[-1] = modeldata[-1]
+        # C in this case is just the A for all species
+        C = np.ones((X.shape[0], self._n_components)) * A[:, np.newaxis]
+        # we eventually add baseline to the components
+        start = 0 if self.autobase else 1
+        components = modeldata[start:-1]
+        if X.shape[0] == 1:
+            return C, components, total[0], A[0], a[0], b[0]
         return C, components, total, A, a, b
 
     # ----------------------------------------------------------------------------------
@@ -331,6 +416,11 @@ class Optimize(DecompositionAnalysis):
             newdict[key.lower()] = usermodel
         return newdict
 
+    @tr.observe("fp", "usermodels")
+    def _fp_or_usermodels_changed(self, change):
+        # the evaluation plan must be compiled again
+        self._plan = None
+
     @tr.validate("script")
     def _script_validate(self, proposal):
         script = proposal.value
@@ -503,8 +593,9 @@ class Optimize(DecompositionAnalysis):
         # exp_idx is not used for the moment, but will be necessary for multidataset
         # fitting
 
-        # Prepare parameters
-        parameters = self._prepare(self.fp, exp_idx)
+        # The evaluation plan of the models is compiled once for a given script
+        if self._plan is None:
+            self._plan = _EvaluationPlan(self.fp, self.usermodels)
 
         # Get the list of models
         models = self.fp.models
@@ -527,7 +618,7 @@ class Optimize(DecompositionAnalysis):
         axis, dim = self._X.get_axis(-1)
         _xaxis = self._X_coordset[dim].data
 
-        x = _xaxis
+        x = np.array(_xaxis, dtype=np.float64)
         modeldata = np.zeros((nbmodels + 2, x.size), dtype=np.float64)
 
         if nbmodels < 1:
@@ -542,14 +633,7 @@ class Optimize(DecompositionAnalysis):
             "baseline",
         ]
 
-        for model in models:
-            calc = getmodel(
-                x,
-                modelname=model,
-                par=parameters,
-                amplitude_mode=self.amplitude_mode,
-                usermodels=self.usermodels,
-            )
+        for model, calc in self._plan.evaluate(x, self.fp, self.amplitude_mode):
             if not model.startswith("baseline"):
                 row += 1
                 modeldata[row] = calc
@@ -588,51 +672,49 @@ class Optimize(DecompositionAnalysis):
         # return modeldata
         return modeldata, names, A, a, b
 
-    @staticmethod
-    def _parsing(expr, param):
-        keyword = r"\b([a-z]+[0-9]*)\b"  # match a whole word
-        pat = re.compile(keyword)
-        mo = pat.findall(str(expr))
-        for kw in mo:
-            if kw in param:
-                expr = expr.replace(kw, str(param[kw]))
-            elif kw in np.__dict__:  # check if it is a recognized math function
-                expr = expr.replace(kw, f"np.{kw}")
-        return expr
-
-    def _prepare(self, param, exp_idx=1):
-        # This function is needed for the script related to modelfunction
-        #
-        # exp_idx: int, contains the index of the experiment
-
-        new_param = param.copy()
-
-        for key in param:
-            if param.reference[key]:
-                new_param.reference[key] = False
-                # important to put it here
-                # before other instruction
-                # try to interpret the given refpar expression
-                refpar = param[key]
-                while True:
-                    par = self._parsing(refpar, new_param)
-                    if par == refpar:
-                        break
-                    refpar = par
-                try:
-                    new_param[key] = eval(str(refpar))  # noqa: S307
-                except Exception as err:
-                    raise ValueError(
-                        f"Cannot evaluate the expression {key}: {param[refpar]}",
-                    ) from err
+    def _get_jacobian(self, X):
+        # Derivatives of the model sum (modeldata[-1]) with respect to the
+        # parameters, in the order of the plan keys. The shape of the returned array
+        # is (size of the unmasked data, number of parameters).
+        if self._plan is None:
+            self._plan = _EvaluationPlan(self.fp, self.usermodels)
 
-                new_param.fixed[key] = True
-                new_param.reference[key] = True  # restore it for the next call
+        expedata = X.real.squeeze()
+        if expedata.ndim > 1:
+            # nD data
+            raise NotImplementedError("Fit not implemented for nD data yet!")
 
-            # if isinstance(new_param[key], list):
-            #     new_param.data[key] = new_param.data[key][exp_idx]
+        axis, dim = self._X.get_axis(-1)
+        x = np.array(self._X_coordset[dim].data, dtype=np.float64)
 
-        return new_param
+        total, jac = self._plan.jacobian(x, self.fp, self.amplitude_mode)
+        jac = jac.T
+
+        # remove masked column
+        if np.any(self._X_mask):
+            masked_columns = np.all(self._X_mask, axis=-2)
+            total = total[~masked_columns]
+            jac = jac[~masked_columns]
+            x = x[~masked_columns]
+
+        if not self.autobase:
+            return jac
+
+        # The amplitude A and the baseline a*x + b minimize the residuals for each set
+        # of parameters. Differentiating the normal equations gives their
+        # derivatives, with M = [total, x, 1], theta = (A, a, b) and G = M^T.M:
+        # G.dtheta = [dtotal^T.r, 0, 0] - A.M^T.dtotal, where r = data - M.theta
+        A, a, b = self._ampbas(x, expedata, total)
+        M = np.stack([total, x, np.ones_like(x)], axis=1)
+        r = expedata - M @ np.array([A, a, b])
+        rhs = -A * (M.T @ jac)
+        rhs[0] += r @ jac
+        try:
+            dtheta = np.linalg.solve(M.T @ M, rhs)
+        except np.linalg.LinAlgError:  # pragma: no cover
+            # same as in _ampbas when the model is zero
+            return np.zeros_like(jac)
+        return A * jac + M @ dtheta
 
     # ==================================================================================
     # automatic calculation of amplitude and baseline
@@ -926,6 +1008,33 @@ class Optimize(DecompositionAnalysis):
     # ----------------------------------------------------------------------------------
     # Public methods/properties
     # ----------------------------------------------------------------------------------
+    @property
+    def fit_parameters(self):
+        """
+        Fitted parameters for each row of the dataset (`dict` of `NDDataset` ).
+
+        The dictionary is indexed by the parameter names. Each `NDDataset` holds the
+        values of a parameter (including the fixed ones and those defined by
+        references) for all the rows, with the y coordinate of the fitted dataset.
+        """
+        if not self._fitted:
+            raise NotFittedError("fit_parameters")
+
+        dim = self._X.dims[0]
+        coord = None
+        if self._X_coordset is not None and self._X_coordset[dim] is not None:
+            coord = self._X_coordset[dim].copy()
+
+        parameters = {}
+        for key, values in zip(self._keys, self._values.T, strict=True):
+            param = NDDataset(values, name=key, title=key)
+            param.dims = [dim]
+            param = self._restore_masked_data(param, axis=0)
+            param.set_coordset({dim: coord})
+            param.history = f"Created using method {self.name}.fit"
+            parameters[key] = param
+        return parameters
+
     @docprocess.dedent
     def fit(self, X):
         """
@@ -947,6 +1056,26 @@ class Optimize(DecompositionAnalysis):
         return super().fit(X, Y=None)
 
 
+# ======================================================================================
+def _fit_block(config, usermodels, X):
+    # Fit the rows of a block of a 2D dataset (in a separate process)
+    config = dict(config)
+    script = config.pop("script")
+    fitter = Optimize(**config)
+    # the user models must be known before the script is parsed
+    fitter.usermodels = usermodels
+    fitter.script = script
+    fitter.fit(X)
+    _, _, total, A, a, b = fitter._outfit
+    return (
+        np.atleast_2d(total),
+        np.atleast_1d(A),
+        np.atleast_1d(a),
+        np.atleast_1d(b),
+        fitter._values,
+    )
+
+
 # ======================================================================================
 def _optimize(
     func,
@@ -959,6 +1088,7 @@ def _optimize(
     ftol=1e-8,
     xtol=1e-8,
     callback=None,
+    jac=None,
 ):
     if constraints is None:
         constraints = {}
@@ -989,6 +1119,15 @@ def _optimize(
         fp = restore_external(fp, p, keys)
         return func(fp, dat, *args)
 
+    def internal_jac(p, dat, fp, keys, *args):
+        # jac returns the derivatives with respect to all the external parameters of
+        # fp: select those which are optimized and apply the bounds transformation
+        fp = restore_external(fp, p, keys)
+        J = jac(fp, dat, *args)[:, columns]
+        return J * [
+            fp.external_derivative(key, pi) for key, pi in zip(keys, p, strict=True)
+        ]
+
     def internal_callback(*args):
         if callback is None:
             return None
@@ -1026,10 +1165,19 @@ def _optimize(
     if method in ["leastsq", "least_squares"]:
         method = "lm" if len(fp0) < 10 else "trf"
 
+    # columns of the jacobian corresponding to the internal parameters (parameters
+    # of multiple experiments are not handled)
+    fpkeys = list(fp0.keys())
+    if jac is not None and all(key in fpkeys for key in keys):
+        columns = [fpkeys.index(key) for key in keys]
+    else:
+        jac = None
+
     if method.lower() in ["lm", "trf"]:
         result = optimize.least_squares(
             internal_func,
             par,
+            jac=internal_jac if jac is not None else "2-point",
             args=tuple(args),
             method=method.lower(),
         )
@@ -1127,22 +1275,8 @@ def getmodel(
         Array containing the calculated model.
 
     """
-    model = par.model[modelname]
-    try:
-        modelcls = getattr(models_, model)
-    except AttributeError:
-        if usermodels is not None:
-            try:
-                modelcls = usermodels[model]
-            except KeyError as e:
-                raise ValueError(
-                    f"Model {model} not found in spectrochempy nor in usermodels.",
-                ) from e
-        else:
-            raise ValueError(f"Model {model} not found in spectrochempy.") from None
-
     # take an instance of the model
-    a = modelcls()
+    a = _get_model_class(par.model[modelname], usermodels)()
 
     # get the parameters for the given model
     args = []
@@ -1170,3 +1304,247 @@ def getmodel(
         ampl = args[0]
         val = ampl * val / val.max()
     return val
+
+
+def _get_model_class(model, usermodels=None):
+    # return the class of a model given its name
+    try:
+        return getattr(models_, model)
+    except AttributeError:
+        if usermodels is not None:
+            try:
+                return usermodels[model]
+            except KeyError as e:
+                raise ValueError(
+                    f"Model {model} not found in spectrochempy nor in usermodels.",
+                ) from e
+        else:
+            raise ValueError(f"Model {model} not found in spectrochempy.") from None
+
+
+# step of the central differences used to differentiate the reference expressions
+_EPS3 = np.finfo(np.float64).eps ** (1.0 / 3.0)
+
+
+class _EvaluationPlan:
+    """
+    Evaluation plan of the models defined in a `FitParameters` object.
+
+    The reference expressions are compiled once, and the arguments of each model
+    are given by an array of indexes in the vector of parameter values, so that the
+    evaluation of the models for new parameter values requires no parsing and no
+    lookup by name.
+
+    Parameters
+    ----------
+    fp : `FitParameters`
+        The parameters (structure and references) of the models.
+    usermodels : dict, optional
+        User defined models.
+    """
+
+    def __init__(self, fp, usermodels=None):
+        self.keys = list(fp.keys())
+        index = {key: i for i, key in enumerate(self.keys)}
+
+        # parameters whose values are taken from fp
+        self.free = [key for key in self.keys if not fp.reference[key]]
+        self.free_index = np.array([index[key] for key in self.free], dtype=int)
+
+        # compiled reference expressions, sorted such that each expression is
+        # evaluated after the references it depends on
+        self.references = []
+        done = set()
+
+        def _compile(key, stack=()):
+            if key in done:
+                return
+            if key in stack:
+                raise ValueError(f"Circular reference in the expression of {key}")
+            expr = fp[key]
+            try:
+                code = compile(str(expr), f"<{key}>", "eval")
+            except SyntaxError as err:
+                raise ValueError(
+                    f"Cannot evaluate the expression {key}: {expr}"
+                ) from err
+            names = []
+            for name in code.co_names:
+                if name in index:
+                    if fp.reference[name]:
+                        _compile(name, (*stack, key))
+                    names.append((name, index[name]))
+            self.references.append((index[key], key, expr, code, names))
+            done.add(key)
+
+        for key in self.keys:
+            if fp.reference[key]:
+                _compile(key)
+
+        # models: (name, function, arguments indexes, number of padding zeros)
+        self.models = []
+        # analytic jacobians of the models (None if not provided by the model)
+        self.jacobians = []
+        for modelname in fp.models:
+            instance = _get_model_class(fp.model[modelname], usermodels)()
+            argindex = []
+            for p in instance.args:
+                key = f"{p.lower()}_{modelname}"
+                if key in index:
+                    argindex.append(index[key])
+                elif not p.startswith("c_"):
+                    # c_ parameters are omitted for polynomials of limited degree
+                    raise ValueError(f"parameter `{key}` is not found")
+            func = getattr(type(instance).f, "__wrapped__", None)
+            if func is not None:
+                # call directly the function decorated by `make_units_compatibility`
+                # as the plan works with arrays of floats without units (the missing
+                # arguments are set to zero by the decorator)
+                func = functools.partial(func, instance)
+                npad = len(instance.args) - len(argindex)
+            else:
+                func = instance.f
+                npad = 0
+            self.models.append((modelname, func, np.array(argindex, dtype=int), npad))
+            self.jacobians.append(getattr(instance, "jacobian", None))
+        self.has_jacobian = all(jac is not None for jac in self.jacobians)
+
+        # namespace for the evaluation of the expressions
+        self.globals = {
+            "np": np,
+            **{k: v for k, v in np.__dict__.items() if k[0] != "_"},
+        }
+
+    def values(self, fp):
+        """
+        Return the vector of the values of all parameters.
+
+        Parameters
+        ----------
+        fp : `FitParameters`
+            The parameters with their current values.
+
+        Returns
+        -------
+        `~numpy.ndarray`
+            The values of the parameters, including those defined by references.
+        """
+        values = np.empty(len(self.keys))
+        data = fp.data
+        values[self.free_index] = [data[key] for key in self.free]
+        for i, key, expr, code, names in self.references:
+            try:
+                values[i] = eval(  # noqa: S307
+                    code, self.globals, {name: values[j] for name, j in names}
+                )
+            except Exception as err:
+                raise ValueError(
+                    f"Cannot evaluate the expression {key}: {expr}"
+                ) from err
+        return values
+
+    def evaluate(self, x, fp, amplitude_mode="height"):
+        """
+        Evaluate all models.
+
+        Parameters
+        ----------
+        x : `~numpy.ndarray`
+            Array of float where to evaluate the models.
+        fp : `FitParameters`
+            The parameters with their current values.
+        amplitude_mode : str, optional, default: 'height'
+            Select the amplitude mode calculation. Can be 'height' or 'area'.
+
+        Returns
+        -------
+        list of tuple
+            The name of each model with its calculated values.
+        """
+        values = self.values(fp)
+        height = amplitude_mode.lower() == "height"
+        result = []
+        for modelname, func, argindex, npad in self.models:
+            args = values[argindex]
+            val = func(x, *args, *([0] * npad))
+            if height:
+                # in this case ampl parameter is the height, so we need to rescale
+                # calc
+                val = args[0] * val / val.max()
+            result.append((modelname, val))
+        return result
+
+    def jacobian(self, x, fp, amplitude_mode="height"):
+        """
+        Return the sum of all models and its derivatives.
+
+        The derivatives with respect to the parameters defined by references are
+        propagated to the parameters they depend on.
+
+        Parameters
+        ----------
+        x : `~numpy.ndarray`
+            Array of float where to evaluate the models.
+        fp : `FitParameters`
+            The parameters with their current values.
+        amplitude_mode : str, optional, default: 'height'
+            Select the amplitude mode calculation. Can be 'height' or 'area'.
+
+        Returns
+        -------
+        total : `~numpy.ndarray`
+            The sum of all models.
+        jac : `~numpy.ndarray`
+            The derivatives of `total` with respect to each parameter (in the order
+            of `keys` ), with shape (number of parameters, size of `x` ). Rows
+            corresponding to parameters defined by references are zero.
+        """
+        if not self.has_jacobian:
+            raise NotImplementedError("Some models do not provide a jacobian")
+
+        values = self.values(fp)
+        height = amplitude_mode.lower() == "height"
+        total = np.zeros(x.size)
+        jac = np.zeros((len(self.keys), x.size))
+        for (_, func, argindex, npad), jacfunc in zip(
+            self.models, self.jacobians, strict=True
+        ):
+            args = values[argindex]
+            zeros = [0] * npad
+            val = func(x, *args, *zeros)
+            dval = jacfunc(x, *args, *zeros)[: argindex.size]
+            if height:
+                # derivatives of args[0] * val / val[k], where k is the position of
+                # the maximum of val
+                k = np.argmax(val)
+                dval = args[0] * (
+                    dval / val[k] - np.outer(dval[:, k], val) / val[k] ** 2
+                )
+                val = val / val[k]
+                dval[0] += val
+                val = args[0] * val
+            total += val
+            np.add.at(jac, argindex, dval)
+
+        # chain rule for the references, starting with the last ones evaluated, i.e.
+        # those on which no other reference depends
+        for i, key, expr, code, names in reversed(self.references):
+            if not names or not np.any(jac[i]):
+                continue
+            local = {name: values[j] for name, j in names}
+            for name, j in names:
+                # the expressions are usually linear: a central difference is exact
+                h = _EPS3 * max(1.0, abs(local[name]))
+                try:
+                    local[name] = values[j] + h
+                    up = eval(code, self.globals, local)  # noqa: S307
+                    local[name] = values[j] - h
+                    down = eval(code, self.globals, local)  # noqa: S307
+                except Exception as err:
+                    raise ValueError(
+                        f"Cannot evaluate the expression {key}: {expr}"
+                    ) from err
+                local[name] = values[j]
+                jac[j] += jac[i] * (up - down) / (2.0 * h)
+            jac[i] = 0.0
+        return total, jac
@@ -78,6 +78,16 @@ class EFA(DecompositionAnalysis):
         help="Number of components to keep.",
     ).tag(config=True)
 
+    max_components = tr.Int(
+        allow_none=True,
+        default_value=None,
+        help="Number of eigenvalues computed in the forward and backward analyses. "
+        "If `None` , all the eigenvalues are computed. Otherwise, the eigenvalues are "
+        "computed by a truncated incremental decomposition, which is much faster for "
+        "datasets with many columns, but underestimates the eigenvalues close to the "
+        "noise level. It should be larger than the expected number of components.",
+    ).tag(config=True)
+
     # ----------------------------------------------------------------------------------
     # Initialization
     # ----------------------------------------------------------------------------------
@@ -108,33 +118,19 @@ class EFA(DecompositionAnalysis):
         # max number of components
         M, N = X.shape
         K = min(M, N)
+        if self.max_components is not None:
+            K = min(K, self.max_components)
 
-        percent_done_list = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
         # ------------------------------------------------------------------------------
         # forward analysis
         # ------------------------------------------------------------------------------
-        f = np.zeros((M, K))
-        for i in range(M):
-            s = np.linalg.svd(X[: i + 1], compute_uv=False)
-            k = s.size
-            f[i, :k] = s**2
-            percent_done = int(i / (2 * M) * 100)
-            if percent_done in percent_done_list:
-                info_(f"Evolving Factor Analysis: {percent_done}% \r")
-                del percent_done_list[0]
+        f = _evolving_eigenvalues(X, K, progress=0)
         # ------------------------------------------------------------------------------
         # backward analysis
         # ------------------------------------------------------------------------------
-        b = np.zeros((M, K))
-        for i in range(M - 1, -1, -1):
-            # if some rows are masked, we must skip them
-            s = np.linalg.svd(X[i:M], compute_uv=False)
-            k = s.size
-            b[i, :k] = s**2
-            percent_done = int(100 - i / (2 * M) * 100)
-            if percent_done in percent_done_list:
-                info_(f"Evolving Factor Analysis: {percent_done} % \r")
-                del percent_done_list[0]
+        # the eigenvalues for X[i:M] are those of the forward analysis of the reversed
+        # dataset
+        b = _evolving_eigenvalues(X[::-1], K, progress=50)[::-1]
 
         # store the components number (real or desired)
         self._n_components = K
@@ -232,3 +228,45 @@ class EFA(DecompositionAnalysis):
         if self.cutoff is not None:
             b = np.max((b, np.ones_like(b) * self.cutoff), axis=0)
         return b
+
+
+# ======================================================================================
+# Utility functions
+# ======================================================================================
+def _evolving_eigenvalues(X, n, progress=0):
+    # Return the n largest eigenvalues of X[:i+1].T @ X[:i+1] (i.e. the squared
+    # singular values of X[:i+1]) for all rows i of X, as an array of shape (M, n).
+    #
+    # Instead of computing the SVD of each X[:i+1], the eigendecomposition
+    # G = V diag(lam) V.T of the Gram matrix is updated for each new row x, as in the
+    # incremental SVD: G + x x.T = [V, p] (diag(lam, 0) + w w.T) [V, p].T where
+    # w = (V.T x, |p|) and p is the normalized part of x orthogonal to V. Only an
+    # eigendecomposition of size (r+1) is needed, with r the current rank.
+    # The decomposition is exact as long as it is not truncated to n < rank.
+    M, N = X.shape
+    ev = np.zeros((M, n))
+    V = np.zeros((N, 0))
+    lam = np.zeros(0)
+    percent_done_list = list(range(progress + 10, progress + 60, 10))
+    for i, x in enumerate(X):
+        z = V.T @ x
+        p = x - V @ z
+        # reorthogonalize to preserve the orthogonality of V
+        dz = V.T @ p
+        p -= V @ dz
+        z += dz
+        rho = np.linalg.norm(p)
+        if V.shape[1] < N and rho > 1.0e-10 * np.linalg.norm(x):
+            V = np.column_stack((V, p / rho))
+            z = np.append(z, rho)
+            lam = np.append(lam, 0.0)
+        lam, Q = np.linalg.eigh(np.diag(lam) + np.outer(z, z))
+        # eigenvalues in decreasing order, truncated to n
+        lam = lam[::-1][:n]
+        V = V @ Q[:, ::-1][:, :n]
+        ev[i, : lam.size] = np.maximum(lam, 0.0)
+        percent_done = progress + int((i + 1) / (2 * M) * 100)
+        if percent_done_list and percent_done >= percent_done_list[0]:
+            info_(f"Evolving Factor Analysis: {percent_done}% \r")
+            del percent_done_list[0]
+    return ev
@@ -10,6 +10,9 @@ __configurables__ = ["IRIS"]
 
 # from collections.abc import Iterable
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 import numpy as np
 
 # QP solvers import
@@ -32,6 +35,7 @@ from spectrochempy.utils.decorators import signature_has_configurable_traits
 from spectrochempy.utils.docutils import docprocess
 from spectrochempy.utils.objects import ScpObjectList
 from spectrochempy.utils.optional import import_optional_dependency
+from spectrochempy.utils.system import get_n_workers
 from spectrochempy.utils.traits import CoordType
 from spectrochempy.utils.traits import NDDatasetType
 
@@ -392,6 +396,15 @@ class IRIS(DecompositionAnalysis):
         "Note that quadprog is not installed with spectrochempy.",
     ).tag(config=True)
 
+    workers = tr.Integer(
+        default_value=None,
+        allow_none=True,
+        help="Number of processes used to solve the problems for the different "
+        "regularization parameters given by `reg_par` , which are independent. If "
+        "`None` or 1, they are solved sequentially. -1 means using all the available "
+        "processors.",
+    ).tag(config=True)
+
     reg_par = tr.List(
         minlen=2,
         maxlen=3,
@@ -527,110 +540,31 @@ class IRIS(DecompositionAnalysis):
 
         else:  # regularization
             # some matrices used for QP optimization do not depend on lambdaR
-            # and are computed here.
-
-            if self.qpsolver == "osqp":
-                # The standard form used by osqp() is
-                # minimize (1/2) xT P x + qT x ; subject to: lo <= A x <= u
-                # The first part of the P matrix is independent of lambda:
-                #     P = P0 + 2 * lambdaR S
-                P0 = 2 * np.dot(K.T, K)
-                q = -2 * np.dot(X.T, K)
-                A = sparse.csc_matrix(np.eye(M))
-                lo = np.zeros(M)
-                up = np.ones(M) * np.inf
-            else:
-                # The standard form used by quadprog() was
-                # minimize (1/2) xT P x - qT x ; subject to: A.T x >= b
-                # The first part of the G matrix is independent of lambda:
-                #     P = P0 + 2 * lambdaR S
-
-                P0 = 2 * np.dot(K.T, K)
-                q = 2 * np.dot(X.T, K)
-                A = np.eye(M)
-                b = np.zeros(M)
-
-            # --------------------------------------------------------------------------
-            def solve_for_lambda(X, K, P0, lamda, S):
-                """
-                QP optimization.
-
-                Parameters
-                ----------
-                X: NDDataset of experimental spectra
-                K: NDDataset, kernel dataset
-                P0: the lambda independent part of P
-                lamda: regularization parameter
-                S: penalty function (sharpness)
-                verbose: print info
-
-                Returns
-                -------
-                f, RSS and SM for a given regularization parameter
-
-                """
-                M, N, _ = K.shape[-1], X.shape[-1], X.shape[0]
-                fi = np.zeros((M, N))
-                channels = self._channels
-
-                if self.qpsolver == "osqp":
-                    for j in range(len(channels.data)):
-                        P = sparse.csc_matrix(P0 + 2 * lamda * S)
-                        qprob = osqp.OSQP()
-                        if osqp.__version__ < "1.0.0":
-                            qprob.setup(
-                                P, q[j].squeeze(), A, lo, alpha=1.0, verbose=False
-                            )
-                            warning_(
-                                f"The version of 'osqp' is outdated ({osqp.__version__}). "
-                                f"Please update osqp to version '1.0.1' or later. Spectrochempy "
-                                f"will not support this version in the future (scpy > 0.9)"
+            # and are computed here: P = P0 + 2 * lambdaR S and XtK (see
+            # _solve_for_lambda).
+            P0 = 2 * np.dot(K.T, K)
+            XtK = np.dot(X.T, K)
+            channels = self._channels
+            qp = (X, K, P0, XtK, S, self.qpsolver, channels.data, channels.units)
+
+            workers = get_n_workers(self.workers)
+
+            def solve_for_lambdas(lambdas):
+                # solve for several lambdas, in parallel if workers > 1
+                solve = partial(_solve_for_lambda, qp)
+                if workers > 1 and len(lambdas) > 1:
+                    n = min(workers, len(lambdas))
+                    with ProcessPoolExecutor(max_workers=n) as executor:
+                        results = list(
+                            executor.map(
+                                solve, lambdas, chunksize=-(-len(lambdas) // n)
                             )
-                        else:
-                            qprob.setup(
-                                P, q[j].squeeze(), A, lo, up, alpha=1.0, verbose=False
-                            )
-
-                        fi[:, j] = qprob.solve().x
-
-                else:  # quadprog solver
-                    for j, channel in enumerate(channels.data):
-                        try:
-                            P = P0 + 2 * lamda * S
-                            fi[:, j] = quadprog.solve_qp(P, q[j].squeeze(), A, b)[0]
-
-                        except ValueError:  # pragma: no cover
-                            msg = (
-                                f"Warning:P is not positive definite for log10(lambda)="
-                                f"{np.log10(lamda):.2f} at {channel:.2f} "
-                                f"{channels.units}, find nearest PD matrix"
-                            )
-                            warning_(msg)
-                            try:
-                                P = _nearestPD(P0 + 2 * lamda * S, 0)
-                                fi[:, j] = quadprog.solve_qp(P, q[j].squeeze(), A, b)[0]
-
-                            except ValueError:
-                                msg = (
-                                    "... P matrix is still ill-conditioned, "
-                                    "try with a small shift of diagonal elements..."
-                                )
-                                warning_(msg)
-                                P = _nearestPD(P0 + 2 * lamda * S, 1e-3)
-                                fi[:, j] = quadprog.solve_qp(P, q[j].squeeze(), A, b)[0]
-
-                resi = X.data - np.dot(K.data, fi)
-                RSSi = np.sum(resi**2)
-                SMi = np.linalg.norm(np.dot(np.dot(np.transpose(fi), S), fi))
-
-                msg = (
-                    f"log10(lambda)={np.log10(lamda):.3f} -->  "
-                    f"residuals = {RSSi:.3e}    "
-                    f"regularization constraint  = {SMi:.3e}"
-                )
-                info_(msg)
-
-                return fi, RSSi, SMi
+                        )
+                else:
+                    results = [solve(lamda) for lamda in lambdas]
+                for lamda, (_, RSSi, SMi) in zip(lambdas, results, strict=True):
+                    _log_lambda(lamda, RSSi, SMi)
+                return results
 
             # --------------------------------------------------------------------------
 
@@ -641,8 +575,8 @@ class IRIS(DecompositionAnalysis):
                 )
                 info_(msg)
 
-                for i, lamda_ in enumerate(lambdas):
-                    f[i], RSS[i], SM[i] = solve_for_lambda(X, K, P0, lamda_, S)
+                for i, (fi, RSSi, SMi) in enumerate(solve_for_lambdas(lambdas)):
+                    f[i], RSS[i], SM[i] = fi, RSSi, SMi
 
             else:
                 msg = (
@@ -664,8 +598,8 @@ class IRIS(DecompositionAnalysis):
                 msg = "Initial Log(lambda) values = " + str(x)
                 info_(msg)
 
-                for i, xi in enumerate(x):
-                    f[i], RSS[i], SM[i] = solve_for_lambda(X, K, P0, 10**xi, S)
+                for i, (fi, RSSi, SMi) in enumerate(solve_for_lambdas(lambdas)):
+                    f[i], RSS[i], SM[i] = fi, RSSi, SMi
 
                 Rx = np.copy(RSS)
                 Sy = np.copy(SM)
@@ -688,7 +622,7 @@ class IRIS(DecompositionAnalysis):
                         msg = "New range of Log(lambda) values: " + str(x)
                         info_(msg)
 
-                        f_, Rx[1], Sy[1] = solve_for_lambda(X, K, P0, 10 ** x[1], S)
+                        f_, Rx[1], Sy[1] = solve_for_lambdas([10 ** x[1]])[0]
                         lambdas = np.append(lambdas, np.array(10 ** x[1]))
                         f = np.concatenate((f, np.atleast_3d(f_.T).T))
                         RSS = np.concatenate((RSS, np.array(Rx[1:2])))
@@ -712,7 +646,7 @@ class IRIS(DecompositionAnalysis):
                         x[1] = (x[3] + phi * x[0]) / (1 + phi)
                         msg = "New range (Log lambda): " + str(x)
                         info_(msg)
-                        f_, Rx[1], Sy[1] = solve_for_lambda(X, K, P0, 10 ** x[1], S)
+                        f_, Rx[1], Sy[1] = solve_for_lambdas([10 ** x[1]])[0]
                         f = np.concatenate((f, np.atleast_3d(f_.T).T))
                         lambdas = np.append(lambdas, np.array(10 ** x[1]))
                         RSS = np.concatenate((RSS, np.array(Rx[1:2])))
@@ -729,7 +663,7 @@ class IRIS(DecompositionAnalysis):
                         x[2] = x[0] - (x[1] - x[3])
                         msg = "New range (Log lambda):" + str(x)
                         info_(msg)
-                        f_, Rx[2], Sy[2] = solve_for_lambda(X, K, P0, 10 ** x[2], S)
+                        f_, Rx[2], Sy[2] = solve_for_lambdas([10 ** x[2]])[0]
                         f = np.concatenate((f, np.atleast_3d(f_.T).T))
                         lambdas = np.append(lambdas, np.array(10 ** x[2]))
                         RSS = np.concatenate((RSS, np.array(Rx[1:2])))
@@ -948,6 +882,94 @@ class IRIS(DecompositionAnalysis):
 # Utility private functions
 
 
+def _solve_for_lambda(qp, lamda):
+    """
+    QP optimization for a regularization parameter.
+
+    qp = (X, K, P0, XtK, S, qpsolver, channels, units) where X is the data array, K
+    the kernel array, P0 = 2 K.T K and XtK = X.T K are independent of lambda, S is the
+    penalty function (sharpness) and channels, units are those of the X channels.
+
+    Return f, RSS and SM for the regularization parameter lamda.
+    """
+    X, K, P0, XtK, S, qpsolver, channels, units = qp
+    M, N = K.shape[-1], X.shape[-1]
+    fi = np.zeros((M, N))
+
+    if qpsolver == "osqp":
+        # The standard form used by osqp() is
+        # minimize (1/2) xT P x + qT x ; subject to: lo <= A x <= u
+        # P, and thus the factorization done by setup, is the same for all the
+        # channels: the problem is set up once and only q is updated for each
+        # channel (by default osqp then starts from the solution of the previous
+        # channel)
+        P = sparse.csc_matrix(P0 + 2 * lamda * S)
+        q = -2 * XtK
+        A = sparse.csc_matrix(np.eye(M))
+        lo = np.zeros(M)
+        up = np.ones(M) * np.inf
+        qprob = osqp.OSQP()
+        if osqp.__version__ < "1.0.0":
+            qprob.setup(P, q[0].squeeze(), A, lo, alpha=1.0, verbose=False)
+            warning_(
+                f"The version of 'osqp' is outdated ({osqp.__version__}). "
+                f"Please update osqp to version '1.0.1' or later. Spectrochempy "
+                f"will not support this version in the future (scpy > 0.9)"
+            )
+        else:
+            qprob.setup(P, q[0].squeeze(), A, lo, up, alpha=1.0, verbose=False)
+
+        for j in range(N):
+            if j > 0:
+                qprob.update(q=q[j].squeeze())
+            fi[:, j] = qprob.solve().x
+
+    else:  # quadprog solver
+        # The standard form used by quadprog() was
+        # minimize (1/2) xT P x - qT x ; subject to: A.T x >= b
+        q = 2 * XtK
+        A = np.eye(M)
+        b = np.zeros(M)
+        for j, channel in enumerate(channels):
+            try:
+                P = P0 + 2 * lamda * S
+                fi[:, j] = quadprog.solve_qp(P, q[j].squeeze(), A, b)[0]
+
+            except ValueError:  # pragma: no cover
+                msg = (
+                    f"Warning:P is not positive definite for log10(lambda)="
+                    f"{np.log10(lamda):.2f} at {channel:.2f} "
+                    f"{units}, find nearest PD matrix"
+                )
+                warning_(msg)
+                try:
+                    P = _nearestPD(P0 + 2 * lamda * S, 0)
+                    fi[:, j] = quadprog.solve_qp(P, q[j].squeeze(), A, b)[0]
+
+                except ValueError:
+                    msg = (
+                        "... P matrix is still ill-conditioned, "
+                        "try with a small shift of diagonal elements..."
+                    )
+                    warning_(msg)
+                    P = _nearestPD(P0 + 2 * lamda * S, 1e-3)
+                    fi[:, j] = quadprog.solve_qp(P, q[j].squeeze(), A, b)[0]
+
+    resi = X - np.dot(K, fi)
+    RSSi = np.sum(resi**2)
+    SMi = np.linalg.norm(np.dot(np.dot(np.transpose(fi), S), fi))
+    return fi, RSSi, SMi
+
+
+def _log_lambda(lamda, RSSi, SMi):
+    msg = (
+        f"log10(lambda)={np.log10(lamda):.3f} -->  "
+        f"residuals = {RSSi:.3e}    "
+        f"regularization constraint  = {SMi:.3e}"
+    )
+    info_(msg)
+
+
 def _menger(x, y):
     """
     Return the Menger curvature of a triplet of points.
@@ -15,6 +15,7 @@ __all__ = ["MCRALS"]
 __configurables__ = ["MCRALS"]
 
 import base64
+import bisect
 import logging
 import warnings
 
@@ -97,7 +98,7 @@ class MCRALS(DecompositionAnalysis):
     ).tag(config=True)
 
     solverConc = tr.Enum(
-        ["lstsq", "nnls", "pnnls"],
+        ["lstsq", "nnls", "pnnls", "fnnls"],
         default_value="lstsq",
         help=(
             r"""Solver used to get `C` from `X` and `St`.
@@ -107,6 +108,9 @@ class MCRALS(DecompositionAnalysis):
   sequentially on all profiles
 - ``'pnnls'``\ : non-negative least squares (`~scipy.optimize.nnls`) are applied on
   profiles indicated in `nonnegConc` and ordinary least squares on other profiles.
+- ``'fnnls'``\ : non-negative least squares are applied on all profiles at once using
+  the fast combinatorial NNLS algorithm. The results are the same as with ``'nnls'``,
+  but this is much faster for large datasets.
 """
         ),
     ).tag(config=True)
@@ -333,7 +337,7 @@ and `C[:,hardConc]`.
     ).tag(config=True)
 
     solverSpec = tr.Enum(
-        ["lstsq", "nnls", "pnnls"],
+        ["lstsq", "nnls", "pnnls", "fnnls"],
         default_value="lstsq",
         help=(
             r"""Solver used to get `St` from `X` and `C`.
@@ -342,7 +346,10 @@ and `C[:,hardConc]`.
 - ``'nnls'``\ : non-negative least squares (`~scipy.optimize.nnls`) are applied
   sequentially on all profiles
 - ``'pnnls'``\ : non-negative least squares (`~scipy.optimize.nnls`) are applied on
-  profiles indicated in `nonnegConc` and ordinary least squares on other profiles."""
+  profiles indicated in `nonnegConc` and ordinary least squares on other profiles.
+- ``'fnnls'``\ : non-negative least squares are applied on all profiles at once using
+  the fast combinatorial NNLS algorithm. The results are the same as with ``'nnls'``,
+  but this is much faster for large datasets."""
         ),
     ).tag(config=True)
 
@@ -559,6 +566,8 @@ and `St`.
             return _nnls(St.T, self._X.data.T).T
         if self.solverConc == "pnnls":
             return _pnnls(St.T, self._X.data.T, nonneg=self.nonnegConc).T
+        if self.solverConc == "fnnls":
+            return _fnnls(St.T, self._X.data.T).T
         return None
 
     def _solve_St(self, C):
@@ -568,6 +577,8 @@ and `St`.
             return _nnls(C, self._X.data)
         if self.solverSpec == "pnnls":
             return _pnnls(C, self._X.data, nonneg=self.nonnegSpec)
+        if self.solverSpec == "fnnls":
+            return _fnnls(C, self._X.data)
         return None
 
     def _guess_profile(self, profile):
@@ -910,17 +921,17 @@ and `St`.
             # ------------------------------------------
             if np.any(self.monoIncConc):
                 for s in self.monoIncConc:
-                    for curid in np.arange(ny - 1):
-                        if C[curid + 1, s] < C[curid, s] / self.monoIncTol:
-                            C[curid + 1, s] = C[curid, s]
+                    C[:, s] = _hold_1D(
+                        C[:, s], lambda c, r, tol=self.monoIncTol: c < r / tol
+                    )
 
             # Force monotonic decrease
             # ------------------------------------------
             if np.any(self.monoDecConc):
                 for s in self.monoDecConc:
-                    for curid in np.arange(ny - 1):
-                        if C[curid + 1, s] > C[curid, s] * self.monoDecTol:
-                            C[curid + 1, s] = C[curid, s]
+                    C[:, s] = _hold_1D(
+                        C[:, s], lambda c, r, tol=self.monoDecTol: c > r * tol
+                    )
 
             # Closure
             # ------------------------------------------
@@ -1281,7 +1292,7 @@ def _lstsq(X, Y, rcond=None):
 def _nnls(X, Y, withres=False):
     # Non negative least-squares solution to a linear matrix equation X @ W = Y
     # Return W >= 0
-    # TODO: look at may be faster algorithm: see: https://gist.github.com/vene/7224672
+    # (see `_fnnls` for a faster algorithm solving all targets at once)
     nsamp, nfeat = X.shape
     nsamp, ntarg = Y.shape
     W = np.empty((nfeat, ntarg))
@@ -1293,6 +1304,91 @@ def _nnls(X, Y, withres=False):
     return (W, np.sqrt(residuals)) if withres else W
 
 
+def _fnnls(X, Y, withres=False, max_iter=None):
+    # Non negative least-squares solution to a linear matrix equation X @ W = Y
+    # solved for all the columns of Y at once.
+    # Return W >= 0
+    #
+    # This is the fast combinatorial NNLS algorithm (FCNNLS) of Van Benthem and
+    # Keenan, J. Chemometrics 18 (2004) 441-450. The active-set iterations of
+    # Lawson and Hanson are run simultaneously on all targets using the normal
+    # equations, so that the Gram matrix X.T @ X is computed only once, and the
+    # unconstrained sub-problems of all targets sharing the same passive set are
+    # solved together.
+    nsamp, nfeat = X.shape
+    nsamp, ntarg = Y.shape
+    if max_iter is None:
+        max_iter = 3 * nfeat
+
+    XtX = X.T @ X
+    XtY = X.T @ Y
+    tol = 10 * np.finfo(float).eps * np.linalg.norm(XtX, 1) * max(nfeat, ntarg)
+
+    # start from the unconstrained solution, keeping its positive elements
+    # as the initial passive sets
+    W = _cssls(XtX, XtY)
+    passive = W > 0
+    W[~passive] = 0
+    D = W.copy()
+    fset = np.flatnonzero(~passive.all(axis=0))
+
+    niter = 0
+    while fset.size:
+        W[:, fset] = _cssls(XtX, XtY[:, fset], passive[:, fset])
+
+        # make the infeasible solutions feasible (inner loop of Lawson-Hanson),
+        # by moving back towards the previous feasible solution
+        hset = fset[(W[:, fset] < 0).any(axis=0)]
+        while hset.size and niter < max_iter:
+            niter += 1
+            Dh, Wh, Ph = D[:, hset], W[:, hset], passive[:, hset]
+            neg = Ph & (Wh < 0)
+            alpha = np.full(Wh.shape, np.inf)
+            alpha[neg] = Dh[neg] / (Dh[neg] - Wh[neg])
+            Dh = Dh - alpha.min(axis=0) * (Dh - Wh)
+            Dh[alpha.argmin(axis=0), np.arange(hset.size)] = 0
+            Ph &= Dh > 0
+            D[:, hset], passive[:, hset] = Dh, Ph
+            W[:, hset] = _cssls(XtX, XtY[:, hset], Ph)
+            hset = hset[(W[:, hset] < 0).any(axis=0)]
+
+        # check the optimality of the solutions (Lagrange multipliers of the
+        # active variables must be non-positive)
+        w = XtY[:, fset] - XtX @ W[:, fset]
+        w[passive[:, fset]] = -np.inf
+        optimal = (w <= tol).all(axis=0) | (niter >= max_iter)
+        fset = fset[~optimal]
+        w = w[:, ~optimal]
+
+        # for the non optimal targets, the variable with the largest multiplier
+        # enters the passive set
+        passive[w.argmax(axis=0), fset] = True
+        D[:, fset] = W[:, fset]
+
+    if withres:
+        return W, np.linalg.norm(X @ W - Y)
+    return W
+
+
+def _cssls(XtX, XtY, passive=None):
+    # Solve the normal equations XtX @ W = XtY restricted to the passive variables
+    # (combinatorial subspace least squares). Targets (columns of XtY) sharing the
+    # same passive set are solved together.
+    if passive is None:
+        return np.linalg.lstsq(XtX, XtY, rcond=None)[0]
+
+    W = np.zeros(XtY.shape)
+    sets, inverse = np.unique(passive.T, axis=0, return_inverse=True)
+    for i, pset in enumerate(sets):
+        if not pset.any():
+            continue
+        cols = np.flatnonzero(inverse.ravel() == i)
+        W[np.ix_(pset, cols)] = np.linalg.lstsq(
+            XtX[np.ix_(pset, pset)], XtY[np.ix_(pset, cols)], rcond=None
+        )[0]
+    return W
+
+
 def _pnnls(X, Y, nonneg=None, withres=False):
     # Least-squares  solution to a linear matrix equation X @ W = Y
     # with partial nonnegativity (indicated by the nonneg list of targets)
@@ -1366,6 +1462,13 @@ def _unimodal_1D(a: np.ndarray, tol: str, mod: str) -> np.ndarray:
     #     `a[i] < a[i-1] * unimodTol`  on an increasing branch of profile.
 
     maxid = np.argmax(a)
+
+    if mod == "strict":
+        # both branches are processed from the maximum outwards
+        a[maxid::-1] = _hold_1D(a[maxid::-1], lambda c, r: c > r * tol)
+        a[maxid:] = _hold_1D(a[maxid:], lambda c, r: c > r * tol)
+        return a
+
     curmax = max(a)
     curid = maxid
 
@@ -1394,3 +1497,68 @@ def _unimodal_1D(a: np.ndarray, tol: str, mod: str) -> np.ndarray:
                 curid = curid - 2
         curmax = a[curid]
     return a
+
+
+def _hold_1D(a, deviates):
+    # Replace the values of a 1D array deviating from the previous value by this
+    # previous value, sequentially: a[i] is replaced by the (already corrected)
+    # a[i-1] if `deviates(a[i], a[i-1])` is True.
+    #
+    # a : 1D ndarray
+    #
+    # deviates : callable
+    #     Vectorized function `deviates(values, reference)` returning a boolean array.
+    #
+    # The result is the same as with an element-wise loop. A run of corrected
+    # values starts at a point deviating from the previous (kept) point, and all
+    # the values of the run are compared to the same reference, so that the end of
+    # all the possible runs can be found by vectorized searches. Only the chaining
+    # of the runs (a run can not start inside the previous one) is done in python.
+    a = np.array(a)
+    n = a.size
+    starts = np.flatnonzero(deviates(a[1:], a[:-1])) + 1
+    if not starts.size:
+        return a
+    refs = a[starts - 1]
+
+    # end (first kept point) of the run beginning at each start, searched in
+    # increasingly large windows
+    ends = np.full(starts.size, -1)
+    todo = np.arange(starts.size)
+    lo = 1
+    for hi in (2, 5, 17, 65):
+        idx = starts[todo, None] + np.arange(lo, hi)
+        inside = idx < n
+        kept = inside & ~deviates(a[np.minimum(idx, n - 1)], refs[todo, None])
+        found = kept.any(axis=1)
+        ends[todo[found]] = idx[found, kept[found].argmax(axis=1)]
+        last = ~found & ~inside[:, -1]
+        ends[todo[last]] = n
+        todo = todo[~found & ~last]
+        lo = hi
+
+    # chain the runs
+    starts_, ends_ = starts.tolist(), ends.tolist()
+    runs = []
+    i = 0
+    while i < len(starts_):
+        start, end = starts_[i], ends_[i]
+        if end < 0:
+            # long run: continue the search in windows of increasing size
+            end, width = start + lo, 4 * lo
+            while end < n:
+                kept = ~deviates(a[end : end + width], refs[i])
+                if kept.any():
+                    end += int(np.argmax(kept))
+                    break
+                end, width = end + width, 2 * width
+            end = min(end, n)
+        runs.append((start, end))
+        i = bisect.bisect_left(starts_, end + 1, i)
+
+    # fill the runs with their reference value
+    start, end = np.array(runs).T
+    lengths = end - start
+    offsets = np.repeat(start - np.cumsum(lengths) + lengths, lengths)
+    a[np.arange(lengths.sum()) + offsets] = np.repeat(a[start - 1], lengths)
+    return a
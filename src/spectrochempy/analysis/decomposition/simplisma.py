@@ -256,8 +256,9 @@ class SIMPLISMA(DecompositionAnalysis):
         # scale dataset
         Xscaled = X / np.sqrt(mu**2 + (sigma + alpha) ** 2)
 
-        # COO dispersion matrix
-        COO = (1 / M) * np.dot(Xscaled.T, Xscaled)
+        # COO dispersion matrix: only its diagonal and its columns for the purest
+        # variables are used, so that the (N, N) matrix is not computed
+        COO_diag = (1 / M) * np.sum(Xscaled**2, axis=0)
 
         # Determine the purest variables
         j = 0
@@ -351,14 +352,17 @@ class SIMPLISMA(DecompositionAnalysis):
                 prev_stdev_res = stdev_res0
 
             else:
-                # compute jth purest variable
-                for i in range(X.shape[-1]):
-                    Mji = np.zeros((j + 1, j + 1))
-                    idx = [i] + maxPIndex[0:j]
-                    for line in range(j + 1):
-                        for col in range(j + 1):
-                            Mji[line, col] = COO[idx[line], idx[col]]
-                    w[j, i] = np.linalg.det(Mji)
+                # compute jth purest variable: the weight of the variable i is the
+                # determinant of the COO submatrix of the variables
+                # [i] + maxPIndex[0:j], all these submatrices being stacked in a
+                # (N, j+1, j+1) array
+                COO_j = (1 / M) * np.dot(Xscaled.T, Xscaled[:, maxPIndex[0:j]])
+                Mj = np.empty((N, j + 1, j + 1))
+                Mj[:, 0, 0] = COO_diag
+                Mj[:, 0, 1:] = COO_j
+                Mj[:, 1:, 0] = COO_j
+                Mj[:, 1:, 1:] = COO_j[maxPIndex[0:j]]
+                w[j, :] = np.linalg.det(Mj)
                 Pt[j:] = p * w[j, :]
                 s[j, :] = sigma * w[j, :]
 
@@ -12,6 +12,8 @@ import logging
 import re
 import warnings
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from functools import partial
 
 import numpy as np
@@ -30,6 +32,7 @@ from spectrochempy.extern.traittypes import Array
 from spectrochempy.utils.datetimeutils import UTC
 from spectrochempy.utils.exceptions import SpectroChemPyError
 from spectrochempy.utils.optional import import_optional_dependency
+from spectrochempy.utils.system import get_n_workers
 
 __all__ = [
     "ActionMassKinetics",
@@ -106,6 +109,95 @@ def _interpret_equation(eq, species):
     return left, right
 
 
+class _RateLaw:
+    # Production rates of the species of a reaction network and their jacobian,
+    # assuming action mass kinetics. They are computed with the stoichiometry
+    # matrices, so that the same object can be used for all integrations as long as
+    # the reaction network does not change.
+
+    def __init__(self, A, B):
+        self.A = np.asarray(A, dtype=float)
+        self.BmAt = (np.asarray(B, dtype=float) - self.A).T
+        # exponents of the derivatives of C**A (C**-1 is avoided for A = 0, where
+        # the derivative is zero anyway)
+        self.dA = np.maximum(self.A - 1.0, 0.0)
+        self._diag = np.arange(self.A.shape[1])
+
+    def reaction_rates(self, k, C):
+        # rate of each reaction: k * prod(C**A)
+        # (np.multiply.reduce has less overhead than np.prod for these small arrays)
+        return k * np.multiply.reduce(C**self.A, 1)
+
+    def production_rates(self, k, t, C):
+        # dC/dt = (B-A).T @ (k * prod(C**A))
+        return self.BmAt @ (k * np.multiply.reduce(C**self.A, 1))
+
+    def jacobian(self, k, t, C):
+        # d(dC/dt)/dC = (B-A).T @ (k * d(prod(C**A))/dC) where the derivative of the
+        # product with respect to C[l] is obtained by replacing C[l]**A[:, l] by its
+        # derivative in the product
+        P = C**self.A
+        M = np.broadcast_to(P, (P.shape[1], *P.shape)).copy()
+        M[self._diag, :, self._diag] = (self.A * C**self.dA).T
+        return self.BmAt @ (k[:, np.newaxis] * np.multiply.reduce(M, 2).T)
+
+    def production_rates_grid(self, k_grid, k_dt, t, C):
+        # production rates with rate constants taken from a time grid
+        return self.production_rates(k_grid[int(t / k_dt)], t, C)
+
+    def jacobian_grid(self, k_grid, k_dt, t, C):
+        # jacobian with rate constants taken from a time grid
+        return self.jacobian(k_grid[int(t / k_dt)], t, C)
+
+    def sensitivity_rates(self, k, dkdp, reactions, t, y):
+        # production rates augmented with the forward sensitivities S = dC/dp of the
+        # concentrations with respect to parameters p, each acting on the rate
+        # constant of one of the `reactions` :
+        # dS/dt = J @ S + (B-A).T[:, reactions] * prod(C**A)[reactions] * dk/dp
+        n = self.BmAt.shape[0]
+        C = y[:n]
+        S = y[n:].reshape(n, -1)
+        rates = np.multiply.reduce(C**self.A, 1)
+        dC = self.BmAt @ (k * rates)
+        dS = self.jacobian(k, t, C) @ S + self.BmAt[:, reactions] * (
+            rates[reactions] * dkdp
+        )
+        return np.concatenate((dC, dS.ravel()))
+
+    def sensitivity_rates_grid(self, k_grid, dkdp_grid, k_dt, reactions, t, y):
+        # sensitivity rates with rate constants taken from a time grid
+        i = int(t / k_dt)
+        return self.sensitivity_rates(k_grid[i], dkdp_grid[i], reactions, t, y)
+
+
+def _solve_condition(rate_law, k, dkdp, k_dt, reactions, C0, t, options):
+    # Integrate the kinetics for one set of experimental conditions (this is run in a
+    # separate process when the conditions are integrated in parallel).
+    # k (and dkdp) are taken from a time grid of resolution k_dt if k_dt is not None.
+    # If dkdp is not None, the sensitivities with respect to the parameters are
+    # integrated together with the concentrations.
+    options = options.copy()
+    use_jac = options.pop("use_jac")
+    grid = k_dt is not None
+    if dkdp is None:
+        if grid:
+            fun = partial(rate_law.production_rates_grid, k, k_dt)
+            # jac = d[dC/dt]/dCi
+            jac = partial(rate_law.jacobian_grid, k, k_dt) if use_jac else None
+        else:
+            fun = partial(rate_law.production_rates, k)
+            jac = partial(rate_law.jacobian, k) if use_jac else None
+        y0 = C0
+    else:
+        if grid:
+            fun = partial(rate_law.sensitivity_rates_grid, k, dkdp, k_dt, reactions)
+        else:
+            fun = partial(rate_law.sensitivity_rates, k, dkdp, reactions)
+        jac = None
+        y0 = np.concatenate((C0, np.zeros(len(C0) * len(reactions))))
+    return solve_ivp(fun, (t[0], t[-1]), y0, t_eval=t, jac=jac, **options)
+
+
 @tr.signature_has_traits
 class ActionMassKinetics(tr.HasTraits):
     """
@@ -225,10 +317,6 @@ class ActionMassKinetics(tr.HasTraits):
 
         self._T = T
 
-        self._reaction_rates = self._write_reaction_rates()
-        self._production_rates = self._write_production_rates()
-        self._jacobian = self._write_jacobian()
-
     # ----------------------------------------------------------------------------------
     # Private methods
     # ----------------------------------------------------------------------------------
@@ -302,7 +390,8 @@ class ActionMassKinetics(tr.HasTraits):
             B[i] = [right.get(k, 0) for k in self._species]
         self._A = A
         self._B = B
-        self._BmAt = (B - A).T
+        # the rate law used for integration is updated only when the network changes
+        self._rate_law = _RateLaw(A, B)
 
     # ----------------------------------------------------------------------------------
     # Public properties
@@ -416,9 +505,9 @@ class ActionMassKinetics(tr.HasTraits):
                         elif n == -1:
                             jac += f" - k[{k}]"
                         elif n > 1:
-                            jac += f" + {n} * k[{j}]"
+                            jac += f" + {n} * k[{k}]"
                         elif n < -1:
-                            jac += f" {n} * k[{j}]"
+                            jac += f" {n} * k[{k}]"
 
                         for jj, nu in enumerate(self.A[k]):
                             if nu == 1:
@@ -450,6 +539,7 @@ class ActionMassKinetics(tr.HasTraits):
         use_jac=False,
         atol=1e-6,
         rtol=1e-3,
+        workers=None,
         **kwargs,
     ):
         r"""
@@ -522,6 +612,13 @@ class ActionMassKinetics(tr.HasTraits):
             different components by passing array_like with shape (n_species,) for
             atol. Default values are `rtol=1e-3` and `atol=1e-6`.
 
+        workers : `int` or `None`, optional, default: `None`
+            Number of processes used to integrate the sets of experimental conditions
+            concurrently, when several sets are defined. If `None` or 1, the sets
+            are integrated sequentially. -1 means using all the available
+            processors.
+            The results are returned in the order of the sets in all cases.
+
         **kwargs
             Additional keyword parameters. See Other Parameters.
 
@@ -572,130 +669,24 @@ class ActionMassKinetics(tr.HasTraits):
         # import time
         # t0 = time.time()
 
-        global_env = {}
-        locals_env = {}
-
-        if self._nset == 1:
-            conditions = zip([self._T], [self._init_concentrations], [t], strict=False)
-        else:
-            conditions = zip(self._T, self._init_concentrations, t, strict=False)
-
-        C = []
-        for i, (T, C0, t) in enumerate(conditions):
-            if callable(T):
-                # non-isothermal: a grid of k_i values spaced by k_dt time intervals
-                # is computed
-                t_grid = np.arange(0, t[-1] + k_dt, k_dt)
-                T_grid = np.expand_dims(T(t_grid), axis=1)
-                k_grid = (
-                    self._arrhenius[:, 0]
-                    * np.power(T_grid, self._arrhenius[:, 1])
-                    * np.exp(-self._arrhenius[:, 2] / 8.314 / T_grid)
-                )
-
-                # uncomment for debugging and optimization
-                # t1 = time.time()
-
-                exec(  # noqa: S102
-                    f"def f_(self, k_grid, k_dt, t, C): k = k_grid[int(t/k_dt)] ; return self._BmAt @ {self._reaction_rates}",
-                    global_env,
-                    locals_env,
-                )
-
-                if use_jac:
-                    # define jac_ = d[dC/dt]/dCi
-                    exec(  # noqa: S102
-                        f"def jac_(self, k_grid, k_dt, t, C): k = k_grid[int(t/k_dt)] ; return{self._jacobian}",
-                        global_env,
-                        locals_env,
-                    )
-                    jac = partial(locals_env["jac_"], self, k_grid, k_dt)
-                else:
-                    jac = None
-
-                # uncomment for debugging and optimization
-                # t2 = time.time()
-
-                bunch = solve_ivp(
-                    partial(locals_env["f_"], self, k_grid, k_dt),
-                    (t[0], t[-1]),
-                    list(C0.values()),
-                    t_eval=t,
-                    method=method,
-                    atol=atol,
-                    rtol=rtol,
-                    jac=jac,
+        workers = get_n_workers(workers)
+        if workers > 1 and self._nset > 1:
+            # the sets of conditions are integrated in parallel
+            with ProcessPoolExecutor(max_workers=min(workers, self._nset)) as executor:
+                bunches = self._solve(
+                    t, k_dt, method, use_jac, atol, rtol, executor=executor
                 )
+        else:
+            bunches = self._solve(t, k_dt, method, use_jac, atol, rtol)
 
-                # uncomment for debugging and optimization
-                # t3 = time.time()
-
-            else:
-                if len(self._arrhenius.shape) == 1:
-                    # _arrhenius is 1D array of rate constants
-                    k = self._arrhenius
-
-                    # uncomment for debugging and optimization
-                    # t1 = time.time()
-
-                else:
-                    # isothermal, the k_i are computed once
-                    k = (
-                        self._arrhenius[:, 0]
-                        * T ** self._arrhenius[:, 1]
-                        * np.exp(-self._arrhenius[:, 2] / R / T)
-                    )
-
-                # uncomment for debugging and optimization
-                # t1 = time.time()
-
-                exec(  # noqa: S102
-                    f"def f_(self, k, t, C): return{self._production_rates}",
-                    global_env,
-                    locals_env,
-                )
-                if use_jac:
-                    # define jac_ = d[dC/dt]/dCi
-                    exec(  # noqa: S102
-                        f"def jac_(self, k, t, C): return{self._jacobian}",
-                        global_env,
-                        locals_env,
-                    )
-                    jac = partial(locals_env["jac_"], self, k)
-                else:
-                    jac = None
-
-                # uncomment for debugging and optimization
-                # t2 = time.time()
-
-                bunch = solve_ivp(
-                    partial(locals_env["f_"], self, k),
-                    (t[0], t[-1]),
-                    list(C0.values()),
-                    t_eval=t,
-                    method=method,
-                    atol=atol,
-                    rtol=rtol,
-                    jac=jac,
-                )
-
-                # uncomment for debugging and optimization
-                # t2 = time.time()
-
-            # uncomment for debugging (warning: debug_() multiply the exec time by 4...)
-            # from from spectrochempy.application.application import debug_
-            # debug_(bunch.message)
-            # t4 = time.time()
-
-            if bunch.status != 0:
-                raise SolverError(bunch.message)
+        # uncomment for debugging and optimization
+        # t1 = time.time()
 
+        C = []
+        for i, bunch in enumerate(bunches):
             C_ = (left_op @ bunch.y).T if left_op is not None else bunch.y.T
             t = bunch.t
 
-            # uncomment for debugging and optimization
-            # t5 = time.time()
-
             return_dataset = kwargs.get("return_NDDataset", True)
             if return_dataset:
                 C.append(NDDataset(C_, name="Concentrations"))
@@ -721,42 +712,152 @@ class ActionMassKinetics(tr.HasTraits):
                 C[i].history = "Created using ActionMassKinetics.integrate"
                 C[i].meta.update(bunch)
 
-                # uncomment for debugging and optimization
-                # t6 = time.time()
-                # info_(f"time compute k       : {t1 - t0:f}, {100*(t1 - t0)/(t6-t0):f}%")
-                # info_(f"time load f (and jac): {t2 - t1:f}, {100*(t2 - t1)/(t6-t0):f}%")
-                # info_(f"time integration     : {t3 - t2:f}, {100*(t3 - t2)/(t6-t0):f}%")
-                # info_(f"time debug           : {t4 - t3:f}, {100*(t4 - t3)/(t6-t0):f}%")
-                # info_(f"time C,t             : {t5 - t4:f}, {100*(t5 - t4)/(t6-t0):f}%")
-                # info_(f"time to NDDataset    : {t6 - t5:f}, {100*(t6 - t5)/(t6-t0):f}%")
-
             elif kwargs.get("return_meta", False) and not return_dataset:
                 C.append((C_, bunch))
             else:
                 C.append(C_)
 
+        # uncomment for debugging and optimization
+        # t2 = time.time()
+        # info_(f"time integration     : {t1 - t0:f}, {100*(t1 - t0)/(t2-t0):f}%")
+        # info_(f"time to NDDataset    : {t2 - t1:f}, {100*(t2 - t1)/(t2-t0):f}%")
+
         if len(C) == 1:
             return C[0]
         return C
 
-    def _modify_kinetics(self, dict_param, left_op=None):
-        if len(self._arrhenius.shape) == 2:
-            for item in dict_param:
-                i_r, p = item.split("[")[-1].split("].")
-                if p == "A":
-                    self._arrhenius[int(i_r), 0] = dict_param[item]
-                elif p == "b":
-                    self._arrhenius[int(i_r), 1] = dict_param[item]
-                elif p == "Ea":
-                    self._arrhenius[int(i_r), 2] = dict_param[item]
-                else:
-                    raise ValueError(
-                        "something went wrong in parsing the dict of params",
-                    )
+    def _solve(
+        self,
+        t,
+        k_dt,
+        method,
+        use_jac,
+        atol,
+        rtol,
+        params=None,
+        scale=None,
+        executor=None,
+    ):
+        # Integrate the kinetics for all the sets of conditions and return the list of
+        # solver results (in the order of the sets, even when an executor is used).
+        # If params (a list of parameter names such as 'k[0].A', see
+        # fit_to_concentrations) is given, the sensitivities of the concentrations
+        # with respect to these parameters are integrated too: they are in
+        # bunch.y[n_species:] with shape (n_species, n_params, t_points) once
+        # reshaped. If scale is given, the sensitivities are computed with respect to
+        # params / scale, so that they are of the same order of magnitude as the
+        # concentrations (the absolute tolerance of the solver applies to them too).
+        if self._nset == 1:
+            conditions = zip([self._T], [self._init_concentrations], [t], strict=False)
         else:
-            for item in dict_param:
-                i_r = item.split("[")[-1].split("]")[0]
-                self._arrhenius[int(i_r)] = dict_param[item]
+            conditions = zip(self._T, self._init_concentrations, t, strict=False)
+
+        reactions = None
+        if params is not None:
+            reactions, columns = zip(
+                *[self._parse_parameter(item) for item in params], strict=True
+            )
+            reactions = list(reactions)
+
+        options = {"method": method, "atol": atol, "rtol": rtol, "use_jac": use_jac}
+        tasks = []
+        for T, C0, t_ in conditions:
+            grid = callable(T)
+            if grid:
+                # non-isothermal: a grid of k_i values spaced by k_dt time intervals
+                # is computed
+                t_grid = np.arange(0, t_[-1] + k_dt, k_dt)
+                T = np.expand_dims(T(t_grid), axis=1)
+                k = (
+                    self._arrhenius[:, 0]
+                    * np.power(T, self._arrhenius[:, 1])
+                    * np.exp(-self._arrhenius[:, 2] / 8.314 / T)
+                )
+            elif len(self._arrhenius.shape) == 1:
+                # _arrhenius is 1D array of rate constants
+                k = self._arrhenius
+            else:
+                # isothermal, the k_i are computed once
+                k = (
+                    self._arrhenius[:, 0]
+                    * T ** self._arrhenius[:, 1]
+                    * np.exp(-self._arrhenius[:, 2] / R / T)
+                )
+
+            dkdp = None
+            if params is not None:
+                dkdp = self._rate_constants_derivatives(
+                    k, T, reactions, columns, 8.314 if grid else R
+                )
+                if scale is not None:
+                    dkdp = dkdp * scale
+
+            tasks.append(
+                (
+                    self._rate_law,
+                    k,
+                    dkdp,
+                    k_dt if grid else None,
+                    reactions,
+                    list(C0.values()),
+                    t_,
+                    options,
+                )
+            )
+
+        # the tasks are transposed to the argument lists expected by map
+        mapper = map if executor is None else executor.map
+        bunches = list(mapper(_solve_condition, *zip(*tasks, strict=True)))
+
+        for bunch in bunches:
+            if bunch.status != 0:
+                raise SolverError(bunch.message)
+        return bunches
+
+    def _rate_constants_derivatives(self, k, T, reactions, columns, gas_constant):
+        # derivatives of the rate constants k of the given reactions (k can be a time
+        # grid of shape (n_grid, n_reactions)) with respect to the arrhenius
+        # parameters in the given columns (None for 1D arrhenius)
+        k = k[..., reactions]
+        if columns[0] is None:
+            return np.ones_like(k)
+        T = np.broadcast_to(T, k.shape)
+        arrhenius = self._arrhenius[reactions]
+        dkdp = np.empty_like(k)
+        for j, column in enumerate(columns):
+            if column == 0:
+                # dk/dA = T**b exp(-Ea/RT)
+                dkdp[..., j] = T[..., j] ** arrhenius[j, 1] * np.exp(
+                    -arrhenius[j, 2] / gas_constant / T[..., j]
+                )
+            elif column == 1:
+                # dk/db = k ln(T)
+                dkdp[..., j] = k[..., j] * np.log(T[..., j])
+            else:
+                # dk/dEa = -k/RT
+                dkdp[..., j] = -k[..., j] / gas_constant / T[..., j]
+        return dkdp
+
+    def _parse_parameter(self, item):
+        # return the reaction index and the column of _arrhenius (None if _arrhenius
+        # is a 1D array of rate constants) of a parameter name: 'k[i]' or 'k[i].A',
+        # 'k[i].b', 'k[i].Ea'
+        if len(self._arrhenius.shape) == 2:
+            i_r, p = item.split("[")[-1].split("].")
+            if p not in ("A", "b", "Ea"):
+                raise ValueError(
+                    "something went wrong in parsing the dict of params",
+                )
+            return int(i_r), ("A", "b", "Ea").index(p)
+        return int(item.split("[")[-1].split("]")[0]), None
+
+    def _modify_kinetics(self, dict_param, left_op=None):
+        for item in dict_param:
+            i_r, column = self._parse_parameter(item)
+            if column is None:
+                self._arrhenius[i_r] = dict_param[item]
+            else:
+                self._arrhenius[i_r, column] = dict_param[item]
 
         if left_op is not None:
             self._arrhenius = left_op @ self._arrhenius
@@ -788,10 +889,19 @@ class ActionMassKinetics(tr.HasTraits):
             rate parameters to optimize. Keys should be 'k[i].A' and 'k[i].Ea' for
             pre-exponential factor.
         ivp_solver_kwargs : `dict`
-            keyword arguments for the ode solver. Defaults are the same as for
-            `~scipy.integrate.solve_ivp`, except for `method=LSDOA`
+            keyword arguments for the ode solver (``method``, ``k_dt``, ``use_jac``,
+            ``atol``, ``rtol`` and ``left_op`` , see `integrate` ). Defaults are the
+            same as for `integrate` . ``workers`` gives the number of processes used to
+            integrate the sets of experimental conditions concurrently (see
+            `integrate` ); the same processes are used during the whole optimization.
         optimizer_kwargs: `dict`
             keyword arguments the optimization (see `~scipy.optimize.minimize`).
+            If ``jac`` is True, the gradient of the objective function is computed
+            from the sensitivities of the concentrations with respect to the
+            parameters, integrated together with the kinetics, and a gradient-based
+            method is used (``Method`` defaults to ``'L-BFGS-B'`` instead of
+            ``'Nelder-Mead'`` ). The ``rtol`` of the ode solver might have to be
+            lowered for an accurate gradient.
 
         Returns
         -------
@@ -811,11 +921,13 @@ class ActionMassKinetics(tr.HasTraits):
             i2iexp,
             dict_param_to_optimize,
             optimizer_left_op,
-            ivp_solver_method,
-            k_dt,
+            ivp_solver_options,
             C_op,
+            executor,
+            scale,
         ):
-            """Return the SSE on concentrations profiles."""
+            """Return the SSE on concentrations profiles (and its gradient)."""
+            params = params * scale
             for param, item in zip(params, dict_param_to_optimize, strict=False):
                 dict_param_to_optimize[item] = param
 
@@ -828,77 +940,133 @@ class ActionMassKinetics(tr.HasTraits):
                 t = [C.y.data for C in Cexp]
                 Carray = np.concatenate([C.data for C in Cexp])
 
-            Chat = self.integrate(
+            bunches = self._solve(
                 t,
-                return_NDDataset=False,
-                method=ivp_solver_method,
-                k_dt=k_dt,
-                left_op=C_op,
+                params=list(dict_param_to_optimize) if optimizer_jac else None,
+                scale=scale,
+                executor=executor,
+                **ivp_solver_options,
             )
 
-            if self._nset > 1:
-                Chat = np.concatenate(list(Chat))
+            Chat = np.concatenate([bunch.y[: self.n_species].T for bunch in bunches])
+            if C_op is not None:
+                Chat = Chat @ C_op.T
+            residuals = Carray[:, iexp] - Chat[:, i2iexp]
+            sse = np.sum(np.square(residuals))
+            if not optimizer_jac:
+                return sse
 
-            return np.sum(np.square(Carray[:, iexp] - Chat[:, i2iexp]))
+            # sensitivities dChat/dp, shape (t_points, n_species, n_params)
+            S = np.concatenate(
+                [
+                    bunch.y[self.n_species :]
+                    .reshape(self.n_species, len(params), -1)
+                    .transpose(2, 0, 1)
+                    for bunch in bunches
+                ]
+            )
+            if C_op is not None:
+                S = np.einsum("ij,tjp->tip", C_op, S)
+            return sse, -2.0 * np.einsum("ti,tip->p", residuals, S[:, i2iexp])
 
         # optimizer (kw)arguments:
         # ... parameters for scipy.minimize
-        optimizer_method = optimizer_kwargs.get("Method", "Nelder-Mead")
+        optimizer_jac = optimizer_kwargs.get("jac", False)
+        optimizer_method = optimizer_kwargs.get(
+            "Method", "L-BFGS-B" if optimizer_jac else "Nelder-Mead"
+        )
         optimizer_bounds = optimizer_kwargs.get("bounds", None)
         optimizer_tol = optimizer_kwargs.get("tol", None)
         optimizer_options = optimizer_kwargs.get("options", {"disp": True})
         # optimizer_callback = optimizer_kwargs.get("callback", None)
         # ... other parameters
         optimizer_left_op = optimizer_kwargs.get("left_op", None)
+        if optimizer_jac and optimizer_left_op is not None:
+            raise ValueError(
+                "the gradient can not be computed when a `left_op` is passed in "
+                "`optimizer_kwargs`",
+            )
 
         # ivp solver (kw)arguments:
         # ... parameters for integrate.ivp_solve
-        ivp_solver_method = ivp_solver_kwargs.get("method", "LSODA")
+        ivp_solver_options = {
+            "method": ivp_solver_kwargs.get("method", "LSODA"),
+            "k_dt": ivp_solver_kwargs.get("k_dt", None),
+            "use_jac": ivp_solver_kwargs.get("use_jac", False),
+            "atol": ivp_solver_kwargs.get("atol", 1e-6),
+            "rtol": ivp_solver_kwargs.get("rtol", 1e-3),
+        }
         # ... other parameters
-        ivp_solver_k_dt = ivp_solver_kwargs.get("k_dt", None)
         ivp_solver_left_op = ivp_solver_kwargs.get("left_op", None)
+        workers = ivp_solver_kwargs.get("workers")
+        workers = get_n_workers(workers)
 
         # get x0
         x0 = np.zeros(len(dict_param_to_optimize))
         for i, param in enumerate(dict_param_to_optimize):
             x0[i] = dict_param_to_optimize[param]
 
-        if optimizer_options["disp"]:
-            init_val = objective(
-                x0,
+        # the gradient-based methods are sensitive to the scaling of the parameters
+        # (e.g. A ~ 1e8 and Ea ~ 5e4): they are optimized relative to their initial
+        # values
+        scale = np.ones_like(x0)
+        if optimizer_jac:
+            scale = np.where(x0 != 0, np.abs(x0), 1.0)
+            if optimizer_bounds is not None:
+                optimizer_bounds = [
+                    tuple(None if b is None else b / sc for b in bounds)
+                    for bounds, sc in zip(optimizer_bounds, scale, strict=True)
+                ]
+        minimizer_options = optimizer_options
+        if optimizer_method.upper() == "L-BFGS-B":
+            # disp is deprecated for L-BFGS-B (it is still used for the information
+            # displayed here)
+            minimizer_options = {
+                key: value for key, value in optimizer_options.items() if key != "disp"
+            }
+
+        # the same pool of processes is used for all the evaluations of the objective
+        parallel = workers > 1 and self._nset > 1
+        with (
+            ProcessPoolExecutor(max_workers=min(workers, self._nset))
+            if parallel
+            else nullcontext()
+        ) as executor:
+            args = (
                 Cexp,
                 iexp,
                 i2iexp,
                 dict_param_to_optimize,
                 optimizer_left_op,
-                ivp_solver_method,
-                ivp_solver_k_dt,
+                ivp_solver_options,
                 ivp_solver_left_op,
+                executor,
+                scale,
+            )
+
+            if optimizer_options["disp"]:
+                init_val = objective(x0 / scale, *args)
+                if optimizer_jac:
+                    init_val = init_val[0]
+                info_("Optimization of the parameters.")
+                info_(f"         Initial parameters: {x0}")
+                info_(f"         Initial function value: {init_val:f}")
+            tic = datetime.datetime.now(UTC)
+
+            optim_res = minimize(
+                objective,
+                x0 / scale,
+                args=args,
+                method=optimizer_method,
+                jac=optimizer_jac,
+                bounds=optimizer_bounds,
+                tol=optimizer_tol,
+                options=minimizer_options,
             )
-            info_("Optimization of the parameters.")
-            info_(f"         Initial parameters: {x0}")
-            info_(f"         Initial function value: {init_val:f}")
-        tic = datetime.datetime.now(UTC)
-
-        optim_res = minimize(
-            objective,
-            x0,
-            args=(
-                Cexp,
-                iexp,
-                i2iexp,
-                dict_param_to_optimize,
-                optimizer_left_op,
-                ivp_solver_method,
-                ivp_solver_k_dt,
-                ivp_solver_left_op,
-            ),
-            method=optimizer_method,
-            bounds=optimizer_bounds,
-            tol=optimizer_tol,
-            options=optimizer_options,
-        )
         toc = datetime.datetime.now(UTC)
+        optim_res["x"] = optim_res["x"] * scale
+        if "jac" in optim_res:
+            optim_res["jac"] = optim_res["jac"] / scale
 
         if optimizer_options["disp"]:
             info_(f"         Optimization time: {toc - tic}")
@@ -910,9 +1078,13 @@ class ActionMassKinetics(tr.HasTraits):
         Ckin = self.integrate(
             t,
             return_NDDataset=False,
-            method=ivp_solver_method,
-            k_dt=ivp_solver_k_dt,
+            method=ivp_solver_options["method"],
+            k_dt=ivp_solver_options["k_dt"],
+            use_jac=ivp_solver_options["use_jac"],
+            atol=ivp_solver_options["atol"],
+            rtol=ivp_solver_options["rtol"],
             left_op=ivp_solver_left_op,
+            workers=workers,
         )
 
         for i, param in enumerate(dict_param_to_optimize):
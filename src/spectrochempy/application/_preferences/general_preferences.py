@@ -75,6 +75,13 @@ class GeneralPreferences(MetaConfigurable):
         help="Display the close project dialog project changing or on application exit",
     ).tag(config=True, gui=True)
 
+    # Dataset options ---------------------------------------------------------
+    view_slicing = tr.Bool(
+        False,
+        help="Slicing of datasets returns views sharing the data of the sliced "
+        "dataset (with copy-on-write) instead of copies",
+    ).tag(config=True)
+
     # CSV options -------------------------------------------------------------
     csv_delimiter = tr.Enum(
         [",", ";", r"\t", " "],
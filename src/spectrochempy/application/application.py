@@ -17,12 +17,12 @@ from os import environ
 from pathlib import Path
 
 import traitlets as tr
-from IPython import get_ipython
-from IPython.core.interactiveshell import InteractiveShell
 from traitlets.config.application import Application
 from traitlets.config.configurable import Config
 from traitlets.config.manager import BaseJSONConfigManager
 
+from spectrochempy.utils.system import get_ipython
+
 __all__ = [
     "DEBUG",
     "INFO",
@@ -127,6 +127,7 @@ class SpectroChemPy(Application):
     _running = tr.Bool(False)
     _loaded_config_files = tr.List()
     _from_warning_ = False
+    _plot_preferences = None
 
     # ----------------------------------------------------------------------------------
     # Non configurable attributes
@@ -270,9 +271,6 @@ class SpectroChemPy(Application):
         from spectrochempy.application._preferences.general_preferences import (
             GeneralPreferences,
         )
-        from spectrochempy.application._preferences.plot_preferences import (
-            PlotPreferences,
-        )
 
         if not self.config:
             self.config = Config()
@@ -309,8 +307,59 @@ class SpectroChemPy(Application):
                     self._loaded_config_files.append(cfgname)
 
         self.general_preferences = GeneralPreferences(config=self.config, parent=self)
-        self.plot_preferences = PlotPreferences(config=self.config, parent=self)
-        self.classes = [GeneralPreferences, PlotPreferences]
+        self.classes = [GeneralPreferences]
+
+    def _init_plot_preferences(self):
+        # Create the plot preferences and set up matplotlib accordingly.
+        # In headless mode, this is done only when the plot preferences are first
+        # needed (e.g., at the first plot), so that matplotlib is not imported before.
+        import matplotlib as mpl
+        from matplotlib import pyplot as plt
+
+        from spectrochempy.application._preferences.plot_preferences import (
+            PlotPreferences,
+        )
+
+        if HEADLESS:
+            # (done by setup_environment in the other modes)
+            from spectrochempy.data.setup import setup_mpl
+
+            setup_mpl()
+
+        self._plot_preferences = PlotPreferences(config=self.config, parent=self)
+        self.classes.append(PlotPreferences)
+
+        # force update of rcParams
+        for rckey in mpl.rcParams:
+            key = rckey.replace("_", "__").replace(".", "_").replace("-", "___")
+            try:
+                mpl.rcParams[rckey] = getattr(self._plot_preferences, key)
+            except ValueError:
+                mpl.rcParams[rckey] = getattr(self._plot_preferences, key).replace(
+                    "'",
+                    "",
+                )
+            except AttributeError:
+                # print(f'{e} -> you may want to add it to PlotPreferences.py')
+                pass
+
+        self._plot_preferences.set_latex_font(self._plot_preferences.font_family)
+
+        # set the default style
+        # ------------------------------------------------------------------------------
+        plt.style.use(["classic"])
+
+        if self._running:
+            # started in headless mode: the default config file of the plot
+            # preferences is written now
+            self.make_default_config_file()
+
+    @property
+    def plot_preferences(self):
+        """Preferences for the plots (matplotlib is set up at the first access)."""
+        if self._plot_preferences is None:
+            self._init_plot_preferences()
+        return self._plot_preferences
 
     # ----------------------------------------------------------------------------------
     # Initialisation of the application
@@ -330,7 +379,7 @@ class SpectroChemPy(Application):
 
         # exception handler
         # -----------------
-        ipy = get_ipython() if InteractiveShell.initialized() else None
+        ipy = get_ipython()
 
         if ipy is not None:  # pragma: no cover
             ipy.set_custom_exc((Exception,), self._ipython_catch_exceptions)
@@ -348,8 +397,6 @@ class SpectroChemPy(Application):
 
         All configuration must have been done before calling this function.
         """
-        from matplotlib import pyplot as plt
-
         from spectrochempy.application.datadir import DataDir
 
         if self._running:
@@ -361,33 +408,13 @@ class SpectroChemPy(Application):
 
         # Get preferences from the config file and init everything
         self._init_all_preferences()
-
-        # force update of rcParams
-        import matplotlib as mpl
-
-        for rckey in mpl.rcParams:
-            key = rckey.replace("_", "__").replace(".", "_").replace("-", "___")
-            try:
-                mpl.rcParams[rckey] = getattr(self.plot_preferences, key)
-            except ValueError:
-                mpl.rcParams[rckey] = getattr(self.plot_preferences, key).replace(
-                    "'",
-                    "",
-                )
-            except AttributeError:
-                # print(f'{e} -> you may want to add it to PlotPreferences.py')
-                pass
-
-        self.plot_preferences.set_latex_font(self.plot_preferences.font_family)
+        if not HEADLESS:
+            self._init_plot_preferences()
 
         # Eventually write the default config file
         # --------------------------------------
         self.make_default_config_file()
 
-        # set the default style
-        # --------------------------------------------------------------------------------------
-        plt.style.use(["classic"])
-
         self.debug_(
             f"API loaded with log level set to "
             f"{logging.getLevelName(int(self.log_level))}- application is ready"
@@ -472,7 +499,7 @@ class SpectroChemPy(Application):
 # Setup environment
 from .envsetup import setup_environment
 
-NO_DISPLAY, SCPY_STARTUP_LOGLEVEL, is_pytest = setup_environment()
+NO_DISPLAY, SCPY_STARTUP_LOGLEVEL, is_pytest, HEADLESS = setup_environment()
 
 # Define an instance of the SpectroChemPy application.
 app = SpectroChemPy(log_level=SCPY_STARTUP_LOGLEVEL)
@@ -549,7 +576,7 @@ if not NO_DISPLAY:
 # --------------------------------------------------------------------------------------
 # Download data in a separate thread
 # --------------------------------------------------------------------------------------
-if not is_pytest:
+if not is_pytest and not HEADLESS:
     from .testdata import download_full_testdata_directory
 
     DOWNLOAD_TESTDATA = threading.Thread(
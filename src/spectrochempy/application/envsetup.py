@@ -7,7 +7,6 @@ import importlib.util
 import sys
 from os import environ
 
-import matplotlib as mpl
 from traitlets import import_item
 
 from spectrochempy.application.jupyter import setup_jupyter_css
@@ -24,6 +23,10 @@ def setup_environment():
     is_docs = environ.get("DOC_BUILDING") is not None
     is_pytest = "pytest" in sys.argv[0] or "py.test" in sys.argv[0]
 
+    # Headless mode (e.g., for batch processing in short-lived processes): plotting
+    # is set up only at the first plot, and no network thread is started.
+    HEADLESS = environ.get("SCPY_HEADLESS", "").lower() not in ["", "0", "false"]
+
     # Terminal output colors
     # ----------------------
     if is_terminal():
@@ -34,21 +37,29 @@ def setup_environment():
 
     # Are we running pytest?
     # ----------------------
-    if is_pytest or is_docs:
+    if is_pytest or is_docs or HEADLESS:
         # if we are testing or doc building we like a silent work with no figure popup!
         NO_DISPLAY = True
 
-    # Matplotlib setup
-    # -----------------
-    if NO_DISPLAY:
-        # Setup for pytest and sphinx
-        mpl.use("template", force=True)
-
+    if is_pytest or is_docs:
         # set test file and folder in environment
         environ["TEST_FILE"] = "irdata/nh4y-activation.spg"
         environ["TEST_FOLDER"] = "irdata/subdir"
         environ["TEST_NMR_FOLDER"] = "nmrdata/bruker/tests/nmr/topspin_2d"
 
+    # Matplotlib setup
+    # -----------------
+    if HEADLESS:
+        # matplotlib is not imported now, but it will use a non-interactive backend
+        # (unless another one is set by the user)
+        environ.setdefault("MPLBACKEND", "template" if is_pytest or is_docs else "agg")
+
+    elif NO_DISPLAY:
+        # Setup for pytest and sphinx
+        import matplotlib as mpl
+
+        mpl.use("template", force=True)
+
     elif is_notebook():  # pragma: no cover
         IP = get_ipython()
         try:
@@ -81,11 +92,13 @@ def setup_environment():
 
     # Initialize matplotlib styles and fonts
     # --------------------------------------
-    setup_mpl()
+    if not HEADLESS:
+        # (in headless mode, this is done at the first plot)
+        setup_mpl()
 
     SCPY_STARTUP_LOGLEVEL = environ.get("SCPY_STARTUP_LOGLEVEL", None)
 
     if SCPY_STARTUP_LOGLEVEL is None:
         SCPY_STARTUP_LOGLEVEL = "DEBUG" if is_pytest else "INFO"
 
-    return NO_DISPLAY, SCPY_STARTUP_LOGLEVEL, is_pytest
+    return NO_DISPLAY, SCPY_STARTUP_LOGLEVEL, is_pytest, HEADLESS
@@ -40,6 +40,10 @@ from spectrochempy.utils.constants import TYPE_BOOL
 from spectrochempy.utils.file import check_filename_to_save
 from spectrochempy.utils.file import pathclean
 from spectrochempy.utils.jsonutils import json_encoder
+from spectrochempy.utils.numutils import LinearRange
+from spectrochempy.utils.zip import SCP_COMMENT_PREFIX
+from spectrochempy.utils.zip import SCP_FORMAT_VERSION
+from spectrochempy.utils.zip import DeferredArray
 from spectrochempy.utils.zip import ScpFile
 
 # Constants
@@ -279,6 +283,19 @@ class NDIO(tr.HasTraits):
         ----------------
         content : str, optional
              The optional content of the file(s) to be loaded as a binary string.
+        mmap_mode : {None, 'r', 'c'}, optional, default: None
+            Memory-mapping mode used for the arrays stored without compression
+            (see `numpy.memmap` ). In copy-on-write mode ('c'), the arrays are read
+            from the disk only when accessed, and modifications are never written
+            back to the file. By default, the arrays are read in memory and the file
+            is closed.
+        lazy : bool, optional, default: False
+            If True, the data array of a dataset is not read: only the coordinates,
+            mask and metadata are loaded. Slicing the returned dataset reads only the
+            selected part of the data from the file, while the whole data array is
+            read when an operation needs it (see `NDDataset.is_deferred` ).
+            Ignored for projects, for files written in the previous scp format and
+            when the content of the file is given.
 
         See Also
         --------
@@ -289,6 +306,10 @@ class NDIO(tr.HasTraits):
         -----
         Adapted from `numpy.load` .
 
+        With `mmap_mode` or `lazy` , the file remains open (or memory-mapped) as long
+        as the arrays read from it exist. On Windows, it can then not be replaced,
+        *e.g.,* by saving a dataset with the same filename.
+
         Examples
         --------
         >>> nd1 = scp.read('irdata/nh4y-activation.spg')
@@ -302,8 +323,18 @@ class NDIO(tr.HasTraits):
         >>> from spectrochempy import *
         >>> nd2 = NDDataset.load(f)
 
+        Load only the coordinates and metadata, the data being read only when needed:
+
+        >>> nd3 = scp.load(f, lazy=True)
+        >>> nd3.is_deferred
+        True
+        >>> row = nd3[10]
+        >>> nd3.is_deferred
+        True
+
         """
         content = kwargs.get("content")
+        mmap_mode = kwargs.get("mmap_mode")
 
         if content:
             fid = io.BytesIO(content)
@@ -322,7 +353,7 @@ class NDIO(tr.HasTraits):
 
         # get zip file
         try:
-            obj = ScpFile(fid)
+            obj = ScpFile(fid, mmap_mode=mmap_mode)
         except FileNotFoundError as e:
             raise exceptions.SpectroChemPyError(
                 f"File {filename} doesn't exist!",
@@ -334,14 +365,22 @@ class NDIO(tr.HasTraits):
                 ) from e
             raise exceptions.SpectroChemPyError("Undefined error!") from e
 
-        js = obj[obj.files[0]]
+        # the file is closed once the members are read (the memory-mapped and
+        # deferred arrays keep their own handle on the file)
+        with obj:
+            if kwargs.get("lazy", False) and cls.__name__ == "NDDataset":
+                # Do not read the dataset data: look for the corresponding npy member
+                # in the (not decoded) json content
+                ref = json.loads(obj.zip.read(obj.files[0])).get("data")
+                if isinstance(ref, dict) and "npy" in ref:
+                    obj.deferred.add(ref["npy"])
+
+            js = obj[obj.files[0]]
         if kwargs.get("json", False):
             return js
 
         new = cls.loads(js)
 
-        fid.close()
-
         if filename:
             filename = pathclean(filename)
             new._filename = filename
@@ -441,6 +480,11 @@ class NDIO(tr.HasTraits):
                     elif key in ["_history"]:
                         obj.history = val
 
+                    elif key == "_data" and isinstance(
+                        val, DeferredArray | LinearRange
+                    ):
+                        obj._set_deferred(val)
+
                     else:
                         if isinstance(val, TYPE_BOOL) and key == "_mask":
                             val = np.bool_(val)
@@ -460,34 +504,64 @@ class NDIO(tr.HasTraits):
 
     def dump(self, filename: str | pathlib.Path, **kwargs: Any) -> pathlib.Path:
         """
-        Save the current object into compressed native spectrochempy format.
+        Save the current object into native spectrochempy format.
+
+        The object metadata are written as a json member of a zip archive, while
+        the arrays (data, mask, coordinates...) are written as separate ` .npy`
+        members. By default, these members are not compressed, so that they can be
+        memory-mapped when the file is loaded.
 
         Parameters
         ----------
         filename: str of  `pathlib` object
             File name where to save the current object.
+        **kwargs
+            Optional keyword parameters (see Other Parameters).
+
+        Other Parameters
+        ----------------
+        compress : bool, optional, default: False
+            If True, the ` .npy` members are deflated. This produces smaller files,
+            but the arrays can then no longer be memory-mapped on loading.
 
         """
-        # Stage data in a temporary file on disk, before writing to zip.
         import tempfile
-        import zipfile
 
-        # prepare the json data
-        # try:
-        js = self.dumps(encoding="base64")
-        # except Exception as e:
-        #     warn(str(e))
+        filename = pathclean(filename)
 
-        # write in a temp file
-        _, tmpfile = tempfile.mkstemp(suffix="-spectrochempy")
-        tmpfile = pathclean(tmpfile)
-        tmpfile.write_bytes(js.encode("utf-8"))
+        # prepare the json data, the arrays being collected separately
+        arrays = {}
+        js = json.dumps(
+            json_encoder(self, encoding="npy", arrays=arrays), indent=2
+        ).encode("utf-8")
+
+        compression = (
+            zipfile.ZIP_DEFLATED
+            if kwargs.get("compress", False)
+            else zipfile.ZIP_STORED
+        )
 
-        # compress and write zip file
-        zipf = zipfile_factory(filename, mode="w", compression=zipfile.ZIP_DEFLATED)
-        zipf.write(tmpfile, arcname=f"{self.name}.json")
-        # tmpfile.unlink()
-        zipf.close()
+        # Write in a temporary file of the destination directory, which is then
+        # renamed: an existing file is thus never truncated while it could still be
+        # memory-mapped by a previously loaded object.
+        fd, tmpfile = tempfile.mkstemp(suffix="-spectrochempy", dir=filename.parent)
+        os.close(fd)
+        try:
+            with zipfile_factory(tmpfile, mode="w") as zipf:
+                zipf.comment = SCP_COMMENT_PREFIX + str(SCP_FORMAT_VERSION).encode()
+                # the json member must stay the first one of the archive
+                zipf.writestr(
+                    f"{self.name}.json", js, compress_type=zipfile.ZIP_DEFLATED
+                )
+                for key, array in arrays.items():
+                    info = zipfile.ZipInfo(key, date_time=(1980, 1, 1, 0, 0, 0))
+                    info.compress_type = compression
+                    with zipf.open(info, mode="w", force_zip64=True) as f:
+                        np.lib.format.write_array(f, array, allow_pickle=False)
+            os.replace(tmpfile, filename)
+        except BaseException:
+            pathclean(tmpfile).unlink(missing_ok=True)
+            raise
 
         self.filename = filename
         self.name = filename.stem
@@ -495,4 +569,15 @@ class NDIO(tr.HasTraits):
         return filename
 
 
-load = NDIO.load  # make load accessible directly from the scp API
+def load(filename: str | pathlib.Path | BinaryIO, **kwargs: Any) -> Any:
+    # make load accessible directly from the scp API
+    # (a project is returned for .pscp files, a dataset otherwise)
+    from spectrochempy.core.dataset.nddataset import NDDataset
+    from spectrochempy.core.project.project import Project
+
+    suffix = pathclean(filename).suffix if not hasattr(filename, "read") else ""
+    klass = Project if suffix == SCPY_SUFFIX["Project"] else NDDataset
+    return klass.load(filename, **kwargs)
+
+
+load.__doc__ = NDIO.load.__doc__
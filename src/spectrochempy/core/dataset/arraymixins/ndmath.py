@@ -15,7 +15,6 @@ from warnings import catch_warnings
 
 # Third-party imports
 import numpy as np
-from quaternion import as_float_array
 
 # Local imports
 from spectrochempy.application.application import error_
@@ -2780,8 +2779,10 @@ class NDMath:
         f: Callable,
         inputs: Sequence[ArrayLike],
         isufunc: bool = False,
+        inplace: bool = False,
     ) -> tuple[np.ndarray, str | None, np.ndarray, str | None]:
-        # Achieve an operation f on the objs
+        # Achieve an operation f on the objs (in place on the data of the first one if
+        # `inplace` is True)
 
         fname = f.__name__
 
@@ -2798,14 +2799,16 @@ class NDMath:
             is_quaternion,
         ) = self._preprocess_op_inputs(fname, inputs)
 
-        # Now we can proceed
+        # Now we can proceed.
+        # The operands are not copied: they must not be modified below, except the
+        # first one for in-place operations (see `_inplace_binary_op` )
 
-        obj = cpy.copy(inputs.pop(0))
+        obj = inputs.pop(0)
         objtype = objtypes.pop(0)
 
         other = None
         if inputs:
-            other = cpy.copy(inputs.pop(0))
+            other = inputs.pop(0)
             othertype = objtypes.pop(0)
 
         # Is our first object a NDdataset
@@ -2813,44 +2816,73 @@ class NDMath:
         is_dataset = objtype == "NDDataset"
 
         # Get the underlying data: If one of the input is masked, we will work with
-        # masked array
-        d = obj._umasked(obj.data, obj.mask) if is_masked and is_dataset else obj.data
-
-        # Do we have units?
-        # We create a quantity q that will be used for unit calculations (without
-        # dealing with the whole object)
-        def reduce_(magnitude):
-            if hasattr(magnitude, "dtype"):
-                if magnitude.dtype in TYPE_COMPLEX:
-                    magnitude = magnitude.real
-                elif magnitude.dtype == np.quaternion:
-                    magnitude = as_float_array(magnitude)[..., 0]
-                magnitude = magnitude.max()
-            return magnitude
-
-        q = reduce_(d)
-        if hasattr(obj, "units") and obj.units is not None:
-            q = Quantity(q, obj.units)
-            q = q.values if hasattr(q, "values") else q  # case of nddataset, coord,
+        # masked array (sharing the data of obj)
+        d = obj.data
+        if inplace and isinstance(d, np.ndarray) and not d.flags.writeable:
+            # the data are read-only (e.g., the cached rounded data of coordinates):
+            # the operation is done on a copy
+            d = d.copy()
+        if is_masked and is_dataset:
+            d = np.ma.MaskedArray(d, mask=obj.mask, copy=False)
+
+        # Units of the first object (the units of the result and the conversion
+        # factors of the other operands are obtained from `_units_rule` ).
+        units = obj.units if hasattr(obj, "units") else None
 
         # Now we analyse the other operands
         # ---------------------------------------------------------------------------
         args = []
-        otherqs = []
+        others = []
 
         # If other is None, then it is a unary operation we can pass the following
 
         if other is not None:
-            # First the units may require to be compatible, and if thet are sometimes
-            # they may need to be rescales
-            if (
-                othertype in ["NDDataset", "Coord", "Quantity"]
-                and not other.unitless
-                and hasattr(obj, "units")
-                and compatible_units
-            ):
-                # adapt the other units to that of object
-                other.ito(obj.units)
+            other_units, magnitude = _units_and_magnitude(other, othertype)
+            exponent = None
+            if fname in ["pow", "power", "float_power"] and units is not None:
+                # the units of the result depend on the exponent value (the largest
+                # one for an array of exponents)
+                exponent = _reduce_magnitude(magnitude)
+                exponent = exponent.item() if hasattr(exponent, "item") else exponent
+            others.append((other_units, _probe_dtype(magnitude), exponent))
+
+        units, factors = self._units_rule(
+            f,
+            fname,
+            compatible_units,
+            remove_units,
+            units,
+            _probe_dtype(d),
+            tuple(others),
+        )
+
+        if other is not None:
+            # First the units may require to be compatible, and if they are sometimes
+            # they may need to be rescaled
+            factor = factors[0]
+            if factor is None:
+                # not a simple scaling (offset units, absorbance/transmittance ...):
+                # adapt the other units to that of object (on a copy) and let pint
+                # determine the units of the result on the actual values, as the
+                # operation may not be allowed (e.g., the addition of offset units)
+                if othertype in ["NDDataset", "Coord", "Quantity"]:
+                    other = other.to(obj.units)
+                other_units, magnitude = _units_and_magnitude(other, othertype)
+                units, _ = self._units_rule.__wrapped__(
+                    f,
+                    fname,
+                    compatible_units,
+                    remove_units,
+                    obj.units,
+                    _probe_dtype(d),
+                    (
+                        (
+                            other_units,
+                            _probe_dtype(magnitude),
+                            _reduce_magnitude(magnitude),
+                        ),
+                    ),
+                )
 
             # If all inputs are datasets BUT coordset mismatch.
             if (
@@ -2926,7 +2958,7 @@ class NDMath:
             if othertype in ["NDDataset", "Coord"]:
                 # mask?
                 if is_masked:
-                    arg = other._umasked(other.data, other.mask)
+                    arg = np.ma.MaskedArray(other.data, mask=other.mask, copy=False)
                 else:
                     arg = other.data
 
@@ -2936,88 +2968,10 @@ class NDMath:
                 # if it is a quantity than separate units and magnitude
                 arg = other.m if isinstance(other, Quantity) else other
 
+            if factor is not None and factor != 1:
+                arg = arg * factor
             args.append(arg)
 
-            otherq = reduce_(arg)
-
-            if hasattr(other, "units") and other.units is not None:
-                otherq = Quantity(otherq, other.units)
-                otherq = (
-                    otherq.values if hasattr(otherq, "values") else otherq
-                )  # case of nddataset, coord,
-            otherqs.append(otherq)
-
-        # Calculate the resulting units (and their compatibility for such operation)
-        # ------------------------------------------------------------------------------
-        # Do the calculation with the units to find the final one
-
-        def check_require_units(fname, _units):
-            if fname in self.__require_units:
-                requnits = self.__require_units[fname]
-                if (
-                    requnits in (DIMENSIONLESS, "radian", "degree")
-                    and _units.dimensionless
-                ):
-                    # this is compatible:
-                    _units = DIMENSIONLESS
-                else:
-                    if requnits == DIMENSIONLESS:
-                        s = "DIMENSIONLESS input"
-                    else:
-                        s = f"`{requnits}` units"
-                    raise DimensionalityError(
-                        _units,
-                        requnits,
-                        extra_msg=f"\nFunction `{fname}` requires {s}",
-                    )
-
-            return _units
-
-        # define an arbitrary quantity `q` on which to perform the units calculation
-
-        units = UNITLESS
-
-        if not remove_units:
-            if hasattr(q, "units"):
-                # q = q.m * check_require_units(fname, q.units)
-                q = q.to(check_require_units(fname, q.units))
-
-            for i, otherq in enumerate(otherqs[:]):
-                if hasattr(otherq, "units"):
-                    otherqm = otherq.m.data if np.ma.isMaskedArray(otherq) else otherq.m
-                    otherqs[i] = otherqm * check_require_units(fname, otherq.units)
-                elif fname in [
-                    "add",
-                    "sub",
-                    "iadd",
-                    "isub",
-                    "and",
-                    "xor",
-                    "or",
-                ] and hasattr(q, "units"):
-                    otherqs[i] = otherq * q.units  # take the unit of the first obj
-
-            # some functions are not handled by pint regardings units, try to solve this
-            # here
-            f_u = f
-            if compatible_units:
-                f_u = np.add  # take a similar function handled by pint
-
-            try:
-                res = f_u(q, *otherqs)
-
-            except Exception as e:
-                if not otherqs:
-                    # in this case easy we take the units of the single argument except
-                    # for some function where units
-                    # can be dropped
-                    res = q
-                else:
-                    raise e
-
-            if hasattr(res, "units"):
-                units = res.units
-
         # perform operation on magnitudes
         # ------------------------------------------------------------------------------
         if isufunc:
@@ -3134,7 +3088,7 @@ class NDMath:
                 inputs[0] = np.negative(inputs[0])
             elif fname in ["pow"]:
                 fname = "exp"
-                inputs[0] *= np.log(inputs[1])
+                inputs[0] = inputs[0] * np.log(inputs[1])
                 inputs = inputs[:1]
             else:
                 raise NotImplementedError
@@ -3175,8 +3129,18 @@ class NDMath:
             objs = [self, other]
             fm, objs = self._check_order(fname, objs)
 
-            data, units, mask, returntype = self._op(fm, objs)
-            self._data = data
+            if objs[0] is self:
+                # the operation is done in place on the data of self
+                self._make_writeable()
+            else:
+                # the operands have been swapped: use the not in-place operator, in
+                # order not to modify other
+                if fm.__name__.startswith("i"):
+                    fm = _get_op(fm.__name__[1:])
+
+            data, units, mask, returntype = self._op(fm, objs, inplace=objs[0] is self)
+            if not (np.may_share_memory(data, self._data) and data.shape == self.shape):
+                self._data = data
             self._units = units
             self._mask = mask
 
@@ -3185,16 +3149,16 @@ class NDMath:
         return func
 
     def _op_result(self, data, units=None, mask=None, history=None, returntype=None):
-        # make a new NDArray resulting of some operation
+        # make a new NDArray resulting of some operation.
+        # data is a newly computed array (see `_op` ): it is not copied
 
-        new = self.copy()
+        new = self._copy_metadata()
+        new._data = data
         if returntype == "NDDataset" and not new._implements("NDDataset"):
             from spectrochempy.core.dataset.nddataset import NDDataset
 
             new = NDDataset(new)
 
-        new._data = cpy.deepcopy(data)
-
         # update the attributes
         new._units = cpy.copy(units)
         if mask is not None and np.any(mask != NOMASK):
@@ -3208,6 +3172,194 @@ class NDMath:
 
         return new
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _units_rule(f, fname, compatible_units, remove_units, units, dtype, others):
+        # Return the units of the result of the operation `f` and the factors to
+        # apply to the other operands to convert them to the units of the first one.
+        # `others` is a tuple of (units, dtype, value) for the other operands, where
+        # value is the magnitude used in the calculation (1 if None).
+        #
+        # The result depends only on the units and types of the operands (and on the
+        # exponent value for power functions), so that it is computed by pint on scalar
+        # quantities and cached (see `units_cache_info` ).
+
+        def check_require_units(fname, _units):
+            if fname in NDMath.__require_units:
+                requnits = NDMath.__require_units[fname]
+                if (
+                    requnits in (DIMENSIONLESS, "radian", "degree")
+                    and _units.dimensionless
+                ):
+                    # this is compatible:
+                    _units = DIMENSIONLESS
+                else:
+                    if requnits == DIMENSIONLESS:
+                        s = "DIMENSIONLESS input"
+                    else:
+                        s = f"`{requnits}` units"
+                    raise DimensionalityError(
+                        _units,
+                        requnits,
+                        extra_msg=f"\nFunction `{fname}` requires {s}",
+                    )
+
+            return _units
+
+        # define an arbitrary quantity `q` on which to perform the units calculation
+        q = np.ones((), dtype=dtype)[()]
+        if units is not None:
+            q = Quantity(q, units)
+
+        factors = []
+        otherqs = []
+        for other_units, other_dtype, value in others:
+            factor = 1
+            if compatible_units and other_units is not None and other_units != units:
+                if units is None:
+                    # units of other are just dropped
+                    other_units = None
+                else:
+                    factor = _conversion_factor(other_units, units)
+                    other_units = units
+            factors.append(factor)
+
+            otherq = np.ones((), dtype=other_dtype)[()] if value is None else value
+            if other_units is not None:
+                otherq = Quantity(otherq, other_units)
+            otherqs.append(otherq)
+
+        result_units = UNITLESS
+
+        if not remove_units:
+            if hasattr(q, "units"):
+                q = q.to(check_require_units(fname, q.units))
+
+            for i, otherq in enumerate(otherqs[:]):
+                if hasattr(otherq, "units"):
+                    otherqs[i] = otherq.m * check_require_units(fname, otherq.units)
+                elif fname in [
+                    "add",
+                    "sub",
+                    "iadd",
+                    "isub",
+                    "and",
+                    "xor",
+                    "or",
+                ] and hasattr(q, "units"):
+                    otherqs[i] = otherq * q.units  # take the unit of the first obj
+
+            # some functions are not handled by pint regardings units, try to solve this
+            # here
+            f_u = f
+            if compatible_units:
+                f_u = np.add  # take a similar function handled by pint
+
+            try:
+                with catch_warnings(record=True):
+                    res = f_u(q, *otherqs)
+
+            except Exception as e:
+                if not otherqs:
+                    # in this case easy we take the units of the single argument except
+                    # for some function where units
+                    # can be dropped
+                    res = q
+                else:
+                    raise e
+
+            if hasattr(res, "units"):
+                result_units = res.units
+
+        return result_units, tuple(factors)
+
+
+# --------------------------------------------------------------------------------------
+# UNITS CALCULATIONS
+# --------------------------------------------------------------------------------------
+def _probe_dtype(magnitude):
+    # Type of the scalar representing `magnitude` in the units calculations
+    dtype = getattr(magnitude, "dtype", None)
+    if dtype is None:
+        dtype = np.asarray(magnitude).dtype
+    if dtype in TYPE_COMPLEX or dtype == np.quaternion:
+        # only the real part is used
+        dtype = np.dtype(np.float64)
+    return dtype
+
+
+def _units_and_magnitude(other, othertype):
+    # Units and magnitude of an operand (a bare unit acts as a quantity of magnitude 1)
+    if othertype in ["NDDataset", "Coord"]:
+        return other.units, other.data
+    if othertype == "Quantity":
+        return other.units, other.m
+    if othertype == "Unit":
+        return other, 1
+    return None, other
+
+
+def _reduce_magnitude(magnitude):
+    # Scalar representing `magnitude` in the units calculations on actual values (the
+    # largest value of the real part)
+    if hasattr(magnitude, "dtype"):
+        if magnitude.dtype in TYPE_COMPLEX:
+            magnitude = magnitude.real
+        elif magnitude.dtype == np.quaternion:
+            magnitude = quat_as_complex_array(magnitude)[0].real
+        magnitude = magnitude.max()
+    return magnitude
+
+
+@functools.lru_cache(maxsize=256)
+def _conversion_factor(src, dst):
+    # Factor to convert values from units `src` to units `dst` , or None if the
+    # conversion is not a simple scaling (offset units, absorbance/transmittance ...)
+    special = ["transmittance", "absolute_transmittance", "absorbance"]
+    if f"{src: P}" in special or f"{dst: P}" in special:
+        return None
+    one = Quantity(1.0, src)
+    if not (one._is_multiplicative and Quantity(1.0, dst)._is_multiplicative):
+        return None
+    try:
+        return float(one.to(dst).magnitude)
+    except DimensionalityError:
+        return None
+
+
+def units_cache_info():
+    """
+    Statistics of the cache used for the units calculations in math operations.
+
+    The units of the result of a math operation on `NDDataset` or `Coord` objects,
+    and the factors used to convert the operands to compatible units, depend only on
+    the operation and on the units of the operands. They are thus computed once and
+    cached.
+
+    Returns
+    -------
+    `~functools._CacheInfo`
+        Named tuple with ``hits`` , ``misses`` , ``maxsize`` and ``currsize``
+        fields.
+
+    See Also
+    --------
+    units_cache_clear : Clear the cache.
+    """
+    return NDMath._units_rule.cache_info()
+
+
+def units_cache_clear():
+    """
+    Clear the cache used for the units calculations in math operations.
+
+    See Also
+    --------
+    units_cache_info : Statistics of the cache.
+    """
+    NDMath._units_rule.cache_clear()
+    _conversion_factor.cache_clear()
+
 
 # --------------------------------------------------------------------------------------
 # ARITHMETIC ON NDArray
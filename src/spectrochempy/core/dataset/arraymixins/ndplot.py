@@ -30,23 +30,23 @@ Handles units and coordinates from NDDatasets automatically.
 
 __all__ = ["plot"]
 
+from typing import TYPE_CHECKING
 from typing import Any
 
-import matplotlib as mpl
 import traitlets as tr
 from cycler import cycler
-from matplotlib import pyplot as plt
-from matplotlib.colors import to_rgba
-from mpl_toolkits.axes_grid1 import make_axes_locatable
 
 from spectrochempy.application.application import error_
 from spectrochempy.application.preferences import preferences as prefs
 from spectrochempy.utils.docutils import docprocess
-from spectrochempy.utils.mplutils import _Axes
-from spectrochempy.utils.mplutils import _Axes3D
-from spectrochempy.utils.mplutils import get_figure
 from spectrochempy.utils.optional import import_optional_dependency
+from spectrochempy.utils.traits import LazyInstance
 
+if TYPE_CHECKING:
+    from spectrochempy.utils.mplutils import _Axes
+
+# matplotlib (and the axes classes of mplutils) are imported at the first plot, so
+# that datasets can be used without loading them (e.g., in headless mode).
 go = import_optional_dependency("plotly.graph_objects", errors="ignore")
 HAS_PLOTLY = go is not None
 
@@ -76,20 +76,23 @@ class NDPlot(tr.HasTraits):
     """
 
     # Trait definitions
-    _ax = tr.Instance(_Axes, allow_none=True)
+    _ax = LazyInstance("spectrochempy.utils.mplutils._Axes", allow_none=True)
     _fig = (
-        tr.Union((tr.Instance(plt.Figure), tr.Instance(go.Figure)), allow_none=True)
+        tr.Union(
+            (LazyInstance("matplotlib.figure.Figure"), tr.Instance(go.Figure)),
+            allow_none=True,
+        )
         if HAS_PLOTLY
-        else tr.Instance(plt.Figure, allow_none=True)
+        else LazyInstance("matplotlib.figure.Figure", allow_none=True)
     )
-    _ndaxes = tr.Dict(tr.Instance(_Axes))
+    _ndaxes = tr.Dict(LazyInstance("spectrochempy.utils.mplutils._Axes"))
 
     @docprocess.get_sections(
         base="plot",
         sections=["Parameters", "Other Parameters", "Returns"],
     )
     @docprocess.dedent
-    def plot(self, method: str | None = None, **kwargs: Any) -> _Axes | None:
+    def plot(self, method: str | None = None, **kwargs: Any) -> "_Axes | None":
         """
         Plot the dataset using the specified method.
 
@@ -226,7 +229,7 @@ class NDPlot(tr.HasTraits):
 
         return _plotter(**kwargs)
 
-    def _plot_generic(self, **kwargs: Any) -> _Axes | None:
+    def _plot_generic(self, **kwargs: Any) -> "_Axes | None":
         # Choose plotting method based on dataset dimensionality
         # Args:
         #    **kwargs: Plot options
@@ -255,6 +258,8 @@ class NDPlot(tr.HasTraits):
     def close_figure(self):
         """Close a Matplotlib figure associated to this dataset."""
         if self._fig is not None:
+            from matplotlib import pyplot as plt
+
             plt.close(self._fig)
 
     def _figure_setup(
@@ -270,6 +275,15 @@ class NDPlot(tr.HasTraits):
         #    **kwargs: Additional options
         # Returns:
         #    Method name to use for plotting
+        import matplotlib as mpl
+        from matplotlib import pyplot as plt
+        from matplotlib.colors import to_rgba
+        from mpl_toolkits.axes_grid1 import make_axes_locatable
+
+        from spectrochempy.utils.mplutils import _Axes
+        from spectrochempy.utils.mplutils import _Axes3D
+        from spectrochempy.utils.mplutils import get_figure
+
         if not method:
             method = prefs.method_2D if ndim == 2 else prefs.method_1D
 
@@ -540,6 +554,8 @@ class NDPlot(tr.HasTraits):
     @ndaxes.setter
     def ndaxes(self, axes):
         # we assume that the axes have a name
+        from spectrochempy.utils.mplutils import _Axes
+
         if isinstance(axes, list):
             # a list a axes have been passed
             for ax in axes:
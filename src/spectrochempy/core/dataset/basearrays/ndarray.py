@@ -18,6 +18,7 @@ import traitlets as tr
 
 from spectrochempy.application.application import error_
 from spectrochempy.application.application import info_
+from spectrochempy.application.preferences import preferences
 from spectrochempy.core.units import DimensionalityError
 from spectrochempy.core.units import Quantity
 from spectrochempy.core.units import Unit
@@ -160,6 +161,10 @@ class NDArray(tr.HasTraits):
     _units = tr.Instance(Unit, allow_none=True)
     _meta = tr.Instance(Meta, allow_none=True)
 
+    # Deferred data (e.g., a `DeferredArray` proxy on an array stored in a file)
+    # which are read only when needed
+    _deferred = tr.Any(None, allow_none=True)
+
     # Region of interest
     _roi = tr.List(allow_none=True)
 
@@ -193,7 +198,7 @@ class NDArray(tr.HasTraits):
         if data is not None:
             self.data = data
 
-        if data is None or self.data is None:
+        if data is None or (self._deferred is None and self._data is None):
             self._data = None
             self._dtype = None  # default
 
@@ -313,7 +318,7 @@ class NDArray(tr.HasTraits):
 
         return eq
 
-    def __getitem__(self, items, return_index=False):
+    def __getitem__(self, items, return_index=False, view=None):
         if isinstance(items, list):
             # Special case of fancy indexing
             items = (items,)
@@ -358,12 +363,30 @@ class NDArray(tr.HasTraits):
             else:
                 raise e
 
-        # init returned object
-        new = self if inplace else self.copy()
+        # init returned object: only the metadata are copied, as data and mask are
+        # sliced below
+        if view is None:
+            view = preferences.view_slicing
+        new = self if inplace else self._copy_metadata()
 
         # slicing by index of all internal array
-        if new._data is not None:
-            udata = new.masked_data[keys]
+        deferred = self._deferred
+        has_data = deferred is not None or self._data is not None
+        if deferred is not None:
+            # deferred data: only the selected part of the array is read
+            udata = deferred[keys]
+            if self.is_masked:
+                udata = np.ma.masked_where(self._mask[keys], udata)
+            new._deferred = None
+            new._data = np.asarray(udata)
+        elif has_data:
+            # basic slicing returns views on the buffers of self, which are copied
+            # except in view mode (see `view` )
+            udata = self._data[keys]
+            if self.is_masked:
+                udata = np.ma.MaskedArray(udata, mask=self._mask[keys], copy=False)
+            if not view:
+                udata = udata.copy()
             new._data = np.asarray(udata)
 
         if self.is_labeled:
@@ -378,11 +401,18 @@ class NDArray(tr.HasTraits):
             )
             new = None
 
-        elif (self.data is not None) and hasattr(udata, "mask"):
+        elif has_data and hasattr(udata, "mask"):
             new._mask = udata.mask
         else:
             new._mask = NOMASK
 
+        if view and not inplace and new is not None and deferred is None:
+            # copy-on-write: the buffers shared with self are made read-only in the
+            # new object, and copied on its first modification (see `_make_writeable` )
+            for arr, base in ((new._data, self._data), (new._mask, self._mask)):
+                if isinstance(arr, np.ndarray) and np.may_share_memory(arr, base):
+                    arr.flags.writeable = False
+
         # for all other cases,
         # we do not need to take care of dims, as the shape is not reduced by
         # this operation. Only a subsequent squeeze operation will do it
@@ -418,6 +448,7 @@ class NDArray(tr.HasTraits):
 
     def __setitem__(self, items, value):
         keys = self._make_index(items)
+        self._make_writeable()
 
         if isinstance(value, bool | np.bool_ | MaskedConstant):
             # the mask is modified, not the data
@@ -495,12 +526,29 @@ class NDArray(tr.HasTraits):
             args = args[::-1]
         return args
 
+    def _copy_metadata(self):
+        # Copy of the object except for its data and mask, which are left unset.
+        new = make_new_object(self)
+        for attr in self._attributes_():
+            if attr in ["data", "mask"]:
+                continue
+            setattr(new, f"_{attr}", cpy.deepcopy(getattr(self, f"_{attr}")))
+        # initialize the mask, as the comparison of an undefined trait value with
+        # the mask array when it is later set is very slow.
+        new._mask = NOMASK
+        new.name = ""
+        return new
+
     def _cstr(self):
         out = f"{self._str_value()}\n{self._str_shape()}"
         return out.rstrip()
 
     @tr.default("_data")
     def _data_default(self):
+        if self._deferred is not None:
+            # first access to deferred data: the whole array is read
+            deferred, self._deferred = self._deferred, None
+            return np.asarray(deferred)
         return None
 
     @tr.validate("_data")
@@ -807,8 +855,20 @@ class NDArray(tr.HasTraits):
             keys.reverse()  # WARNING; assume 2D
         return tuple(keys)
 
+    def _make_writeable(self):
+        # Copy-on-write: data or mask shared with another object (read-only views
+        # obtained by slicing, see `view` ) are copied before being modified.
+        data = self._trait_values.get("_data")
+        if isinstance(data, np.ndarray) and not data.flags.writeable:
+            self._data = data.copy(order="K")
+        mask = self._trait_values.get("_mask")
+        if isinstance(mask, np.ndarray) and not mask.flags.writeable:
+            self._mask = mask.copy(order="K")
+
     @tr.default("_mask")
     def _mask_default(self):
+        if self._deferred is not None:
+            return np.zeros(self._deferred.shape).astype(bool)
         return NOMASK if self._data is None else np.zeros(self._data.shape).astype(bool)
 
     @tr.validate("_mask")
@@ -820,7 +880,11 @@ class NDArray(tr.HasTraits):
             return mask
 
         # mask will be stored in F_CONTIGUOUS mode, if data are in this mode
-        if not mask.flags["F_CONTIGUOUS"] and self._data.flags["F_CONTIGUOUS"]:
+        if (
+            self._deferred is None
+            and not mask.flags["F_CONTIGUOUS"]
+            and self._data.flags["F_CONTIGUOUS"]
+        ):
             mask = np.asfortranarray(mask)
             # no more need for an eventual copy
             self._copy = False
@@ -880,11 +944,11 @@ class NDArray(tr.HasTraits):
 
         size = ""
         if not self.is_empty:
-            if self.data is not None:
+            if self._deferred is not None or self.data is not None:
                 dtype = self.dtype
                 data = ""
                 if self._implements("Coord"):
-                    size = f" (size: {self.data.size})"
+                    size = f" (size: {self.size})"
                 units = " " + self._repr_units()
             else:
                 # no data but labels
@@ -910,6 +974,10 @@ class NDArray(tr.HasTraits):
         if data is None:
             return
 
+        if self._deferred is not None:
+            # the deferred data are replaced
+            self._deferred = None
+
         if isinstance(data, NDArray):
             # init data with data from another NDArray or NDArray's subclass
             # No need to check the validity of the data
@@ -969,10 +1037,19 @@ class NDArray(tr.HasTraits):
 
         return self[args] if not inplace else self[args, INPLACE]
 
+    def _set_deferred(self, deferred):
+        # Set data which will be read only when needed (see `is_deferred` ).
+        # `deferred` must have `shape` , `dtype` , `ndim` and `size` attributes,
+        # support indexing and conversion to array with `numpy.asarray` .
+        self._trait_values.pop("_data", None)
+        self._deferred = deferred
+
     @property
     def _squeeze_ndim(self):
         # The number of dimensions of the squeezed`data` array (Readonly property).
 
+        if self._deferred is not None:
+            return len([x for x in self._deferred.shape if x > 1])
         if self.data is None and self.is_labeled:
             return 1
         if self.data is None:
@@ -1010,6 +1087,9 @@ class NDArray(tr.HasTraits):
             return header + "{}".format(textwrap.indent("empty", " " * 9))
         if self.is_empty:
             return "{}".format(textwrap.indent("empty", " " * 9))
+        if self.is_deferred:
+            text = "[deferred, not yet read]"
+            return header.replace("...", f"\0{text}\0").rstrip()
 
         print_unit = True
         units = ""
@@ -1146,6 +1226,10 @@ class NDArray(tr.HasTraits):
 
         new = make_new_object(self)
         for attr in self._attributes_():
+            if attr == "data" and self._deferred is not None:
+                # deferred data are read-only: they can be shared
+                new._set_deferred(self._deferred)
+                continue
             try:
                 _attr = do_copy(getattr(self, f"_{attr}"))
                 setattr(new, f"_{attr}", _attr)
@@ -1242,6 +1326,8 @@ class NDArray(tr.HasTraits):
     @property
     def dtype(self):
         """Return the data type."""
+        if self._deferred is not None:
+            return self._deferred.dtype
         if self.is_empty:
             return None
         return self._data.dtype
@@ -1337,6 +1423,8 @@ class NDArray(tr.HasTraits):
     @property
     def has_data(self):
         """True if the `data` array is not empty."""
+        if self._deferred is not None:
+            return self._deferred.size > 0
         return not (self._data is None or self._data.size == 0)
 
     @property
@@ -1421,16 +1509,32 @@ class NDArray(tr.HasTraits):
 
         Readonly property (bool).
         """
+        if self._deferred is not None:
+            return self._deferred.size == 0
         return bool(
             (self._data is None or self._data.size == 0) and not self.is_labeled,
         )
 
+    @property
+    def is_deferred(self):
+        """
+        True if the `data` array has not yet been read - Readonly property (bool).
+
+        This is the case of datasets loaded with ``load(..., lazy=True)`` . Slicing
+        such a dataset reads only the selected part of the data, while any other
+        access to the `data` array reads it entirely.
+        """
+        return self._deferred is not None
+
     @property
     def is_labeled(self):
         """True if the `data` array have labels - Readonly property (bool)."""
         # label cannot exist for now for nD dataset - only 1D dataset, such
         # as Coord can be labelled.
-        if self._data is not None and self.ndim > 1:
+        if self._deferred is not None:
+            if self._deferred.ndim > 1:
+                return False
+        elif self._data is not None and self.ndim > 1:
             return False
         return bool(self._labels is not None and np.any(self.labels != ""))
 
@@ -1649,6 +1753,7 @@ class NDArray(tr.HasTraits):
                 f"mask will be combined with the "
                 f"current array's mask.",
             )
+            self._make_writeable()
             self._mask |= mask  # combine (is a copy!)
         elif self._copy:
             self._mask = mask.copy()
@@ -1693,6 +1798,8 @@ class NDArray(tr.HasTraits):
     @property
     def ndim(self):
         """The number of dimensions of the `data` array (Readonly property)."""
+        if self._deferred is not None:
+            return self._deferred.ndim
         if self.data is None and self.is_labeled:
             return 1
 
@@ -1734,6 +1841,8 @@ class NDArray(tr.HasTraits):
         For only labelled array, there is no data, so it is the 1D and the size is the
         size of the array of labels.
         """
+        if self._deferred is not None:
+            return self._deferred.shape
         if self.data is None and self.is_labeled:
             return (self.labels.shape[0],)
 
@@ -1750,6 +1859,8 @@ class NDArray(tr.HasTraits):
         The total number of data elements (possibly complex or hypercomplex
         in the array).
         """
+        if self._deferred is not None:
+            return self._deferred.size
         if self._data is None and self.is_labeled:
             return self.labels.shape[-1]
 
@@ -2221,3 +2332,51 @@ class NDArray(tr.HasTraits):
     def value(self):
         """Alias of `values` ."""
         return self.values
+
+    @property
+    def view(self):
+        """
+        Indexer returning views on the data instead of copies.
+
+        ``obj.view[items]`` is equivalent to ``obj[items]`` , except that the data and
+        mask of the returned object share the memory of the current object when
+        `items` are basic slices (integers, slices or ellipsis), instead of being
+        copied. Only the small attributes of the object (metadata, coordinates, ...)
+        are copied.
+
+        The shared buffers are read-only in the returned object. They are copied
+        (copy-on-write) the first time the returned object is modified with
+        item assignment or masking, so that the current object is never modified
+        this way. On the contrary, modifications of the current object are seen by
+        its views, as for numpy views.
+
+        This behavior can be made the default for all slicing operations by setting
+        the ``view_slicing`` preference to True.
+
+        Examples
+        --------
+        >>> nd = scp.NDArray(np.arange(12.).reshape(3, 4))
+        >>> row = nd.view[1]
+        >>> np.shares_memory(row.data, nd.data)
+        True
+        >>> row[0, 0] = -1.
+        >>> nd.data[1, 0]
+        np.float64(4.0)
+        """
+        return _ViewIndexer(self)
+
+
+# ======================================================================================
+# Indexer for the view slicing
+# ======================================================================================
+class _ViewIndexer:
+    # Helper returned by `NDArray.view` : `obj.view[items]` slices `obj` without
+    # copying its data.
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __getitem__(self, items):
+        return self._obj.__getitem__(items, view=True)
@@ -167,19 +167,17 @@ class NDComplexArray(NDArray):
 
         (Readonly property).
         """
-        if self._data is None:
+        if self._deferred is None and self._data is None:
             return False
 
-        return (self._data.dtype in TYPE_COMPLEX) or (
-            self._data.dtype == typequaternion
-        )
+        return (self.dtype in TYPE_COMPLEX) or (self.dtype == typequaternion)
 
     @property
     def is_complex(self):
         """True if the 'data' are complex (Readonly property)."""
-        if self._data is None:
+        if self._deferred is None and self._data is None:
             return False
-        return self._data.dtype in TYPE_COMPLEX
+        return self.dtype in TYPE_COMPLEX
 
     @property
     def is_quaternion(self):
@@ -188,9 +186,9 @@ class NDComplexArray(NDArray):
 
         (Readonly property).
         """
-        if self._data is None:
+        if self._deferred is None and self._data is None:
             return False
-        return self._data.dtype == typequaternion
+        return self.dtype == typequaternion
 
     @property
     def is_interleaved(self):
@@ -199,7 +197,7 @@ class NDComplexArray(NDArray):
 
         (Readonly property).
         """
-        if self._data is None:
+        if self._deferred is None and self._data is None:
             return False
         return self._interleaved  # (self._data.dtype == typequaternion)
 
@@ -566,6 +564,8 @@ class NDComplexArray(NDArray):
         prefix = [""]
         if self.is_empty:
             return header + "{}".format(textwrap.indent("empty", " " * 9))
+        if self._deferred is not None:
+            return super()._str_value(sep=sep, ufmt=ufmt, header=header)
 
         if self.has_complex_dims:
             # we will display the different component separately
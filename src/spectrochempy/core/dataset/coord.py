@@ -13,6 +13,7 @@ import numpy as np
 import traitlets as tr
 
 from spectrochempy.application.application import error_
+from spectrochempy.application.application import info_
 from spectrochempy.core.dataset.arraymixins.ndmath import NDMath
 from spectrochempy.core.dataset.arraymixins.ndmath import _set_operators
 from spectrochempy.core.dataset.basearrays.ndarray import NDArray
@@ -22,11 +23,13 @@ from spectrochempy.utils.constants import INPLACE
 from spectrochempy.utils.constants import NOMASK
 from spectrochempy.utils.decorators import deprecated
 from spectrochempy.utils.docutils import docprocess
+from spectrochempy.utils.numutils import LinearRange
 from spectrochempy.utils.numutils import get_n_decimals
 from spectrochempy.utils.numutils import spacings
 from spectrochempy.utils.print import colored_output
 from spectrochempy.utils.typeutils import is_iterable
 from spectrochempy.utils.typeutils import is_number
+from spectrochempy.utils.typeutils import is_sequence
 
 
 # ======================================================================================
@@ -161,6 +164,13 @@ class Coord(NDMath, NDArray):
     _sigdigits = tr.Int(4)
     _rounding = tr.Bool(True)
 
+    # cache of the rounded data returned by the data property, and number of
+    # accesses to the data which used (hits) or computed (misses) it. These are plain
+    # attributes, not traits, as they are updated at each access.
+    _rounded_data = None
+    _data_cache_hits = 0
+    _data_cache_misses = 0
+
     # specific to NMR
     _larmor = tr.Instance(Quantity, allow_none=True)
 
@@ -235,17 +245,33 @@ class Coord(NDMath, NDArray):
         of significant digits given by the `sigdigits` parameters.
         If the spacing between the data is constant with the accuracy given by the
         significant digits, the data are thus linearized
-        and the `linear` attribute is set to True.
+        and the `linear` attribute is set to True. The data of linear coordinates are
+        stored as a `LinearRange` (first value, spacing and size), and the array is
+        only computed when needed.
+        The rounded array is computed at the first access and then kept until the
+        data, `sigdigits` or the rounding change: it is thus read-only.
 
         """
         data = super().data
         # now eventually round the data to the number of significant digits
         # for displaying (internally _data as its full precision)
         if data is not None and len(data) > 0 and self._rounding:
-            maxval = np.max(np.abs(data))
-            rounding = 3
-            nd = get_n_decimals(maxval, self.sigdigits) if maxval > 0 else rounding
-            data = np.around(data, max(nd, rounding))
+            if self._rounded_data is not None:
+                self._data_cache_hits += 1
+                return self._rounded_data
+            data = np.around(data, self._n_decimals(np.max(np.abs(data))))
+            # the rounded data are kept (read-only) until _data, sigdigits or rounding
+            # change. _data is replaced by a read-only view, so that it is copied
+            # before any modification (copy-on-write, see `_make_writeable` ), which
+            # clears the rounded data.
+            data.flags.writeable = False
+            self._rounded_data = data
+            self._data_cache_misses += 1
+            raw = self._trait_values.get("_data")
+            if isinstance(raw, np.ndarray) and raw.flags.writeable:
+                raw = raw.view()
+                raw.flags.writeable = False
+                self._trait_values["_data"] = raw
         return data
 
     @data.setter
@@ -267,6 +293,14 @@ class Coord(NDMath, NDArray):
             if self._linear:
                 return
 
+    @tr.default("_data")
+    def _data_default(self):
+        if isinstance(self._deferred, LinearRange):
+            # the array of linear coordinates is computed, but the range is kept (for
+            # copying, slicing, location and saving)
+            return np.asarray(self._deferred)
+        return super()._data_default()
+
     @property
     def default(self):
         # this is in case default is called on a coord, while it is a coordset property
@@ -484,8 +518,15 @@ class Coord(NDMath, NDArray):
 
     @property
     def is_descendant(self):
+        if isinstance(self._deferred, LinearRange):
+            return self._deferred.step < 0
         return (self._data[-1] - self._data[0]) < 0
 
+    @property
+    def is_deferred(self):
+        # the data of linear coordinates are computed, not read
+        return super().is_deferred and not isinstance(self._deferred, LinearRange)
+
     @property
     def dims(self):
         return ["x"]
@@ -610,8 +651,15 @@ class Coord(NDMath, NDArray):
         new = self if inplace else self.copy()
 
         # slicing by index of all internal array
-        if new.data is not None:
-            new._data = new.data[keys]
+        if isinstance(self._deferred, LinearRange):
+            # a slice of linear coordinates is a new range
+            data = self._deferred[keys]
+            if isinstance(data, LinearRange):
+                new._set_deferred(data)
+            else:
+                new._data = np.atleast_1d(data)
+        elif new._data is not None:
+            new._data = new._data[keys]
 
         if self.is_labeled:
             # case only of 1D dataset such as Coord
@@ -632,6 +680,13 @@ class Coord(NDMath, NDArray):
         new.name = self.name
         return new
 
+    def __setitem__(self, items, value):
+        super().__setitem__(items, value)
+        # _data was modified in place
+        self._rounded_data = None
+        if isinstance(self._deferred, LinearRange):
+            self._deferred = None
+
     def __str__(self):
         return repr(self)
 
@@ -687,6 +742,42 @@ class Coord(NDMath, NDArray):
     def __repr__(self):
         return self._repr_value().rstrip()
 
+    def _n_decimals(self, maxval):
+        # number of decimals used to round data whose largest absolute value is maxval
+        rounding = 3
+        nd = get_n_decimals(maxval, self.sigdigits) if maxval > 0 else rounding
+        return max(nd, rounding)
+
+    def _loc2index(self, loc, dim=None, *, units=None):
+        # for linear coordinates, the index is computed from the range instead of being
+        # searched in the data array
+        rng = self._deferred
+        if (
+            not isinstance(rng, LinearRange)
+            or rng.size == 0
+            or (units is not None and units != self.units)
+        ):
+            return super()._loc2index(loc, dim, units=units)
+
+        if is_number(loc):
+            # the limits are those of the (rounded) data
+            limits = np.array([rng[0], rng[-1]])
+            if self._rounding:
+                limits = np.around(limits, self._n_decimals(np.max(np.abs(limits))))
+            if loc > limits.max() or loc < limits.min():
+                info_(
+                    f"This coordinate ({loc}) is outside the axis limits "
+                    f"({limits.min()}-{limits.max()}).\n"
+                    f"The closest limit index is returned",
+                )
+                return rng.index(loc), "out_of_limits"
+            return rng.index(loc)
+
+        if is_sequence(loc):
+            return [rng.index(lo) for lo in loc]
+
+        return super()._loc2index(loc, dim, units=units)
+
     @staticmethod
     def _unittransform(new, units):
         oldunits = new.units
@@ -701,6 +792,14 @@ class Coord(NDMath, NDArray):
     # ----------------------------------------------------------------------------------
     # Events
     # ----------------------------------------------------------------------------------
+    @tr.observe("_data", "_deferred", "_sigdigits", "_rounding")
+    def _rounded_data_changed(self, change):
+        # the rounded data must be computed again at the next access
+        self._rounded_data = None
+        if change["name"] == "_data" and isinstance(self._deferred, LinearRange):
+            # the data were replaced: they are no longer given by the range
+            self._deferred = None
+
     @tr.observe(tr.All)
     def _anytrait_changed(self, change):
         # ex: change {
@@ -848,7 +947,10 @@ class Coord(NDMath, NDArray):
             # rounding will be made if necessary when reading the data property
             nd = get_n_decimals(np.diff(self._data).max(), self._sigdigits)
             data = np.around(data, nd)
-            self._data = np.linspace(data[0], data[-1], data.size)
+            # only the first value, the spacing and the size are stored
+            self._set_deferred(
+                LinearRange(data[0], (data[-1] - data[0]) / (data.size - 1), data.size)
+            )
             self._linear = True
         else:
             # from spectrochempy.application.application import debug_
@@ -889,6 +991,9 @@ class Coord(NDMath, NDArray):
 
         """
         units = self.units if self.units is not None else 1
+        if isinstance(self._deferred, LinearRange) and self.size > 1:
+            step = self._deferred.step
+            return np.around(step, get_n_decimals(step, 4)) * units
         if self.has_data:
             return spacings(self._data) * units
         return None
@@ -356,7 +356,9 @@ class NDDataset(NDMath, NDIO, NDPlot, NDComplexArray):
                 return self._coordset[items]
 
         # slicing
-        new, items = super().__getitem__(items, return_index=True)
+        new, items = super().__getitem__(
+            items, return_index=True, view=kwargs.get("view")
+        )
 
         if new is None:
             return None
@@ -734,12 +736,12 @@ class NDDataset(NDMath, NDIO, NDPlot, NDComplexArray):
 
                 if self._implements("NDDataset"):
                     idx = self._get_dims_index(coord.name)[0]  # idx in self.dims
-                    if size != self._data.shape[idx]:
+                    if size != self.shape[idx]:
                         raise ValueError(
                             f"the size of a coordinates array must be None or be equal"
                             f" to that of the respective `{coord.name}`"
                             f" data dimension but coordinate size={size} != data shape[{idx}]="
-                            f"{self._data.shape[idx]}",
+                            f"{self.shape[idx]}",
                         )
                 else:
                     pass  # bypass this checking for any other derived type (should be done in the subclass)
@@ -8,11 +8,15 @@
 __all__ = ["read", "read_dir"]  # , "read_remote"]
 __dataset_methods__ = __all__
 
+import functools
 import io
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from warnings import warn
 from zipfile import ZipFile
 
+import numpy as np
 import requests
 import yaml
 from traitlets import Dict
@@ -24,9 +28,12 @@ from traitlets import Unicode
 from spectrochempy.application.application import debug_
 from spectrochempy.application.application import info_
 from spectrochempy.application.application import warning_
+from spectrochempy.core.dataset.basearrays.ndarray import NOMASK
+from spectrochempy.core.dataset.coord import Coord
 from spectrochempy.core.readers.filetypes import registry
 from spectrochempy.processing.transformation.concatenate import concatenate
 from spectrochempy.processing.transformation.concatenate import stack
+from spectrochempy.utils.datetimeutils import utcnow
 from spectrochempy.utils.docutils import docprocess
 
 # from spectrochempy.utils.exceptions import DimensionsCompatibilityError
@@ -36,6 +43,7 @@ from spectrochempy.utils.file import get_directory_name
 from spectrochempy.utils.file import get_filenames
 from spectrochempy.utils.file import pathclean
 from spectrochempy.utils.objects import ScpObjectList
+from spectrochempy.utils.system import get_n_workers
 
 
 # --------------------------------------------------------------------------------------
@@ -189,39 +197,24 @@ class Importer(HasTraits):
 
         datasets = []
         files[key] = sorted(files[key])  # sort the files according their names
-        for filename in files[key]:
-            read_ = getattr(self, f"_read_{key[1:]}")
-
-            dataset = None
-            try:
-                # read locally or using url if filename is an url
-                dataset = read_(self.objtype(), filename, **kwargs)
-
-            except (FileNotFoundError, OSError) as exc:
-                # file was not found.
-                # it is an url we raise an error
-                local_only = kwargs.get("local_only", False)
-                if _is_url(filename) or local_only:
-                    raise (FileNotFoundError) from exc
-
-                # else, we try on github
-                try:
-                    # Try to get the file from github
-                    kwargs["read_method"] = read_
-                    info_(
-                        "File/directory not found locally: Attempt to download it from "
-                        "the GitHub repository `spectrochempy_data`...",
-                    )
-                    dataset = _read_remote(self.objtype(), filename, **kwargs)
-
-                except FileNotFoundError as exc:
-                    raise (FileNotFoundError) from exc
-
-                except Exception as e:
-                    warning_(str(e))
+        read_ = getattr(self, f"_read_{key[1:]}")
+
+        # read the files, possibly in parallel. The results are returned in the order
+        # of the files, and the errors are collected to be handled once all the files
+        # have been read
+        results = _map_files(
+            functools.partial(_read_file, read_, self.objtype, kwargs=kwargs),
+            files[key],
+            workers=kwargs.get("workers"),
+            executor=kwargs.get("executor", "thread"),
+        )
 
-            except Exception as e:
-                warning_(str(e))
+        notfound = None
+        for dataset, error in results:
+            if isinstance(error, FileNotFoundError):
+                notfound = notfound or error
+            elif error is not None:
+                warning_(str(error))
 
             if dataset is not None:
                 if not isinstance(dataset, list):
@@ -229,6 +222,9 @@ class Importer(HasTraits):
                 else:
                     datasets.extend(dataset)
 
+        if notfound is not None:
+            raise notfound
+
         if len(datasets) > 1:
             datasets = merge_datasets(datasets, **kwargs)
             # if kwargs.get("merge", False):
@@ -323,6 +319,11 @@ def read(*paths, **kwargs):
     download_only: `bool`, optional, default: `False`
         Used only when url are specified.  If True, only downloading and saving of the
         files is performed, with no attempt to read their content.
+    executor : `str`, optional, default: ``'thread'``
+        Type of pool used when ``workers`` is greater than 1: ``'thread'`` or
+        ``'process'`` . A pool of processes is generally faster for the file formats
+        requiring a lot of parsing, but the datasets read by the workers have to be
+        transferred to the main process.
     merge : `bool`, optional, default: `False`
         If `True` and several filenames or a ``directory`` have been provided as
         arguments, then a single `NDDataset` with merged dataset (stacked along the first
@@ -359,6 +360,12 @@ def read(*paths, **kwargs):
         so not downloaded.
     sortbydate : `bool`, optional, default: `True`
         Sort multiple filename by acquisition date.
+    workers : `int`, optional, default: 1
+        Number of files read in parallel. If `None` or 1, the files are read
+        sequentially. -1 means using all the available processors.
+        The result does not depend on the number of workers: the datasets are merged
+        in the same order, and the files which cannot be read are reported once all
+        the other files have been read.
 
     See Also
     --------
@@ -638,6 +645,56 @@ def _is_url(filename):
     )
 
 
+def _read_file(read_, objtype, filename, kwargs):
+    # Read a single file using the `read_` function.
+    # Return a tuple (dataset, error) where error is the exception raised (if any)
+    # so that the reading of the other files is not aborted.
+    kwargs = kwargs.copy()
+    try:
+        try:
+            # read locally or using url if filename is an url
+            return read_(objtype(), filename, **kwargs), None
+
+        except (FileNotFoundError, OSError) as exc:
+            # file was not found.
+            # it is an url we raise an error
+            local_only = kwargs.get("local_only", False)
+            if _is_url(filename) or local_only:
+                raise (FileNotFoundError) from exc
+
+            # else, we try on github
+            try:
+                # Try to get the file from github
+                kwargs["read_method"] = read_
+                info_(
+                    "File/directory not found locally: Attempt to download it from "
+                    "the GitHub repository `spectrochempy_data`...",
+                )
+                return _read_remote(objtype(), filename, **kwargs), None
+
+            except FileNotFoundError as exc:
+                raise (FileNotFoundError) from exc
+
+    except Exception as e:
+        return None, e
+
+
+def _map_files(func, filenames, workers=None, executor="thread"):
+    # Apply func to each filename, using a pool of `workers` threads or processes.
+    # The results are returned in the order of the filenames.
+    if executor not in ("thread", "process"):
+        raise ValueError(
+            f"executor must be 'thread' or 'process', not {executor!r}",
+        )
+    workers = get_n_workers(workers)
+    if workers == 1 or len(filenames) < 2:
+        return [func(filename) for filename in filenames]
+
+    pool = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+    with pool(max_workers=min(workers, len(filenames))) as p:
+        return list(p.map(func, filenames))
+
+
 def _openfid(filename, mode="rb", **kwargs):
     # Return a file ID
 
@@ -869,12 +926,7 @@ def merge_datasets(datasets, **kwargs):
 
         # Try to merge all datasets regardless of origin
         try:
-            if datasets[0].ndim == 1:
-                dataset = stack(datasets)
-                dataset.history = "Stacked from several files"
-            else:
-                dataset = concatenate(datasets, axis=0)
-                dataset.history = "Merged from several files"
+            dataset = _merge(datasets, kwargs.pop("sortbydate", True))
 
             # Set merged origin and name
             origins = sorted({ds.origin for ds in datasets if ds.origin})
@@ -883,9 +935,6 @@ def merge_datasets(datasets, **kwargs):
                 dataset.origin = merged_name
                 dataset.name = merged_name  # Set name to same as origin
 
-            if dataset.coordset is not None and kwargs.pop("sortbydate", True):
-                dataset.sort(dim=0, inplace=True)
-
             # Remove any filename that might have been set
             dataset.filename = None
 
@@ -902,16 +951,7 @@ def merge_datasets(datasets, **kwargs):
         shapes = {tuple(ds.shape) for ds in groups[None]}
         if len(shapes) == 1:
             try:
-                if datasets[0].ndim == 1:
-                    dataset = stack(datasets)
-                    dataset.history = "Stacked from several files"
-                else:
-                    dataset = concatenate(datasets, axis=0)
-                    dataset.history = "Merged from several files"
-
-                if dataset.coordset is not None and kwargs.pop("sortbydate", True):
-                    dataset.sort(dim=0, inplace=True)
-                return [dataset]
+                return [_merge(datasets, kwargs.pop("sortbydate", True))]
             except Exception as e:
                 warn(str(e), stacklevel=2)
                 return datasets
@@ -930,18 +970,120 @@ def merge_datasets(datasets, **kwargs):
         # Try to merge each shape group
         for shape_group in shape_groups.values():
             try:
-                if shape_group[0].ndim == 1:
-                    merged = stack(shape_group)
-                    merged.history = "Stacked from several files"
-                else:
-                    merged = concatenate(shape_group, axis=0)
-                    merged.history = "Merged from several files"
-
-                if merged.coordset is not None and kwargs.pop("sortbydate", True):
-                    merged.sort(dim=0, inplace=True)
+                merged = _merge(shape_group, kwargs.pop("sortbydate", True))
                 merged_datasets.append(merged)
             except Exception as e:
                 warn(str(e), stacklevel=2)
                 merged_datasets.extend(shape_group)
 
     return merged_datasets
+
+
+def _merge(datasets, sortbydate=True):
+    # Stack (1D datasets) or concatenate along the first dimension the datasets read
+    # from several files, and sort the result by date (i.e., along the first
+    # coordinate) if sortbydate is True.
+    if datasets[0].ndim == 1:
+        dataset = stack(datasets)
+        dataset.history = "Stacked from several files"
+    else:
+        dataset = _concatenate_rows(datasets, sortbydate)
+        if dataset is not None:
+            # already sorted
+            return dataset
+        dataset = concatenate(datasets, axis=0)
+        dataset.history = "Merged from several files"
+
+    if dataset.coordset is not None and sortbydate:
+        dataset.sort(dim=0, inplace=True)
+    return dataset
+
+
+def _concatenate_rows(datasets, sortbydate=True):
+    # Fast concatenation of 2D datasets along their first dimension, for the
+    # common case of series of spectra read from separate files: all the datasets
+    # have the same units and title, and share the same x coordinate.
+    # The result is the same as with `concatenate` followed by `sort` , but the data
+    # of each dataset are copied only once, at their final (sorted) position in a
+    # preallocated array. (Only this merging step is optimized: the datasets are
+    # still those built by the readers for each file.)
+    # Return None if the datasets are not in this case.
+    first, last = datasets[0], datasets[-1]
+    if first.ndim != 2 or first.coordset is None or first.origin == "topspin":
+        return None
+    ydim, xdim = first.dims
+    y0, x0 = first.coordset[ydim], first.coordset[xdim]
+    if not (y0._implements("Coord") and y0.has_data and x0._implements("Coord")):
+        return None
+
+    xs = {}
+    for ds in datasets[1:]:
+        if (
+            ds.ndim != 2
+            or ds.dims != first.dims
+            or ds.shape[1] != first.shape[1]
+            or ds.units != first.units
+            or ds.title != first.title
+            or ds.coordset is None
+        ):
+            return None
+        y, x = ds.coordset[ydim], ds.coordset[xdim]
+        if (
+            not y._implements("Coord")
+            or not y.has_data
+            or y.units != y0.units
+            or y.is_labeled != y0.is_labeled
+        ):
+            return None
+        if x is not x0:
+            if not x._implements("Coord") or x.units != x0.units or x.size != x0.size:
+                return None
+            xs[id(x)] = x
+
+    # the x coordinates which are not shared with the first dataset are compared
+    # with it at once
+    if xs and not np.all(np.stack([x.data for x in xs.values()]) == x0.data):
+        return None
+
+    # new y coordinate, and position of the rows of each dataset in the result
+    ycoords = [ds.coordset[ydim] for ds in datasets]
+    coord = Coord(y0)
+    coord._data = np.concatenate([y.data for y in ycoords])
+    if y0.is_labeled:
+        coord._labels = np.concatenate([y.labels for y in ycoords])
+    rows = np.arange(coord.size)
+    if sortbydate:
+        order = coord._argsort(by="value", descend=coord.reversed)
+        coord = coord[order]
+        rows[order] = np.arange(coord.size)
+
+    data = np.empty(
+        (coord.size, first.shape[1]),
+        dtype=np.result_type(*[ds.dtype for ds in datasets]),
+    )
+    masked = any(ds.is_masked for ds in datasets)
+    mask = np.zeros(data.shape, dtype=bool) if masked else NOMASK
+    start = 0
+    for ds in datasets:
+        stop = start + ds.shape[0]
+        data[rows[start:stop]] = ds.data
+        if masked:
+            mask[rows[start:stop]] = ds.mask
+        start = stop
+
+    # the other attributes are those of the last dataset, as for `concatenate`
+    out = last._copy_metadata()
+    out.name = last.name
+    out._data = data
+    out._mask = mask
+    out._coordset[ydim] = coord
+
+    names = ", ".join(str(ds.name) for ds in datasets)
+    out.description = f"Concatenation of {len(datasets)}  datasets:\n( {names} )"
+    out.title = first.title
+    authors = list(dict.fromkeys(ds.author for ds in datasets))
+    out.author = " & ".join(str(author) for author in authors)
+    out._date = out._modified = utcnow()
+    out.history = ["Created by concatenate"]
+    out.history = "Merged from several files"
+    return out
@@ -13,6 +13,7 @@ __all__ = ["read_omnic", "read_spg", "read_spa", "read_srs"]
 __dataset_methods__ = __all__
 
 import io
+import mmap
 import re
 from datetime import datetime
 from datetime import timedelta
@@ -276,6 +277,9 @@ def read_srs(*paths, **kwargs):
         In most srs files, the absorbance/intensity data are recorded from high to low
         wavenumbers. However, in some cases the data maybe stored in low to high order.
         If your data appear reversed, set 'reverse_x=True'.
+    read_names : bool, optional, default: True
+        If False, the names of the spectra are not read, and the y coordinate has no
+        labels. This is faster for long series.
     %(Importer.other_parameters)s
 
     See Also
@@ -741,6 +745,7 @@ def _read_srs(*args, **kwargs):
 
     return_bg = kwargs.get("return_bg", False)
     reverse_x = kwargs.get("reverse_x", False)
+    read_names = kwargs.get("read_names", True)
 
     # in this case, filename is actually a byte content
     fid = io.BytesIO(filename) if frombytes else open(filename, "rb")  # noqa: SIM115
@@ -800,9 +805,11 @@ def _read_srs(*args, **kwargs):
     sub_tg = b"\x02\x00\x00\x00\x18\x00\x00\x00\x00\x00"
 
     # find the first occurence and determine whether the srs is rapidscan or high
-    # speed real time
-    fid.seek(0)
-    bytestring = fid.read()
+    # speed real time. The content of the file is memory-mapped, so that the series
+    # data can be read directly from it.
+    bytestring = (
+        filename if frombytes else mmap.mmap(fid.fileno(), 0, access=mmap.ACCESS_READ)
+    )
 
     # try rapidscan first:
     pos = bytestring.find(sub_rs, 1)
@@ -851,8 +858,6 @@ def _read_srs(*args, **kwargs):
         # we will use the 1st (-> series info), the 2nd (-> background) and
         # the 3rd  (-> data)
 
-        fid.seek(0)
-        bytestring = fid.read()
         index = [pos]
         while pos != -1:
             pos = bytestring.find(sub_rs, pos + 1)
@@ -875,7 +880,9 @@ def _read_srs(*args, **kwargs):
         # read series data, except if the user asks for the background
         if not return_bg:
             info = _read_header(fid, pos_info_data)
-            names, data = _read_srs_spectra(fid, pos_data, info["ny"], info["nx"])
+            names, data = _read_srs_spectra(
+                bytestring, pos_data, info["ny"], info["nx"], read_names=read_names
+            )
 
             # now get series history
             if not is_reprocessed:
@@ -934,8 +941,6 @@ def _read_srs(*args, **kwargs):
         # 2nd -> background ?
         # 3rd -> data ?
         # 4th  -> ?
-        fid.seek(0)
-        bytestring = fid.read()
         index = [pos]
         while pos != -1:
             pos = bytestring.find(sub_hs, pos + 1)
@@ -960,7 +965,9 @@ def _read_srs(*args, **kwargs):
             info = _read_header(fid, pos_info_data)
             # container for names and data
 
-            names, data = _read_srs_spectra(fid, pos_data, info["ny"], info["nx"])
+            names, data = _read_srs_spectra(
+                bytestring, pos_data, info["ny"], info["nx"], read_names=read_names
+            )
 
             # Get series history. on the sample file, the history seems overwritten by
             # some post-processing, so info["history"] returns a corrupted string.
@@ -986,8 +993,6 @@ def _read_srs(*args, **kwargs):
                 return None
 
     if is_tg:
-        fid.seek(0)
-        bytestring = fid.read()
         index = [pos]
         while pos != -1:
             pos = bytestring.find(sub_tg, pos + 1)
@@ -1010,7 +1015,9 @@ def _read_srs(*args, **kwargs):
         # read series data, except if the user asks for the background
         if not return_bg:
             info = _read_header(fid, pos_info_data)
-            names, data = _read_srs_spectra(fid, pos_data, info["ny"], info["nx"])
+            names, data = _read_srs_spectra(
+                bytestring, pos_data, info["ny"], info["nx"], read_names=read_names
+            )
             # Note: info["history"] is empty in TG IR or GC series
             # the position of the history is indiated at pos 856 or 878 depending on the
             # file.
@@ -1094,6 +1101,8 @@ def _read_srs(*args, **kwargs):
         )
 
     fid.close()
+    if not frombytes:
+        bytestring.close()
 
     return dataset
 
@@ -1109,6 +1118,12 @@ def _readbtext(fid, pos, size):
             btext += fid.read(1)
     else:
         btext = fid.read(size)
+    return _decodebtext(btext)
+
+
+def _decodebtext(btext):
+    # Decode some text read in a binary file.
+    # Returns utf-8 string
     btext = re.sub(b"\x00+", b"\n", btext)
 
     if btext[:1] == b"\n":
@@ -1335,37 +1350,41 @@ def _read_header(fid, pos, is_first_spectrum=True):
     return out
 
 
-def _read_srs_spectra(fid, pos_data, n_spectra, n_points):
+def _read_srs_spectra(buffer, pos_data, n_spectra, n_points, read_names=True):
     """
     Read the spectra/interferogram names and data of a series.
 
-    fid: BufferedReader
+    buffer: bytes or mmap.mmap
+        Content of the srs file.
     pos_data: int
     n_spectra: int
     n_points: int
+    read_names: bool
+        If False, the names are not read (None is returned instead of the list).
 
     returns: names (list), spectral data (ndarray)
     """
-    # container for names and data
-    names = []
-    data = np.zeros((n_spectra, n_points))
-
-    # read the spectra/interferogram names and data
-    # the first one....
-    pos = pos_data
-    names.append(_readbtext(fid, pos, 256))
-    pos += 84
-    fid.seek(pos)
-    data[0, :] = fromfile(fid, dtype="float32", count=n_points)[:]
-    pos += n_points * 4
-    # ... and the remaining ones:
-    for i in np.arange(n_spectra)[1:]:
-        pos += 16
-        names.append(_readbtext(fid, pos, 256))
-        pos += 84
-        fid.seek(pos)
-        data[i, :] = fromfile(fid, dtype="float32", count=n_points)[:]
-        pos += n_points * 4
+    # Each spectrum/interferogram is stored as a record made of its name (84 bytes),
+    # its data (n_points float32) and 16 bytes of padding. The data of all the
+    # records are thus read at once as a strided view on the buffer.
+    stride = 84 + 4 * n_points + 16
+    rows = np.ndarray(
+        (n_spectra, n_points),
+        dtype="<f4",
+        buffer=buffer,
+        offset=pos_data + 84,
+        strides=(stride, 4),
+    )
+    data = rows.astype("float64")
+    del rows  # release the buffer
+
+    names = None
+    if read_names:
+        # the names are read as before, on 256 bytes
+        names = [
+            _decodebtext(buffer[pos : pos + 256])
+            for pos in range(pos_data, pos_data + n_spectra * stride, stride)
+        ]
 
     return names, data
 
@@ -0,0 +1,291 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+# ruff: noqa: S603
+"""
+Diagnostics of the import cost of SpectroChemPy.
+
+The names of the API (``scp.NDDataset``, ``scp.PCA``, ``scp.smooth``, ...) are
+resolved lazily, *i.e.,* their modules (and the dependencies of these modules) are
+only imported at first access. The functions of this module, available as
+``scp.diagnostics``, measure what this first access costs. The measurements are made in
+a fresh python process, so that they do not depend on what was already imported in
+the current session.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from spectrochempy.lazyimport.api_methods import _LAZY_IMPORTS
+from spectrochempy.lazyimport.dataset_methods import _LAZY_DATASETS_IMPORTS
+
+# Default budgets for the import of the core objects in a fresh process (headless
+# mode): the wall time (in s) and the total number of modules in `sys.modules`.
+# They can be set by the SCPY_IMPORT_TIME_BUDGET and SCPY_IMPORT_MODULES_BUDGET
+# environment variables (e.g., on slow CI runners).
+IMPORT_TIME_BUDGET = 10.0
+IMPORT_MODULES_BUDGET = 1300
+
+_MARKER = "SCPY_IMPORT_PROFILE"
+
+# Script run in the child process: it writes a json record on stdout for the import
+# of the package and then for each name, and a marker on stderr before each of them to
+# delimit the output of `-X importtime`.
+_CHILD_SCRIPT = f"""
+import json, os, sys, time
+
+def _record(name, func):
+    print("{_MARKER}", name, file=sys.stderr, flush=True)
+    before = set(sys.modules)
+    record = {{"name": name, "error": None}}
+    t0 = time.perf_counter()
+    try:
+        func()
+    except Exception as exc:
+        record["error"] = f"{{type(exc).__name__}}: {{exc}}"
+    record["time"] = time.perf_counter() - t0
+    record["new_modules"] = [m for m in sys.modules if m not in before]
+    record["total_modules"] = len(sys.modules)
+    print("{_MARKER}", json.dumps(record), flush=True)
+
+_record("spectrochempy", lambda: __import__("spectrochempy"))
+# the application may have redirected stderr, where -X importtime writes
+sys.stderr = sys.__stderr__
+scp = sys.modules["spectrochempy"]
+for name in json.loads(sys.argv[1]):
+    _record(name, lambda: getattr(scp, name))
+print("{_MARKER}", "end", file=sys.stderr, flush=True)
+sys.stdout.flush()
+os._exit(0)
+"""
+
+
+def _lazy_names():
+    return _LAZY_IMPORTS | {
+        k: v for k, v in _LAZY_DATASETS_IMPORTS.items() if k not in _LAZY_IMPORTS
+    }
+
+
+def _parse_importtime(lines):
+    # Return the cumulative import time of each module and the total self time of
+    # each top-level package, from the output of `python -X importtime`
+    modules = {}
+    packages = {}
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # header
+        module = fields[2].strip()
+        modules[module] = max(int(fields[1]) * 1.0e-6, modules.get(module, 0.0))
+        package = module.split(".")[0]
+        packages[package] = packages.get(package, 0.0) + int(fields[0]) * 1.0e-6
+    return modules, dict(sorted(packages.items(), key=lambda x: -x[1]))
+
+
+def _run_child(names, headless=True, timeout=600):
+    env = os.environ.copy()
+    if headless:
+        env["SCPY_HEADLESS"] = "1"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD_SCRIPT, json.dumps(names)],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=timeout,
+        check=False,
+    )
+
+    records = {}
+    for line in proc.stdout.splitlines():
+        if line.startswith(_MARKER):
+            record = json.loads(line[len(_MARKER) :])
+            records[record.pop("name")] = record
+    if "spectrochempy" not in records or len(records) < len(names) + 1:
+        raise RuntimeError(
+            f"The import profiling failed (exit code {proc.returncode}):\n"
+            f"{proc.stderr[-2000:]}"
+        )
+
+    # split the output of -X importtime between the names
+    sections = {}
+    current = None
+    for line in proc.stderr.splitlines():
+        if line.startswith(_MARKER):
+            current = line[len(_MARKER) :].strip()
+            sections[current] = []
+        elif current is not None:
+            sections[current].append(line)
+
+    for name, record in records.items():
+        modules, packages = _parse_importtime(sections.get(name, []))
+        # all the new modules are listed, even if -X importtime did not report them
+        # (e.g., when stderr was redirected by the application in non-headless mode)
+        record["modules"] = {m: modules.get(m) for m in record.pop("new_modules")}
+        record["packages"] = packages
+    return records
+
+
+def import_profile(names=None, isolated=False, headless=True, top=3, file=sys.stdout):
+    """
+    Report the import cost of the lazily resolved names of the API.
+
+    The package is imported in a fresh python process, where the names are then
+    resolved one after the other. For each name, the modules imported by its
+    resolution are recorded with their cumulative import time (as given by
+    ``python -X importtime``).
+
+    Parameters
+    ----------
+    names : str or list of str, optional
+        The names of the API to resolve, *e.g.,* ``["NDDataset", "PCA"]``. By default,
+        all the lazily imported names of the API and of the NDDataset methods.
+    isolated : bool, optional, default: False
+        If True, each name is resolved in its own fresh process, and its cost does
+        not depend on the names resolved before. Otherwise, the names are resolved in
+        the same process (much faster for many names) and the modules shared by
+        several names are only charged to the first one.
+    headless : bool, optional, default: True
+        Whether the child processes are run in headless mode (see the
+        ``SCPY_HEADLESS`` environment variable).
+    top : int, optional, default: 3
+        Number of the most expensive packages displayed for each name in the report.
+    file : file-like or None, optional
+        Print the report to the given file-like object. Defaults to sys.stdout. If
+        None, nothing is printed.
+
+    Returns
+    -------
+    dict
+        A dictionary, with the entry ``"spectrochempy"`` for the import of the package
+        itself and then an entry for each name. Each entry is a dictionary with
+        the keys:
+
+        * ``time``: the wall time of the import (or of the resolution) in s.
+        * ``modules``: the newly imported modules with their cumulative import time
+          in s (None if it is unknown).
+        * ``packages``: the import time in s of the modules of each top-level
+          package (``scipy``, ``pint``, ...), by decreasing time. These times sum up
+          to the import cost.
+        * ``total_modules``: the total number of modules in `sys.modules` after the
+          import.
+        * ``error``: the error raised by the resolution, if any, else None.
+
+    See Also
+    --------
+    check_import_budget : Check the import cost of the core objects.
+
+    Examples
+    --------
+    >>> profile = scp.diagnostics.import_profile(["NDDataset", "PCA"])  # doctest: +SKIP
+
+    """
+    lazy_names = _lazy_names()
+    if names is None:
+        names = list(lazy_names)
+    elif isinstance(names, str):
+        names = [names]
+    unknown = [name for name in names if name not in lazy_names]
+    if unknown:
+        raise ValueError(f"Unknown names in the API: {', '.join(unknown)}")
+
+    if isolated:
+        profile = {}
+        for name in names:
+            records = _run_child([name], headless=headless)
+            profile.setdefault("spectrochempy", records["spectrochempy"])
+            profile[name] = records[name]
+    else:
+        profile = _run_child(list(names), headless=headless)
+
+    if file is not None:
+        print(  # noqa: T201
+            f"{'name':<30}{'time (s)':>10}{'modules':>9}  most expensive packages",
+            file=file,
+        )
+        for name, record in profile.items():
+            if record["error"] is not None:
+                packages = record["error"]
+            else:
+                packages = ", ".join(
+                    f"{p} ({t:.2f} s)"
+                    for p, t in list(record["packages"].items())[:top]
+                )
+            print(  # noqa: T201
+                f"{name:<30}{record['time']:>10.3f}{len(record['modules']):>9}  "
+                f"{packages}",
+                file=file,
+            )
+    return profile
+
+
+def check_import_budget(
+    names=("NDDataset", "Coord"), max_time=None, max_modules=None, headless=True
+):
+    """
+    Check the import cost of the core objects against a budget.
+
+    Each name is imported in a fresh python process (``from spectrochempy import
+    <name>``), and both the wall time of the import and the total number of
+    modules loaded are compared to the budget.
+
+    Parameters
+    ----------
+    names : list of str, optional, default: ("NDDataset", "Coord")
+        The names of the API to check.
+    max_time : float, optional
+        The maximum time (in s) of the import. Defaults to the
+        ``SCPY_IMPORT_TIME_BUDGET`` environment variable or to
+        `IMPORT_TIME_BUDGET`.
+    max_modules : int, optional
+        The maximum number of modules loaded in the process after the import.
+        Defaults to the ``SCPY_IMPORT_MODULES_BUDGET`` environment variable or to
+        `IMPORT_MODULES_BUDGET`.
+    headless : bool, optional, default: True
+        Whether the imports are made in headless mode.
+
+    Returns
+    -------
+    list of str
+        The description of each budget overrun (empty if the budget is met).
+
+    See Also
+    --------
+    import_profile : Report the import cost of the lazily resolved names.
+
+    """
+    if max_time is None:
+        max_time = float(os.environ.get("SCPY_IMPORT_TIME_BUDGET", IMPORT_TIME_BUDGET))
+    if max_modules is None:
+        max_modules = int(
+            os.environ.get("SCPY_IMPORT_MODULES_BUDGET", IMPORT_MODULES_BUDGET)
+        )
+
+    overruns = []
+    for name in names:
+        profile = import_profile(name, isolated=True, headless=headless, file=None)
+        record = profile[name]
+        if record["error"] is not None:
+            overruns.append(f"{name}: {record['error']}")
+            continue
+        time = profile["spectrochempy"]["time"] + record["time"]
+        packages = profile["spectrochempy"]["packages"].copy()
+        for package, t in record["packages"].items():
+            packages[package] = packages.get(package, 0.0) + t
+        heaviest = ", ".join(sorted(packages, key=packages.get, reverse=True)[:3])
+        if time > max_time:
+            overruns.append(
+                f"{name}: import time {time:.2f} s > {max_time:.2f} s "
+                f"(most expensive packages: {heaviest})"
+            )
+        if record["total_modules"] > max_modules:
+            overruns.append(
+                f"{name}: {record['total_modules']} modules loaded > {max_modules} "
+                f"(most expensive packages: {heaviest})"
+            )
+    return overruns
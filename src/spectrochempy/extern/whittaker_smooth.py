@@ -20,10 +20,13 @@ This code was downloaded from:
 https://github.com/mhvwerts/whittaker-eilers-smoother/blob/master/whittaker_smooth.py
 See Licence in the LICENCES folder of the repository
 (LICENCES/WHITTAKER_SMOOTH_LICENCE.rst)
-and has been slightly modified.
+and has been slightly modified: the factorization of the smoothing matrix is cached
+and several vectors can be smoothed at once.
 
 """
 
+import functools
+
 import numpy as np
 import scipy.sparse as sparse
 from scipy.sparse.linalg import splu
@@ -59,6 +62,37 @@ def speyediff(N, d, format="csc"):
     return sparse.diags(diagonals, offsets, shape, format=format)
 
 
+@functools.lru_cache(maxsize=16)
+def whittaker_factor(N, lmbd, d=2):
+    """
+    LU factorization of the Whittaker smoothing matrix.
+
+    The smoothing matrix ``I + lmbd * D'D`` only depends on the size of the data,
+    on the roughness penalty and on the order of the smoothing: its factorization is
+    cached, so that it is computed only once for a series of vectors or datasets of
+    the same size.
+
+    Parameters
+    ----------
+    N : int
+        Size of the vectors to smooth.
+    lmbd : float
+        Parameter for the smoothing algorithm (roughness penalty).
+    d : int, optional
+        Order of the smoothing, by default 2.
+
+    Returns
+    -------
+    scipy.sparse.linalg.SuperLU
+        The factorized smoothing matrix.
+
+    """
+    E = sparse.eye(N, format="csc")
+    D = speyediff(N, d, format="csc")
+    coefmat = E + lmbd * D.conj().T.dot(D)
+    return splu(coefmat)
+
+
 def whittaker_smooth(y, lmbd, d=2):
     """
     Whittaker smoothing algorithm implementation.
@@ -70,7 +104,9 @@ def whittaker_smooth(y, lmbd, d=2):
     Parameters
     ----------
     y : array-like
-        Vector containing raw data.
+        Vector containing raw data, or array whose vectors along the last axis
+        are smoothed independently (with a single factorization of the smoothing
+        matrix).
     lmbd : float
         Parameter for the smoothing algorithm (roughness penalty).
     d : int, optional
@@ -79,15 +115,19 @@ def whittaker_smooth(y, lmbd, d=2):
     Returns
     -------
     array-like
-        Vector of the smoothed data.
+        Vector (or array) of the smoothed data.
 
     References
     ----------
     .. [1] P. H. C. Eilers, "A perfect smoother", Anal. Chem. 2003, (75), 3631-3636
 
     """
-    m = len(y)
-    E = sparse.eye(m, format="csc")
-    D = speyediff(m, d, format="csc")
-    coefmat = E + lmbd * D.conj().T.dot(D)
-    return splu(coefmat).solve(y)
+    y = np.asarray(y)
+    if y.ndim == 0:
+        raise TypeError("y must be a vector or an array of vectors")
+    m = y.shape[-1]
+    lu = whittaker_factor(m, lmbd, d)
+    if y.ndim == 1:
+        return lu.solve(y)
+    # all the vectors are solved at once, as the columns of the right-hand side
+    return lu.solve(y.reshape(-1, m).T).T.reshape(y.shape)
@@ -9,13 +9,12 @@ import numpy as np
 import scipy.interpolate
 import scipy.signal
 import traitlets as tr
-from scipy import sparse
-from scipy.sparse.linalg import spsolve
 from scipy.spatial import ConvexHull
 
 from spectrochempy.analysis._base._analysisbase import AnalysisConfigurable
 from spectrochempy.application.application import info_
 from spectrochempy.application.application import warning_
+from spectrochempy.processing.baselineprocessing.baselineutils import asls_baseline
 from spectrochempy.processing.baselineprocessing.baselineutils import lls
 from spectrochempy.processing.baselineprocessing.baselineutils import lls_inv
 from spectrochempy.processing.transformation.concatenate import concatenate
@@ -224,6 +223,21 @@ class Baseline(AnalysisConfigurable):
         config=True,
         min=1,
     )
+
+    asls_warm_start = tr.Bool(
+        default_value=False,
+        help="For the AsLS method, if `True` the weights of each row are initialized "
+        "with the final weights of the previous row. This generally reduces the "
+        "number of iterations for series of similar spectra (e.g., time series).",
+    ).tag(config=True)
+
+    workers = tr.Integer(
+        default_value=None,
+        allow_none=True,
+        help="Number of processes used to fit the AsLS baselines of the rows of 2D "
+        "datasets. If `None` or 1, the rows are fitted sequentially. -1 means "
+        "using all the available processors.",
+    ).tag(config=True)
     n_components = tr.Integer(
         default_value=5,
         help="Number of components to use for the multivariate method "
@@ -510,36 +524,21 @@ baseline/trends for different segments of the data.
         elif self.model == "asls":
             # AsLS fitted baseline
             # For now, this doesn't work with masked data
-            lamb = self.lamb
-            p = self.asymmetry
-            D = sparse.diags([1, -2, 1], [0, -1, -2], shape=(N, N - 2))
-
-            for i in range(M):
-                w = np.ones(N)
-                w_old = 1e5
-                y = Y[i].squeeze()
-                # make the data positive (to allow the use of NNMF instead of SVD)
-                mi = y.min()
-                y -= mi
-                iter = 0
-                while True:
-                    W = sparse.spdiags(w, 0, N, N)
-                    C = W + lamb * D.dot(D.transpose())
-                    z = spsolve(C, w * y)
-                    w = p * (y > z) + (1 - p) * (y < z)
-                    change = np.sum(np.abs(w_old - w)) / N
-                    # info_(change)
-                    if change <= self.tol:
-                        info_(f"Convergence reached in {iter} iterations")
-                        break
-                    if iter >= self.max_iter:
-                        info_(f"Maximum number of iterations {self.max_iter} reached")
-                        break
-                    w_old = w
-                    iter += 1
-                # do not forget to add to mi to get the original data back
-                z += mi
-                _store[i] = z[::-1] if self._X.x.is_descendant else z
+            z, n_iter, converged = asls_baseline(
+                Y,
+                lamb=self.lamb,
+                asymmetry=self.asymmetry,
+                tol=self.tol,
+                max_iter=self.max_iter,
+                warm_start=self.asls_warm_start,
+                workers=self.workers,
+            )
+            for iteration, success in zip(n_iter, converged, strict=True):
+                if success:
+                    info_(f"Convergence reached in {iteration} iterations")
+                else:
+                    info_(f"Maximum number of iterations {self.max_iter} reached")
+            _store = z[..., ::-1] if self._X.x.is_descendant else z
 
         elif self.model == "rubberband":
             # Rubberband baseline correction
@@ -972,7 +971,15 @@ def detrend(dataset, order="linear", breakpoints=None, **kwargs):
 
 
 @docprocess.dedent
-def asls(dataset, lamb=1e5, asymmetry=0.05, tol=1e-3, max_iter=50):
+def asls(
+    dataset,
+    lamb=1e5,
+    asymmetry=0.05,
+    tol=1e-3,
+    max_iter=50,
+    asls_warm_start=False,
+    workers=None,
+):
     r"""
     Asymmetric Least Squares Smoothing baseline correction.
 
@@ -992,6 +999,14 @@ def asls(dataset, lamb=1e5, asymmetry=0.05, tol=1e-3, max_iter=50):
         The tolerance parameter for the AsLS method. Smaller values make the fitting better but potentially increases the number of iterations and the running time. Values should be in the range (0, 1).
     max_iter = `int`, optional, default:50
         Maximum number of :term:`AsLS` iteration.
+    asls_warm_start : `bool`, optional, default: False
+        If `True` , the weights of each row are initialized with the final weights of
+        the previous row, which generally reduces the number of iterations for series
+        of similar spectra.
+    workers : `int`, optional
+        Number of processes used to fit the baselines of the rows of a 2D dataset.
+        If `None` or 1, the rows are fitted sequentially. -1 means using all the
+        available processors.
 
     Returns
     -------
@@ -1009,6 +1024,8 @@ def asls(dataset, lamb=1e5, asymmetry=0.05, tol=1e-3, max_iter=50):
     blc.asymmetry = asymmetry
     blc.tol = tol
     blc.max_iter = max_iter
+    blc.asls_warm_start = asls_warm_start
+    blc.workers = workers
     blc.fit(dataset)
 
     return blc.transform()
@@ -6,7 +6,13 @@
 
 # Utility functions
 
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+from scipy import sparse
+from scipy.linalg import solveh_banded
+
+from spectrochempy.utils.system import get_n_workers
 
 
 def lls(data):
@@ -55,3 +61,121 @@ def lls_inv(data):
 
     """
     return (np.exp(np.exp(data) - 1) - 1) ** 2 - 1
+
+
+# AsLS (asymmetric least squares) baseline
+# ----------------------------------------
+def _difference_penalty_band(N, lamb):
+    # Upper band storage (see `scipy.linalg.solveh_banded`) of the pentadiagonal
+    # penalty matrix lamb * D.D', where D is the second order difference matrix.
+    D = sparse.diags([1, -2, 1], [0, -1, -2], shape=(N, N - 2))
+    DDt = (D @ D.T).tocsr()
+    band = np.zeros((3, N))
+    for k in range(3):
+        band[2 - k, k:] = DDt.diagonal(k)
+    return lamb * band
+
+
+def _asls_rows(Y, lamb, asymmetry, tol, max_iter, warm_start=False):
+    # AsLS baselines of the rows of Y, computed sequentially.
+    # The penalty matrix is computed once, and the (symmetric positive definite)
+    # system W + lamb * D.D' is solved at each reweighting iteration by a banded
+    # Cholesky factorization.
+    M, N = Y.shape
+    band = _difference_penalty_band(N, lamb)
+    ab = np.empty_like(band)
+    baselines = np.empty((M, N))
+    n_iter = np.zeros(M, dtype=int)
+    converged = np.zeros(M, dtype=bool)
+    w_start = np.ones(N)
+    for i in range(M):
+        # make the data positive
+        mi = Y[i].min()
+        y = Y[i] - mi
+        w = w_start
+        w_old = 1e5
+        iteration = 0
+        while True:
+            ab[:] = band
+            ab[-1] += w
+            z = solveh_banded(ab, w * y, overwrite_ab=True, check_finite=False)
+            w = asymmetry * (y > z) + (1 - asymmetry) * (y < z)
+            change = np.sum(np.abs(w_old - w)) / N
+            if change <= tol or iteration >= max_iter:
+                break
+            w_old = w
+            iteration += 1
+        baselines[i] = z + mi
+        n_iter[i] = iteration
+        converged[i] = change <= tol
+        if warm_start:
+            # the weights of the next row start from the final weights of this row
+            w_start = w
+    return baselines, n_iter, converged
+
+
+def asls_baseline(
+    Y, lamb=1e5, asymmetry=0.05, tol=1e-3, max_iter=50, warm_start=False, workers=None
+):
+    """
+    Asymmetric Least Squares Smoothing baselines of a series of spectra.
+
+    The baseline of each row of `Y` is determined using the algorithm of Eilers and
+    Boelens (:cite:`eilers:2005`).
+
+    Parameters
+    ----------
+    Y : array-like
+        Data, as a 1D array or a 2D array of shape (n_observations, n_features).
+    lamb : float, optional, default: 1e5
+        The smoothness parameter. Larger values make the baseline stiffer.
+    asymmetry : float, optional, default: 0.05
+        The asymmetry parameter.
+    tol : float, optional, default: 1e-3
+        The tolerance on the change of the weights between two iterations.
+    max_iter : int, optional, default: 50
+        Maximum number of iterations for each row.
+    warm_start : bool, optional, default: False
+        If True, the weights of each row are initialized with the final weights of
+        the previous row instead of ones. This generally reduces the number of
+        iterations for a series of similar spectra (e.g., a time series).
+    workers : int, optional
+        Number of processes used to compute the baselines. The rows are split into
+        contiguous blocks processed in parallel (with `warm_start`, the first row of
+        each block starts with unit weights). If `None` or 1, the baselines are
+        computed sequentially. -1 means using all the available processors.
+
+    Returns
+    -------
+    baselines : `~numpy.ndarray`
+        The baselines, with the shape of `Y`.
+    n_iter : `~numpy.ndarray`
+        Number of iterations for each row.
+    converged : `~numpy.ndarray`
+        Whether the convergence was reached for each row.
+
+    """
+    Y = np.asarray(Y, dtype=float)
+    shape = Y.shape
+    Y = np.atleast_2d(Y)
+    M = Y.shape[0]
+
+    workers = get_n_workers(workers)
+    if workers == 1 or M < 2:
+        baselines, n_iter, converged = _asls_rows(
+            Y, lamb, asymmetry, tol, max_iter, warm_start
+        )
+    else:
+        blocks = np.array_split(np.arange(M), min(workers, M))
+        with ProcessPoolExecutor(max_workers=len(blocks)) as executor:
+            futures = [
+                executor.submit(
+                    _asls_rows, Y[block], lamb, asymmetry, tol, max_iter, warm_start
+                )
+                for block in blocks
+            ]
+            results = [future.result() for future in futures]
+        baselines, n_iter, converged = (
+            np.concatenate(item) for item in zip(*results, strict=True)
+        )
+    return baselines.reshape(shape), n_iter, converged
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from scipy.signal import savgol_filter
 
@@ -5,6 +7,7 @@ from spectrochempy.application.application import error_
 from spectrochempy.application.application import get_loglevel
 from spectrochempy.application.application import info_
 from spectrochempy.application.application import warning_
+from spectrochempy.utils.system import get_n_workers
 
 __all__ = ["denoise", "despike"]
 __dataset_methods__ = __all__
@@ -80,7 +83,7 @@ def denoise(dataset, ratio=99.8, **kwargs):
     return data
 
 
-def despike(dataset, size=9, delta=2, method="katsumoto"):
+def despike(dataset, size=9, delta=2, method="katsumoto", chunksize=None, workers=None):
     """
     Remove spikes from the data.
 
@@ -122,6 +125,14 @@ def despike(dataset, size=9, delta=2, method="katsumoto"):
         Set the threshold for the detection of spikes.
     method : str, optional, default: 'katsumoto'
         The method to use. Can be 'katsumoto' or 'whitaker'
+    chunksize : int, optional
+        If given, the spectra are processed by chunks of `chunksize` rows, which limits
+        the memory used for large series. By default, all the spectra are processed at
+        once.
+    workers : int, optional
+        Number of threads used to process the chunks in parallel. If `None` or 1,
+        the chunks are processed sequentially. -1 means using all the available
+        processors. Only used if `chunksize` is given.
 
     Returns
     -------
@@ -131,77 +142,123 @@ def despike(dataset, size=9, delta=2, method="katsumoto"):
     """
     new = dataset.copy()
 
+    if method not in ["katsumoto", "whitaker"]:
+        raise ValueError(
+            f"Unknown despike method `{method}`: use 'katsumoto' or 'whitaker'"
+        )
+    despike_rows = _despike_katsumoto if method == "katsumoto" else _despike_whitaker
+
+    # all the rows (spectra) are processed at once, possibly by chunks
+    data = new.data.reshape(-1, new.data.shape[-1])
+    nrows = data.shape[0]
+    if chunksize is None:
+        chunksize = nrows
+    chunks = [
+        slice(start, min(start + chunksize, nrows))
+        for start in range(0, nrows, max(int(chunksize), 1))
+    ]
+
+    def _process(chunk):
+        data[chunk] = despike_rows(data[chunk], size, delta)
+
+    workers = get_n_workers(workers)
+    if workers == 1 or len(chunks) < 2:
+        for chunk in chunks:
+            _process(chunk)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_process, chunks))
+
+    if not np.may_share_memory(data, new.data):
+        # the data have been copied by reshape
+        new.data[...] = data.reshape(new.data.shape)
+    new.history = f"despiked with method={method}, size={size}, delta={delta}"
+
+    return new
+
+
+def _despike_katsumoto(X, size, delta):
+    # despike the rows of the 2D array X using the katsumoto method
+
     # machine epsilon
     eps = np.finfo(float).eps
 
     s = int((size - 1) / 2)
 
-    for k, X in enumerate(new.data):
-        X = X.squeeze()
-
-        if method == "katsumoto":
-            # 1) first step : savgol filter
-            A = savgol_filter(X, window_length=size, polyorder=2)
-
-            # 2 and 3) second and third step : detect spike and replace spkike by the moving
-            # average and the new data are smoothed again
-            diff = X - A
-            std = delta * np.std(diff)
-
-            # spike should have a large variation with respect to the std of the difference
-            select = abs(diff) >= std
-            select = np.logical_or(select, np.roll(select, 1))
-            select = np.logical_or(select, np.roll(select, -1))
-
-            # compute weights
-            w = np.ones_like(X)
-            w[select] = 0
-
-            # now we must calculate the weighted average, but for efficiency we will compute it
-            # only around where spike peaks are, the other part should be unchanged.
-
-            res = np.zeros_like(X)
-            W = np.zeros_like(X) + eps  # to avoid division by zero
-            r = range(-s, s + 1)
-            for j in r:
-                vj = np.roll(X, j)
-                wj = np.roll(w, j)
-                res += vj * wj
-                W += wj
-
-            A = res / W
-
-            # 4) compare with original to remove spike peaks
-            X[select] -= (X - A)[select]
-
-        elif method == "whitaker":
-            # 1) detrended difference series
-            DX = np.zeros_like(X)
-            DX[1:] = X[1:] - X[:-1]
-
-            # zscore
-            m = np.median(DX)
-            M = np.median(np.abs(DX - m))
-            Z = (DX - m) / M
-            Z[0] = Z[-1] = delta + 1
-
-            # select spikes
-            select = abs(Z) >= delta
-
-            # replace spikes by average
-            A = np.zeros_like(X)
-            for i in [j for j, x in enumerate(select) if x]:
-                indexes = np.arange(max(0, i - s), min(len(X), i + s))
-                indexes = [index for index in indexes if not select[index]]
-                if indexes != []:
-                    A[i] = np.mean(X[indexes])
-                else:
-                    A[i] = X[i]
-
-            # makes change in X
-            X[select] -= (X - A)[select]
-
-        new.data[k] = X
-    new.history = f"despiked with method={method}, size={size}, delta={delta}"
+    # 1) first step : savgol filter
+    A = savgol_filter(X, window_length=size, polyorder=2, axis=-1)
 
-    return new
+    # 2 and 3) second and third step : detect spike and replace spike by the moving
+    # average and the new data are smoothed again
+    diff = X - A
+    std = delta * np.std(diff, axis=-1, keepdims=True)
+
+    # spike should have a large variation with respect to the std of the difference
+    select = abs(diff) >= std
+    select = np.logical_or(select, np.roll(select, 1, axis=-1))
+    select = np.logical_or(select, np.roll(select, -1, axis=-1))
+
+    # compute weights
+    w = np.ones_like(X)
+    w[select] = 0
+
+    # weighted moving average on a circular window (the spikes have a zero weight)
+    res = np.zeros_like(X)
+    W = np.zeros_like(X) + eps  # to avoid division by zero
+    for j in range(-s, s + 1):
+        res += np.roll(X, j, axis=-1) * np.roll(w, j, axis=-1)
+        W += np.roll(w, j, axis=-1)
+
+    A = res / W
+
+    # 4) compare with original to remove spike peaks
+    X = X.copy()
+    X[select] -= (X - A)[select]
+    return X
+
+
+def _despike_whitaker(X, size, delta):
+    # despike the rows of the 2D array X using the whitaker method
+    s = int((size - 1) / 2)
+    n = X.shape[-1]
+
+    # 1) detrended difference series
+    DX = np.zeros_like(X)
+    DX[:, 1:] = X[:, 1:] - X[:, :-1]
+
+    # zscore
+    m = np.median(DX, axis=-1, keepdims=True)
+    M = np.median(np.abs(DX - m), axis=-1, keepdims=True)
+    Z = (DX - m) / M
+    Z[:, 0] = Z[:, -1] = delta + 1
+
+    # select spikes
+    select = abs(Z) >= delta
+    rows, cols = np.nonzero(select)
+
+    # windows [i - s, i + s[ around the spikes, limited to the data
+    start = np.maximum(cols - s, 0)
+    stop = np.minimum(cols + s, n)
+    indexes = start[:, np.newaxis] + np.arange(2 * s)
+    valid = indexes < stop[:, np.newaxis]
+    indexes = np.where(valid, indexes, 0)
+    # the spikes are excluded from the average
+    valid &= ~select[rows[:, np.newaxis], indexes]
+
+    # gather the valid values of each window at its beginning (keeping their order)
+    order = np.argsort(~valid, axis=-1, kind="stable")
+    values = np.take_along_axis(X[rows[:, np.newaxis], indexes], order, axis=-1)
+    counts = valid.sum(axis=-1)
+
+    # replace spikes by the average of the valid values (or keep them if there are
+    # none). Windows are grouped by number of valid values, so that the averages are
+    # computed exactly as for each window separately.
+    A = X[rows, cols]
+    for count in np.unique(counts[counts > 0]):
+        group = counts == count
+        A[group] = np.mean(values[group, :count], axis=-1)
+
+    # makes change in X
+    X = X.copy()
+    X[rows, cols] -= X[rows, cols] - A
+    return X
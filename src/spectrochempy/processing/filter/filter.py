@@ -217,7 +217,7 @@ and ‘nearest’.
         # Whittaker-Eilers filter
         # -----------------------
         elif self.method == "whittaker":
-            data = np.apply_along_axis(ws, -1, X, self.lamb, self.order)
+            data = ws(X, self.lamb, self.order)
 
         return data
 
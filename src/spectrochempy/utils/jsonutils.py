@@ -12,6 +12,8 @@ import pickle
 
 import numpy as np
 
+from spectrochempy.utils.numutils import LinearRange
+
 
 def fromisoformat(s):
     try:
@@ -24,8 +26,18 @@ def fromisoformat(s):
 # ======================================================================================
 # JSON UTILITIES
 # ======================================================================================
-def json_decoder(dic):
-    """Decode a serialized json object."""
+def json_decoder(dic, arrays=None):
+    """
+    Decode a serialized json object.
+
+    Parameters
+    ----------
+    dic : dict
+        The json object to decode.
+    arrays : Mapping, optional
+        Mapping from which arrays stored outside the json content (`npy` references
+        written by `json_encoder` with ``encoding="npy"``) are retrieved.
+    """
     from spectrochempy.core.units import Quantity
     from spectrochempy.core.units import Unit
     from spectrochempy.utils.meta import Meta
@@ -36,7 +48,15 @@ def json_decoder(dic):
             return fromisoformat(dic["isoformat"])
         if klass == "DATETIME64":
             return np.datetime64(dic["isoformat"])
+        if klass == "LINEAR_RANGE":
+            return LinearRange(dic["start"], dic["step"], dic["size"])
         if klass == "NUMPY_ARRAY":
+            if "npy" in dic:
+                if arrays is None:
+                    raise ValueError(
+                        f"Array `{dic['npy']}` is stored outside the json content."
+                    )
+                return arrays[dic["npy"]]
             if "base64" in dic:
                 return pickle.loads(base64.b64decode(dic["base64"]))  # noqa: S301
             if "tolist" in dic:
@@ -60,7 +80,11 @@ def json_decoder(dic):
             for k, v in dic.items():
                 if k == "data":
                     for kk, vv in v.items():
-                        kwargs[kk] = json_decoder(vv) if isinstance(vv, dict) else vv
+                        kwargs[kk] = (
+                            json_decoder(vv, arrays=arrays)
+                            if isinstance(vv, dict)
+                            else vv
+                        )
             meta = Meta(parent=dic.get("parent"), name=dic.get("name"), **kwargs)
             meta.readonly = dic.get("readonly", False)
             return meta
@@ -70,8 +94,23 @@ def json_decoder(dic):
     return dic
 
 
-def json_encoder(byte_obj, encoding=None):
-    """Return a serialised json object."""
+def json_encoder(byte_obj, encoding=None, arrays=None):
+    """
+    Return a serialised json object.
+
+    Parameters
+    ----------
+    byte_obj : object
+        The object to serialize.
+    encoding : str, optional
+        How numpy arrays are serialized. If None, arrays are written as lists.
+        If "base64", arrays are pickled and base64 encoded. If "npy", arrays are
+        not included in the json content, but collected in the `arrays` dictionary,
+        and only a reference to them is written.
+    arrays : dict, optional
+        Dictionary collecting the arrays when ``encoding="npy"``. Keys are the
+        member names to be used in the archive.
+    """
     from spectrochempy.application.preferences import PreferencesSet
     from spectrochempy.core.units import Quantity
     from spectrochempy.core.units import Unit
@@ -84,7 +123,12 @@ def json_encoder(byte_obj, encoding=None):
 
         dic = {}
         for name in objnames:
-            if (
+            if name == "data" and isinstance(
+                getattr(byte_obj, "_deferred", None), LinearRange
+            ):
+                # data of linear coordinates: only the range is written
+                val = byte_obj._deferred
+            elif (
                 name in ["readonly"]
                 or (name == "dims" and "datasets" in objnames)
                 or [name in ["parent", "name"] and isinstance(byte_obj, PreferencesSet)]
@@ -96,7 +140,7 @@ def json_encoder(byte_obj, encoding=None):
 
             # Warning with parent-> circular dependencies!
             if name != "parent":
-                dic[name] = json_encoder(val, encoding=encoding)
+                dic[name] = json_encoder(val, encoding=encoding, arrays=arrays)
             # we need to differentiate normal dic from Meta object
             if byte_obj._implements("Meta"):
                 dic["__class__"] = "META"
@@ -115,15 +159,17 @@ def json_encoder(byte_obj, encoding=None):
         return int(byte_obj)
 
     if isinstance(byte_obj, tuple):
-        return tuple([json_encoder(v, encoding=encoding) for v in byte_obj])
+        return tuple(
+            [json_encoder(v, encoding=encoding, arrays=arrays) for v in byte_obj]
+        )
 
     if isinstance(byte_obj, list):
-        return [json_encoder(v, encoding=encoding) for v in byte_obj]
+        return [json_encoder(v, encoding=encoding, arrays=arrays) for v in byte_obj]
 
     if isinstance(byte_obj, dict):
         dic = {}
         for k, v in byte_obj.items():
-            dic[k] = json_encoder(v, encoding=encoding)
+            dic[k] = json_encoder(v, encoding=encoding, arrays=arrays)
         return dic
 
     if isinstance(byte_obj, datetime.datetime):
@@ -138,16 +184,31 @@ def json_encoder(byte_obj, encoding=None):
             "__class__": "DATETIME64",
         }
 
+    if isinstance(byte_obj, LinearRange):
+        return {
+            "start": byte_obj.start,
+            "step": byte_obj.step,
+            "size": byte_obj.size,
+            "__class__": "LINEAR_RANGE",
+        }
+
     if isinstance(byte_obj, np.ndarray):
         if encoding is None:
             dtype = byte_obj.dtype
             if str(byte_obj.dtype).startswith("datetime64"):
                 byte_obj = np.datetime_as_string(byte_obj, timezone="UTC")
             return {
-                "tolist": json_encoder(byte_obj.tolist(), encoding=encoding),
+                "tolist": json_encoder(
+                    byte_obj.tolist(), encoding=encoding, arrays=arrays
+                ),
                 "dtype": str(dtype),
                 "__class__": "NUMPY_ARRAY",
             }
+        if encoding == "npy" and arrays is not None and not byte_obj.dtype.hasobject:
+            # the array will be written as a separate npy member of the archive
+            key = f"arrays/{len(arrays):04d}.npy"
+            arrays[key] = byte_obj
+            return {"npy": key, "__class__": "NUMPY_ARRAY"}
         return {
             "base64": base64.b64encode(pickle.dumps(byte_obj)).decode(),
             "__class__": "NUMPY_ARRAY",
@@ -162,7 +223,9 @@ def json_encoder(byte_obj, encoding=None):
 
     if isinstance(byte_obj, Quantity):
         return {
-            "tuple": json_encoder(byte_obj.to_tuple(), encoding=encoding),
+            "tuple": json_encoder(
+                byte_obj.to_tuple(), encoding=encoding, arrays=arrays
+            ),
             "__class__": "QUANTITY",
         }
 
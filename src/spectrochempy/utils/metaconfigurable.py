@@ -15,10 +15,10 @@ from pathlib import Path
 
 import numpy as np
 import traitlets as tr
-from matplotlib import cycler
+from cycler import cycler
 
-# from spectrochempy.core.units import Quantity
-from pint import UnitRegistry
+# (the base class of the quantities of any registry, so that no registry is built)
+from pint import Quantity
 from traitlets.config import Config
 from traitlets.config.configurable import Configurable
 from traitlets.config.loader import LazyConfigValue
@@ -27,9 +27,6 @@ from spectrochempy.utils.decorators import deprecated
 from spectrochempy.utils.docutils import docprocess
 from spectrochempy.utils.objects import Adict
 
-ur = UnitRegistry()
-Quantity = ur.Quantity
-
 
 class MetaConfigurable(Configurable):
     """
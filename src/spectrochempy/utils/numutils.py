@@ -99,3 +99,90 @@ def largest_power_of_2(value):
         Power of 2.
     """
     return int(pow(2, np.ceil(np.log(value) / np.log(2))))
+
+
+# ======================================================================================
+# Public classes
+# ======================================================================================
+class LinearRange:
+    """
+    Evenly spaced values defined by a first value, a spacing and a number of values.
+
+    This is a compact, read-only, representation of the data of linear coordinates.
+    The array of values is only computed when the range is converted with
+    `numpy.asarray` , while slicing the range returns a new range, and the index of
+    the value closest to a given location is obtained without any search.
+
+    Parameters
+    ----------
+    start : float
+        First value.
+    step : float
+        Spacing between the values.
+    size : int
+        Number of values.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Shape of the array of values.
+    dtype : `numpy.dtype`
+        Data type of the array of values (always float64).
+    """
+
+    dtype = np.dtype(np.float64)
+    ndim = 1
+
+    def __init__(self, start, step, size):
+        self.start = float(start)
+        self.step = float(step)
+        self.size = int(size)
+
+    def __repr__(self):
+        return f"LinearRange(start={self.start}, step={self.step}, size={self.size})"
+
+    def __len__(self):
+        return self.size
+
+    def __array__(self, dtype=None, copy=None):
+        data = self.start + self.step * np.arange(self.size, dtype=self.dtype)
+        return data if dtype is None else data.astype(dtype, copy=False)
+
+    def __getitem__(self, keys):
+        if isinstance(keys, tuple) and len(keys) == 1:
+            keys = keys[0]
+        if isinstance(keys, slice):
+            # the selected values are evenly spaced too
+            selection = range(self.size)[keys]
+            return LinearRange(
+                self.start + selection.start * self.step,
+                selection.step * self.step,
+                len(selection),
+            )
+        if isinstance(keys, int | np.integer):
+            return np.float64(self.start + range(self.size)[keys] * self.step)
+        return np.asarray(self)[keys]
+
+    @property
+    def shape(self):
+        """Shape of the array of values."""
+        return (self.size,)
+
+    def index(self, value):
+        """
+        Return the index of the value closest to a given value.
+
+        Parameters
+        ----------
+        value : float
+            The value to look for (it may be outside of the range).
+
+        Returns
+        -------
+        int
+            The index of the closest value (the first one in case of equality).
+        """
+        if self.size < 2 or self.step == 0:
+            return 0
+        index = int(np.ceil((value - self.start) / self.step - 0.5))
+        return min(max(index, 0), self.size - 1)
@@ -308,6 +308,10 @@ class ReadOnlyDict(dict):
         new_dict._readonly = self._readonly
         return new_dict
 
+    def __reduce__(self):
+        """Support pickling (items are restored before the read-only flag)."""
+        return (type(self), (dict(self),), self.__dict__)
+
 
 class ScpObjectList(list):
     """A list subclass that allows html representation of the list of spectrochempy objects."""
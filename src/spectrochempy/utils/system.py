@@ -6,14 +6,14 @@
 # ruff: noqa: S602, S603
 
 import getpass
+import os
 import platform
 import shlex
+import sys
 from subprocess import PIPE
 from subprocess import STDOUT
 from subprocess import run
 
-from IPython import get_ipython as gi
-
 
 def get_user():
     return getpass.getuser()
@@ -27,10 +27,42 @@ def get_user_and_node():
     return f"{get_user()}@{get_node()}"
 
 
+def get_n_workers(workers):
+    """
+    Return the number of workers (threads or processes) to use.
+
+    Parameters
+    ----------
+    workers : int or None
+        The requested number of workers. None or 1 means that the work is done
+        sequentially, and -1 that all the available processors are used.
+
+    Returns
+    -------
+    int
+        The number of workers (1 for a sequential work).
+
+    Raises
+    ------
+    ValueError
+        If `workers` is lower than 1 and different from -1.
+    """
+    if workers is None:
+        return 1
+    if workers == -1:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(
+            f"workers must be a positive integer or -1 (all the processors), not "
+            f"{workers}"
+        )
+    return int(workers)
+
+
 def _get_shell_type():
     # """Return the type of shell we are running in."""
     try:
-        shell = gi().__class__.__name__
+        shell = get_ipython().__class__.__name__
         if shell == "ZMQInteractiveShell":  # Jupyter notebook or qtconsole
             return "NOTEBOOK"
         if shell == "TerminalInteractiveShell":  # Terminal running IPython
@@ -41,6 +73,12 @@ def _get_shell_type():
 
 
 def get_ipython():
+    # an IPython shell can only be running if IPython was already imported, so we
+    # don't need to import it (which is slow) otherwise
+    if "IPython" not in sys.modules:
+        return None
+    from IPython import get_ipython as gi
+
     return gi()
 
 
@@ -125,3 +125,20 @@ class PositiveOddInteger(tr.Integer):
         if value < 0 or value % 2 == 0:
             self.error(obj, value)
         return super().validate(obj, value)
+
+
+class LazyInstance(tr.Instance):
+    """
+    An instance trait whose class, given by name, is imported at the first use.
+
+    `traitlets.Instance` imports it as soon as an object having this trait is
+    created, which is avoided here for classes of slow-to-import packages (e.g.,
+    matplotlib).
+    """
+
+    def instance_init(self, obj):
+        pass
+
+    def validate(self, obj, value):
+        self._resolve_classes()
+        return super().validate(obj, value)
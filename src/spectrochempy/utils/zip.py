@@ -3,16 +3,41 @@
 # CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
 # See full LICENSE agreement in the root directory.
 # ======================================================================================
+import functools
 import json
 import os
+import struct
+import zipfile
 from collections.abc import Mapping
 
+import numpy as np
+from numpy.lib import format as npformat
 from numpy.lib.format import read_array
 
+# Version of the scp format written by `NDIO.dump` .
+# Version 1 stores the whole object as a single json member, with the arrays pickled
+# and base64 encoded. Version 2 stores the arrays as separate (uncompressed by
+# default) npy members, next to a json member holding the metadata. Version 3 stores
+# the data of linear coordinates as their first value, spacing and size only.
+SCP_FORMAT_VERSION = 3
+SCP_COMMENT_PREFIX = b"spectrochempy-scp:"
+
+# size and structure of a zip local file header (see the zip APPNOTE, section 4.3.7)
+_LOCAL_HEADER_STRUCT = struct.Struct("<4s5H3L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
 
 # ======================================================================================
 # ZIP UTILITIES
 # ======================================================================================
+def _read_npy_header(fp):
+    # read the header of a npy file, fp being positioned at its beginning
+    version = npformat.read_magic(fp)
+    if version == (1, 0):
+        return npformat.read_array_header_1_0(fp)
+    return npformat.read_array_header_2_0(fp)
+
+
 def make_zipfile(file, **kwargs):
     """
     Create a ZipFile.
@@ -33,8 +58,6 @@ def make_zipfile(file, **kwargs):
     zipfile
 
     """
-    import zipfile
-
     kwargs["allowZip64"] = True
     return zipfile.ZipFile(file, **kwargs)
 
@@ -59,17 +82,27 @@ class ScpFile(Mapping):  # lgtm[py/missing-equals]
     fid : file or str
         The zipped archive to open. This is either a file-like object
         or a string containing the path to the archive.
+    mmap_mode : {None, 'r', 'c'}, optional
+        If not None, the ` .npy` members stored without compression are
+        memory-mapped using the given mode (see `numpy.memmap` ) instead of being
+        read in memory. This requires the archive to be a file on disk.
+        Compressed members are always read in memory.
 
     Attributes
     ----------
     files : list of str
-        List of all files in the archive with a ` .npy` extension.
+        List of all files in the archive.
     zip : ZipFile instance
         The ZipFile object initialized with the zipped archive.
+    version : int
+        Version of the scp format of the archive.
+    deferred : set of str
+        Names of the ` .npy` members which must not be read, but returned as a
+        `DeferredArray` (only for archives on disk).
 
     """
 
-    def __init__(self, fid):
+    def __init__(self, fid, mmap_mode=None):
         _zip = make_zipfile(fid)
 
         self.files = _zip.namelist()
@@ -80,6 +113,20 @@ class ScpFile(Mapping):  # lgtm[py/missing-equals]
         else:
             self.fid = None
 
+        self.version = 1
+        comment = _zip.comment
+        if comment.startswith(SCP_COMMENT_PREFIX):
+            self.version = int(comment[len(SCP_COMMENT_PREFIX) :])
+
+        # memory mapping and deferred reading are only possible if we know the path
+        # of the archive
+        path = fid if isinstance(fid, str | os.PathLike) else getattr(fid, "name", None)
+        self.path = os.fspath(path) if isinstance(path, str | os.PathLike) else None
+        self.mmap_mode = mmap_mode
+
+        # npy members for which a `DeferredArray` is returned instead of the array
+        self.deferred = set()
+
     def __enter__(self):
         return self
 
@@ -121,6 +168,15 @@ class ScpFile(Mapping):  # lgtm[py/missing-equals]
             _, ext = os.path.splitext(key)
 
         if member and ext in [".npy"]:
+            info = self.zip.getinfo(key)
+            if self.path is not None and key in self.deferred:
+                return DeferredArray(self.path, key)
+            if (
+                self.path is not None
+                and self.mmap_mode is not None
+                and info.compress_type == zipfile.ZIP_STORED
+            ):
+                return self._memmap(info)
             f = self.zip.open(key)
             return read_array(f, allow_pickle=True)
 
@@ -133,7 +189,9 @@ class ScpFile(Mapping):  # lgtm[py/missing-equals]
 
         if member and ext in [".json"]:
             content = self.zip.read(key)
-            return json.loads(content, object_hook=json_decoder)
+            return json.loads(
+                content, object_hook=functools.partial(json_decoder, arrays=self)
+            )
 
         if member:
             return self.zip.read(key)
@@ -142,3 +200,227 @@ class ScpFile(Mapping):  # lgtm[py/missing-equals]
 
     def __contains__(self, key):
         return self.files.__contains__(key)
+
+    def member_offset(self, info):
+        """
+        Return the position of the content of an uncompressed member in the archive.
+
+        Parameters
+        ----------
+        info : `zipfile.ZipInfo`
+            Information on the member.
+
+        Returns
+        -------
+        int
+            Offset of the first byte of the member content.
+        """
+        fp = self.zip.fp
+        pos = fp.tell()
+        try:
+            fp.seek(info.header_offset)
+            header = _LOCAL_HEADER_STRUCT.unpack(fp.read(_LOCAL_HEADER_STRUCT.size))
+        finally:
+            fp.seek(pos)
+        if header[0] != _LOCAL_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile(f"Bad local header for member {info.filename}")
+        # the local header is followed by the file name and the extra field
+        return info.header_offset + _LOCAL_HEADER_STRUCT.size + header[-2] + header[-1]
+
+    def npy_header(self, key):
+        """
+        Read the header of a ` .npy` member.
+
+        Parameters
+        ----------
+        key : str
+            Name of the member.
+
+        Returns
+        -------
+        shape : tuple of int
+            Shape of the stored array.
+        fortran_order : bool
+            True if the array is stored in Fortran order.
+        dtype : `numpy.dtype`
+            Data type of the stored array.
+        offset : int
+            Position of the first byte of the array data in the archive, or in the
+            uncompressed member if it is compressed.
+        """
+        info = self.zip.getinfo(key)
+        if info.compress_type != zipfile.ZIP_STORED:
+            # the offset is relative to the beginning of the uncompressed member
+            with self.zip.open(key) as f:
+                shape, fortran_order, dtype = _read_npy_header(f)
+                return shape, fortran_order, dtype, f.tell()
+
+        fp = self.zip.fp
+        pos = fp.tell()
+        try:
+            fp.seek(self.member_offset(info))
+            shape, fortran_order, dtype = _read_npy_header(fp)
+            offset = fp.tell()
+        finally:
+            fp.seek(pos)
+        return shape, fortran_order, dtype, offset
+
+    def _memmap(self, info):
+        # memory-map an uncompressed npy member of the archive
+        shape, fortran_order, dtype, offset = self.npy_header(info.filename)
+        if dtype.hasobject or not shape or 0 in shape:
+            f = self.zip.open(info.filename)
+            return read_array(f, allow_pickle=True)
+        mm = np.memmap(
+            self.path,
+            dtype=dtype,
+            mode=self.mmap_mode,
+            offset=offset,
+            shape=shape,
+            order="F" if fortran_order else "C",
+        )
+        # return a plain ndarray view (the memmap is kept alive as its base)
+        return mm.view(np.ndarray)
+
+
+class DeferredArray:
+    """
+    Read-only proxy on an array stored as a ` .npy` member of a scp archive.
+
+    Only the array header is read at creation. Indexing the proxy reads only the
+    requested part of the array, while the whole array is read when it is converted
+    with `numpy.asarray` .
+
+    The archive is kept open (or memory-mapped) until the proxy is deleted, so that
+    the proxy remains valid even if the file is replaced on disk.
+
+    Parameters
+    ----------
+    path : str or `pathlib.Path`
+        Path of the scp archive.
+    key : str
+        Name of the ` .npy` member in the archive.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Shape of the array.
+    dtype : `numpy.dtype`
+        Data type of the array.
+    """
+
+    def __init__(self, path, key):
+        self.path = os.fspath(path)
+        self.key = key
+        self._mm = None
+        self._fp = None
+
+        with ScpFile(self.path) as f:
+            compressed = f.zip.getinfo(key).compress_type != zipfile.ZIP_STORED
+            self.shape, self.fortran_order, self.dtype, self.offset = f.npy_header(key)
+
+        if self.dtype.hasobject:
+            raise TypeError("Arrays of objects can not be deferred.")
+
+        if not compressed and self.size > 0:
+            self._mm = np.memmap(
+                self.path,
+                dtype=self.dtype,
+                mode="r",
+                offset=self.offset,
+                shape=self.shape,
+                order="F" if self.fortran_order else "C",
+            )
+        else:
+            self._fp = open(self.path, "rb")  # noqa: SIM115
+
+    def __del__(self):
+        if getattr(self, "_fp", None) is not None:
+            self._fp.close()
+
+    def __repr__(self):
+        return (
+            f"DeferredArray(shape={self.shape}, dtype={self.dtype}, "
+            f"member={self.key!r})"
+        )
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self, dtype=None, copy=None):
+        data = self.read()
+        return data if dtype is None else data.astype(dtype, copy=False)
+
+    def __getitem__(self, keys):
+        if self._mm is not None:
+            return np.array(self._mm[keys])
+
+        if not isinstance(keys, tuple):
+            keys = (keys,)
+        first, rest = keys[0], keys[1:]
+        if (
+            self.fortran_order
+            or self.ndim == 0
+            or any(not isinstance(key, slice) for key in rest)
+            or not isinstance(first, slice | int | np.integer | list | np.ndarray)
+            or (isinstance(first, np.ndarray) and first.ndim != 1)
+        ):
+            # no partial reading in these cases
+            return self.read()[keys]
+
+        rows = np.arange(self.shape[0])[first]
+        block = self._read_rows(np.atleast_1d(rows))
+        if rows.ndim == 0:
+            block = block[0]
+        else:
+            rest = (slice(None),) + rest
+        return block[rest]
+
+    def _read_rows(self, rows):
+        # Read some rows (along the first axis) of a compressed member.
+        # Rows are read in increasing order, so that the decompression stream
+        # is never rewound.
+        rowsize = int(np.prod(self.shape[1:], dtype=np.int64)) * self.dtype.itemsize
+        unique, inverse = np.unique(rows, return_inverse=True)
+        block = np.empty((unique.size,) + self.shape[1:], dtype=self.dtype)
+        if block.size == 0:
+            return block[inverse]
+        buffer = block.reshape(unique.size, -1).view(np.uint8)
+
+        # group consecutive rows in runs read at once
+        breaks = np.flatnonzero(np.diff(unique) != 1) + 1
+        starts = np.concatenate(([0], breaks))
+        stops = np.concatenate((breaks, [unique.size]))
+
+        with make_zipfile(self._fp) as zf, zf.open(self.key) as member:
+            for start, stop in zip(starts, stops, strict=True):
+                member.seek(self.offset + int(unique[start]) * rowsize)
+                nbytes = (stop - start) * rowsize
+                buffer[start:stop] = np.frombuffer(
+                    member.read(nbytes), dtype=np.uint8
+                ).reshape(stop - start, -1)
+        return block[inverse]
+
+    @property
+    def ndim(self):
+        """Number of dimensions of the array."""
+        return len(self.shape)
+
+    @property
+    def size(self):
+        """Number of elements of the array."""
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    def read(self):
+        """
+        Read the whole array.
+
+        Returns
+        -------
+        `~numpy.ndarray`
+            The array.
+        """
+        if self._mm is not None:
+            return np.array(self._mm)
+        with make_zipfile(self._fp) as zf, zf.open(self.key) as member:
+            return read_array(member)
@@ -6,11 +6,15 @@
 # ruff: noqa
 import os
 
+import numpy as np
 import pytest
+from scipy import sparse
+from scipy.sparse.linalg import spsolve
 
 import spectrochempy as scp
 from spectrochempy.core.units import ur
 from spectrochempy.processing.baselineprocessing.baselineprocessing import Baseline
+from spectrochempy.processing.baselineprocessing.baselineutils import asls_baseline
 from spectrochempy.utils.mplutils import show
 from spectrochempy.utils.testing import assert_dataset_equal
 
@@ -205,3 +209,60 @@ def test_baseline_polynomial(IR_dataset_2D):
     blc.fit(X)
 
     blc.plot()
+
+
+def test_asls_baseline():
+    # synthetic series of spectra: a gaussian peak on a quadratic baseline
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 1, 500)
+    Y = np.array(
+        [
+            np.exp(-(((x - 0.5) / 0.02) ** 2)) * (1 + 0.05 * k)
+            + 0.3 * x**2
+            + 0.2 * x
+            + 0.01 * rng.standard_normal(500)
+            for k in range(8)
+        ]
+    )
+    lamb, p, tol = 1e6, 0.01, 1e-3
+
+    # reference: general sparse solver
+    N = Y.shape[1]
+    D = sparse.diags([1, -2, 1], [0, -1, -2], shape=(N, N - 2))
+    expected = []
+    for y in Y:
+        mi = y.min()
+        y = y - mi
+        w, w_old = np.ones(N), 1e5
+        for _ in range(51):
+            z = spsolve(sparse.spdiags(w, 0, N, N) + lamb * D @ D.T, w * y)
+            w = p * (y > z) + (1 - p) * (y < z)
+            if np.sum(np.abs(w_old - w)) / N <= tol:
+                break
+            w_old = w
+        expected.append(z + mi)
+
+    baselines, n_iter, converged = asls_baseline(Y, lamb, p, tol)
+    assert np.allclose(baselines, expected, rtol=0, atol=1e-8)
+    assert converged.all()
+
+    # 1D data
+    baseline, _, _ = asls_baseline(Y[0], lamb, p, tol)
+    assert np.array_equal(baseline, baselines[0])
+
+    # warm start of the weights
+    warm, n_iter_warm, converged = asls_baseline(Y, lamb, p, tol, warm_start=True)
+    assert converged.all()
+    assert n_iter_warm.sum() <= n_iter.sum()
+    assert np.allclose(warm, expected, atol=1e-2)
+
+    # parallel fit of the rows
+    parallel, _, _ = asls_baseline(Y, lamb, p, tol, workers=2)
+    assert np.array_equal(parallel, baselines)
+
+    # through the Baseline processor
+    ds = scp.NDDataset(Y)
+    ds.set_coordset(y=None, x=scp.Coord(x * 1000))
+    blc = Baseline(model="asls", lamb=lamb, asymmetry=p, tol=tol, workers=2)
+    blc.fit(ds)
+    assert np.allclose(blc.baseline.data, baselines)
@@ -142,3 +142,32 @@ def test_models():
 #     array = scp.asymmetricvoigtmodel().f(x, ratio=0, asym=2, **kwargs)
 #     array.plot(ax=ax, clear=False)
 #     plt.show()
+
+
+def test_models_jacobian():
+    # analytic jacobians are compared with central finite differences
+    x = np.linspace(3800.0, 3300.0, 500)
+    cases = [
+        (scp.polynomialbaseline(), [0.5, 1.0e-4, -2.0e-7]),
+        (scp.gaussianmodel(), [2.0, 3520.0, 40.0]),
+        (scp.lorentzianmodel(), [2.0, 3520.0, 40.0]),
+        (scp.voigtmodel(), [2.0, 3520.0, 40.0, 0.3]),
+        (scp.asymmetricvoigtmodel(), [2.0, 3520.0, 40.0, 0.3, 0.5]),
+        (scp.asymmetricvoigtmodel(), [2.0, 3520.0, 40.0, 0.0, 0.5]),
+        (scp.asymmetricvoigtmodel(), [2.0, 3520.0, 40.0, 0.3, -0.5]),
+        (scp.sigmoidmodel(), [2.0, 3520.0, 0.05]),
+    ]
+    for model, args in cases:
+        jac = model.jacobian(x, *args)
+        assert jac.shape == (len(args), x.size)
+        for i in range(len(args)):
+            h = 1.0e-5 * max(1.0, abs(args[i]))
+            up, down = list(args), list(args)
+            up[i] += h
+            down[i] -= h
+            if i == 3 and args[3] == 0.0:
+                # ratio is not defined below 0
+                down[i] += h
+                h /= 2.0
+            fd = (model.f(x, *up) - model.f(x, *down)) / (2.0 * h)
+            assert np.allclose(jac[i], fd, rtol=1.0e-4, atol=1.0e-5 * np.abs(fd).max())
@@ -57,3 +57,195 @@ def test_fit_single_dataset(IR_dataset_2D, script):
     f1.autobase = True
     f1.max_iter = 10
     f1.fit(dataset)
+
+
+def test_evaluation_plan():
+    import numpy as np
+
+    from spectrochempy.analysis.curvefitting.optimize import _EvaluationPlan
+    from spectrochempy.analysis.curvefitting.optimize import getmodel
+
+    x = np.linspace(3800.0, 3300.0, 300)
+    script = """
+    COMMON:
+    $ gwidth: 30.0, 5.0, 100.0
+    $ shift: 2.0, -5.0, 5.0
+
+    MODEL: LINE_1
+    shape: lorentzianmodel
+        $ ampl: 1.0, 0.0, none
+        > pos: 3500.0 + shift
+        > width: sqrt(gwidth**2) / 2
+
+    MODEL: LINE_2
+    shape: gaussianmodel
+        $ ampl: 0.5, 0.0, none
+        > pos: 3600.0 - 2 * shift
+        > width: gwidth
+
+    MODEL: baseline1
+    shape: polynomialbaseline
+        $ ampl: 0.1, 0.0, none
+        $ c_2: 1.0e-6, -1.0, 1.0
+    """
+    f1 = Optimize()
+    f1.script = script
+    plan = _EvaluationPlan(f1.fp)
+
+    # the parameters defined by references are evaluated
+    values = dict(zip(plan.keys, plan.values(f1.fp), strict=True))
+    assert values["pos_line_1"] == 3502.0
+    assert values["pos_line_2"] == 3596.0
+    assert values["width_line_1"] == 15.0
+
+    # the models are the same as those calculated one by one
+    par = f1.fp.copy()
+    for key, value in values.items():
+        par.reference[key] = False
+        par.data[key] = value
+    results = plan.evaluate(x, f1.fp)
+    assert [model for model, _ in results] == ["line_1", "line_2", "baseline1"]
+    for model, calc in results:
+        assert np.array_equal(calc, getmodel(x, modelname=model, par=par))
+
+    # new parameter values are taken into account
+    f1.fp.data["shift"] = -1.0
+    assert plan.values(f1.fp)[plan.keys.index("pos_line_1")] == 3499.0
+
+    # a new script invalidates the plan
+    f1._plan = plan
+    f1.script = script.replace("3500.0 + shift", "3450.0 + shift")
+    assert f1._plan is None
+
+    # errors in expressions
+    with pytest.raises(ValueError):
+        f1.script = script.replace("3500.0 + shift", "3500.0 + unknown")
+        _EvaluationPlan(f1.fp).values(f1.fp)
+
+
+def test_optimize_jacobian():
+    import numpy as np
+
+    import spectrochempy as scp
+
+    x = np.linspace(3800.0, 3300.0, 400)
+    y = 3.0 / (1.0 + ((x - 3502.0) / 7.5) ** 2)
+    y += 0.5 * np.exp(-(((x - 3596.0) / 20.0) ** 2)) + 1.0e-4 * x + 0.2
+    y += np.random.default_rng(0).normal(0.0, 0.01, x.size)
+    X = scp.NDDataset(y[None], coordset=[None, scp.Coord(x, title="wavenumbers")])
+    X[:, 3750.0:3700.0] = scp.MASKED
+
+    script = """
+    COMMON:
+    $ gwidth: 30.0, 5.0, 100.0
+    $ shift: 1.0, -5.0, 5.0
+
+    MODEL: LINE_1
+    shape: lorentzianmodel
+        $ ampl: 1.0, 0.0, none
+        > pos: 3500.0 + shift
+        > width: sqrt(gwidth**2) / 2
+
+    MODEL: LINE_2
+    shape: asymmetricvoigtmodel
+        $ ampl: 0.5, 0.0, none
+        $ pos: 3590.0, 3550, 3650
+        > width: gwidth
+        $ ratio: 0.5, 0, 1
+        * asym: 0.1, 0, 1
+    """
+
+    # the jacobian of the model sum is compared with finite differences
+    for autobase in [False, True]:
+        f1 = Optimize(autobase=autobase, dry=True)
+        f1.script = script
+        f1.fit(X)
+        data = f1._X.data
+        jac = f1._get_jacobian(data)
+        for k, key in enumerate(f1._plan.keys):
+            if f1.fp.reference[key]:
+                assert not np.any(jac[:, k])
+                continue
+            value = f1.fp.data[key]
+            h = 1.0e-3
+            f1.fp.data[key] = value + h
+            up = f1._get_modeldata(data)[0][-1]
+            f1.fp.data[key] = value - h
+            down = f1._get_modeldata(data)[0][-1]
+            f1.fp.data[key] = value
+            fd = (up - down) / (2.0 * h)
+            assert np.allclose(jac[:, k], fd, atol=1.0e-4 * np.abs(fd).max())
+
+    # the fits with and without the jacobian give the same results
+    fits = []
+    for use_jacobian in [True, False]:
+        f1 = Optimize(autobase=True, use_jacobian=use_jacobian)
+        f1.script = script
+        f1.fit(X)
+        fits.append(f1)
+    for key in ["shift", "gwidth", "pos_line_2"]:
+        assert_approx_equal(fits[0].fp[key], fits[1].fp[key], significant=4)
+
+
+def test_optimize_2D():
+    import numpy as np
+
+    import spectrochempy as scp
+
+    # a series of spectra with a shifting lorentzian line
+    x = np.linspace(3800.0, 3300.0, 300)
+    t = np.linspace(0.0, 50.0, 6)
+    pos = 3500.0 + 0.5 * t
+    y = 2.0 / (1.0 + ((x - pos[:, np.newaxis]) / 10.0) ** 2)
+    y += 0.5 * np.exp(-(((x - 3600.0) / 20.0) ** 2)) + 0.1
+    y += np.random.default_rng(0).normal(0.0, 0.005, y.shape)
+    X = scp.NDDataset(
+        y,
+        coordset=[
+            scp.Coord(t, title="time", units="min"),
+            scp.Coord(x, title="wavenumbers", units="cm^-1"),
+        ],
+    )
+
+    script = """
+    MODEL: LINE_1
+    shape: lorentzianmodel
+        $ ampl: 1.0, 0.0, none
+        $ pos: 3505.0, 3450.0, 3550.0
+        $ width: 25.0, 5.0, 100.0
+
+    MODEL: LINE_2
+    shape: gaussianmodel
+        $ ampl: 0.5, 0.0, none
+        $ pos: 3600.0, 3550, 3650
+        > width: 2 * width_line_1
+    """
+
+    f1 = Optimize(autobase=True)
+    f1.script = script
+    f1.fit(X)
+    assert f1.inverse_transform().shape == X.shape
+    assert f1.transform().shape == (6, 2)
+
+    # the parameters of each row are indexed by the y coordinate
+    params = f1.fit_parameters
+    assert set(params) == set(f1.fp.keys())
+    assert params["pos_line_1"].shape == (6,)
+    assert params["pos_line_1"].y.title == "time"
+    assert np.allclose(params["pos_line_1"].data, pos, atol=0.1)
+    assert np.allclose(params["width_line_2"].data, 2 * params["width_line_1"].data)
+    # the final script is that of the last row
+    assert_approx_equal(f1.fp["pos_line_1"], pos[-1], significant=4)
+
+    # rows fitted without warm start or in separate processes
+    for kwargs in [{"row_warm_start": False}, {"workers": 2}]:
+        f2 = Optimize(autobase=True, **kwargs)
+        f2.script = script
+        f2.fit(X)
+        assert np.allclose(f2.fit_parameters["pos_line_1"].data, pos, atol=0.1)
+
+    # masked rows are not fitted
+    X[2] = scp.MASKED
+    f1.fit(X)
+    assert f1.fit_parameters["pos_line_1"].shape == (6,)
+    assert f1.fit_parameters["pos_line_1"].mask[2]
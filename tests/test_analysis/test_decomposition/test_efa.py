@@ -156,3 +156,30 @@ def test_EFA(IR_dataset_2D):
     C.T.plot()
 
     show()
+
+
+def test_EFA_eigenvalues():
+    # compare the incremental eigenvalues with the SVD of the sub-matrices
+    rng = np.random.default_rng(0)
+    t = np.arange(200.0)[:, None]
+    C = np.exp(-(((t - [[50.0, 90.0, 150.0]]) / [[20.0, 30.0, 25.0]]) ** 2))
+    X = C @ rng.random((3, 30)) + rng.normal(0.0, 0.01, (200, 30))
+
+    efa = scp.EFA()
+    efa.fit(scp.NDDataset(X))
+    f, b = efa.f_ev.data, efa.b_ev.data
+    assert f.shape == b.shape == (200, 30)
+    for i in [0, 10, 29, 30, 120, 199]:
+        s2 = np.linalg.svd(X[: i + 1], compute_uv=False) ** 2
+        assert np.allclose(f[i, : s2.size], s2, rtol=1e-8)
+        assert np.all(f[i, s2.size :] == 0)
+        s2 = np.linalg.svd(X[i:], compute_uv=False) ** 2
+        assert np.allclose(b[i, : s2.size], s2, rtol=1e-8)
+
+    # truncated decomposition: the largest eigenvalues are kept
+    efa8 = scp.EFA(max_components=8)
+    efa8.fit(scp.NDDataset(X))
+    assert efa8.f_ev.shape == (200, 8)
+    assert np.allclose(efa8.f_ev.data[:, :3], f[:, :3], rtol=0.1, atol=1e-3 * f.max())
+    efa.n_components = efa8.n_components = 3
+    assert np.allclose(efa8.transform().data, efa.transform().data, atol=1e-3 * f.max())
@@ -197,3 +197,31 @@ def test_IRIS():
     iris4.fit(X, K7)
     f7 = iris4.f
     assert f7.shape == (1, q[2], X.shape[1])
+
+
+def test_IRIS_workers():
+    # synthetic isotherms of two bands with distributions of adsorption energies
+    p = np.linspace(0.005, 1.0, 15)
+    energies = np.linspace(-8.0, -1.0, 30)
+    theta = np.exp(-energies) * p[:, None] / (1 + np.exp(-energies) * p[:, None])
+    nu = np.linspace(2200.0, 2000.0, 40)
+    fdist = np.exp(-(((energies + 5.0) / 1.0) ** 2))[:, None]
+    data = theta @ (fdist * np.exp(-(((nu - 2100.0) / 20.0) ** 2))) * 0.02
+    X = scp.NDDataset(
+        data,
+        coordset=[
+            scp.Coord(p, title="pressure", units="torr"),
+            scp.Coord(nu, title="wavenumbers", units="cm^-1"),
+        ],
+    )
+    K = scp.IrisKernel(X, "langmuir", q=[-8, -1, 30])
+
+    iris1 = scp.IRIS(reg_par=[-4, 0, 6])
+    iris1.fit(X, K)
+    iris2 = scp.IRIS(reg_par=[-4, 0, 6], workers=2)
+    iris2.fit(X, K)
+    assert iris2.f.shape == iris1.f.shape == (6, 30, 40)
+    assert np.all(iris1.lambdas.data == iris2.lambdas.data)
+    assert np.all(iris2.f.data == iris1.f.data)
+    assert np.all(iris1.f.data > -1e-3)
+    assert np.max(iris1.RSS) < 1e-3 * np.sum(data**2)
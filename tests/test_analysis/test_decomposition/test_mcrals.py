@@ -12,7 +12,13 @@ import pytest
 import traitlets as tr
 
 import spectrochempy as scp
-from spectrochempy.analysis.decomposition.mcrals import MCRALS
+from spectrochempy.analysis.decomposition.mcrals import (
+    MCRALS,
+    _fnnls,
+    _hold_1D,
+    _nnls,
+    _unimodal_1D,
+)
 from spectrochempy.application.application import set_loglevel
 from spectrochempy.core.dataset.nddataset import Coord, NDDataset
 from spectrochempy.processing.transformation.npy import dot
@@ -257,6 +263,13 @@ def test_MCRALS(model, data):
     mcr.fit(D, St0.data)
     assert "converged !" in mcr.log[-15:]
 
+    # solvers fnnls give the same results as nnls
+    mcr2 = MCRALS(tol=15.0, nonnegConc=[], solverConc="fnnls", solverSpec="fnnls")
+    mcr2.fit(D, St0.data)
+    assert "converged !" in mcr2.log[-15:]
+    assert np.allclose(mcr2.C.data, mcr.C.data)
+    assert np.allclose(mcr2.St.data, mcr.St.data)
+
     # solverConc pnnls
     mcr = MCRALS(
         tol=15.0, nonnegConc=[0], solverConc="pnnls", nonnegSpec=[0], solverSpec="pnnls"
@@ -369,3 +382,40 @@ def test_MCRALS_errors(model, data):
     with pytest.raises(ValueError) as e:
         mcr.nonnegSpec = [0, 1, 1]
     assert "please check the" in e.value.args[0]
+
+
+def test_MCRALS_fnnls():
+    rng = np.random.default_rng(0)
+    for nsamp, nfeat, ntarg in [(50, 3, 200), (20, 6, 30), (10, 1, 5)]:
+        X = rng.normal(size=(nsamp, nfeat))
+        Y = rng.normal(size=(nsamp, ntarg))
+        W, res = _nnls(X, Y, withres=True)
+        Wf, resf = _fnnls(X, Y, withres=True)
+        assert np.all(Wf >= 0)
+        assert np.allclose(Wf, W, atol=1.0e-10)
+        assert np.isclose(resf, res)
+
+
+def test_MCRALS_vectorized_constraints():
+    # reference implementation: the element-wise loops
+    def hold(a, deviates):
+        a = a.copy()
+        for i in range(1, a.size):
+            if deviates(a[i], a[i - 1]):
+                a[i] = a[i - 1]
+        return a
+
+    rng = np.random.default_rng(0)
+    t = np.linspace(0, 10, 5000)
+    for noise in [0.0, 0.001, 0.05]:
+        for tol in [1.0, 1.1]:
+            a = np.exp(-t) + np.exp(-((t - 3) ** 2)) + noise * rng.normal(size=t.size)
+            for deviates in [lambda c, r: c < r / tol, lambda c, r: c > r * tol]:
+                assert np.array_equal(_hold_1D(a, deviates), hold(a, deviates))
+
+            # strict unimodality is the same correction on both sides of the maximum
+            maxid = np.argmax(a)
+            expected = a.copy()
+            expected[maxid::-1] = hold(a[maxid::-1], lambda c, r: c > r * tol)
+            expected[maxid:] = hold(a[maxid:], lambda c, r: c > r * tol)
+            assert np.array_equal(_unimodal_1D(a.copy(), tol, "strict"), expected)
@@ -64,3 +64,34 @@ def test_simplisma():
     # assert "3     29      29.0     0.0072     0.9981" in pure.logs
 
     show()
+
+
+def test_SIMPLISMA_purity():
+    import numpy as np
+
+    # mixtures of 3 gaussian bands
+    rng = np.random.default_rng(0)
+    x = np.linspace(0.0, 1.0, 300)
+    St = np.exp(-(((x - np.array([[0.2], [0.5], [0.7]])) / 0.05) ** 2))
+    X = rng.random((20, 3)) @ St + rng.normal(0.0, 1.0e-3, (20, 300))
+    X -= min(X.min(), 0.0)
+
+    sma = SIMPLISMA(n_components=3, tol=0.0)
+    sma.fit(NDDataset(X))
+    Pt = sma._outfit[2]
+    maxPIndex = list(np.argmax(Pt, axis=1))
+    # the pure variables are at the maxima of the bands
+    assert np.allclose(np.sort(x[maxPIndex]), [0.2, 0.5, 0.7], atol=0.02)
+
+    # purity spectra computed from the determinants of the submatrices of the whole
+    # COO matrix
+    sigma, mu = np.std(X, axis=0), np.mean(X, axis=0)
+    alpha = 0.03 * np.max(mu)
+    Xscaled = X / np.sqrt(mu**2 + (sigma + alpha) ** 2)
+    COO = Xscaled.T @ Xscaled / 20
+    for j in range(1, 3):
+        w = [
+            np.linalg.det(COO[np.ix_([i] + maxPIndex[:j], [i] + maxPIndex[:j])])
+            for i in range(300)
+        ]
+        assert np.allclose(Pt[j], sigma / (mu + alpha) * np.array(w))
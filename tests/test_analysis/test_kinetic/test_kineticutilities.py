@@ -172,3 +172,108 @@ def test_ABC():
         _ = c_exp.T.plot(marker="o", linewidth=0.0, clear=True)
         _ = c_opt.T.plot(clear=False)
         show()
+
+
+def test_rate_law():
+    reactions = ("A + B -> C", "2 C -> D", "D -> A + E")
+    species_concentrations = {"A": 1.0, "B": 0.8, "C": 0.0, "D": 0.0, "E": 0.0}
+    k = np.array([1.0, 0.5, 0.2])
+    kin = ku.ActionMassKinetics(reactions, species_concentrations, k)
+
+    # production rates compared with the generated expressions
+    rate_law = kin._rate_law
+    C = np.array([0.7, 0.3, 0.2, 0.1, 0.05])
+    expected = eval(kin._write_production_rates())
+    assert np.allclose(rate_law.production_rates(k, 0.0, C), expected)
+
+    # jacobian compared with finite differences
+    h = 1.0e-6
+    fd = [
+        (
+            rate_law.production_rates(k, 0.0, C + dC)
+            - rate_law.production_rates(k, 0.0, C - dC)
+        )
+        / (2 * h)
+        for dC in np.eye(5) * h
+    ]
+    assert np.allclose(rate_law.jacobian(k, 0.0, C), np.array(fd).T, atol=1e-8)
+    assert np.allclose(rate_law.jacobian(k, 0.0, C), eval(kin._write_jacobian()))
+    C[1] = 0.0
+    assert np.all(np.isfinite(rate_law.jacobian(k, 0.0, C)))
+
+    # the rate law is kept between integrations...
+    time = np.linspace(0.0, 10.0, 20)
+    C1 = kin.integrate(time, return_NDDataset=False)
+    C2 = kin.integrate(time, return_NDDataset=False, use_jac=True, method="BDF")
+    assert kin._rate_law is rate_law
+    assert np.allclose(C1, C2, atol=1e-3)
+    # mass balance on A + C + 2D
+    assert np.allclose(C1[:, 0] + C1[:, 2] + 2 * C1[:, 3] + C1[:, 4], 1.0, atol=1e-3)
+
+    # ... and updated when the reaction network changes
+    kin._reactions = ["A + B -> C", "2 C -> D", "D -> 2 A + E"]
+    assert kin._rate_law is not rate_law
+    assert kin._rate_law.BmAt[0, 2] == 2.0
+    assert np.allclose(kin._rate_law.jacobian(k, 0.0, C), eval(kin._write_jacobian()))
+
+
+def test_multiple_conditions():
+    reactions = ("A -> B", "B -> C", "2 A -> C")
+    species_concentrations = (
+        {"A": 1.0, "B": 0.0, "C": 0.0},
+        {"A": 0.5, "B": 0.2, "C": 0.0},
+        {"A": 1.0, "B": 0.0, "C": 0.1},
+    )
+    k_exp = np.array(((1.0e8, 52.0e3), (1.0e8, 50.0e3), (1.0e7, 49.0e3)))
+    T = (298.0, 308.0, lambda t: 298.0 + 2.0 * t)
+    time = [np.linspace(0.0, 10.0, 30), np.linspace(0.0, 5.0, 20)] * 2
+    kin = ku.ActionMassKinetics(reactions, species_concentrations, k_exp, T=T)
+
+    # parallel integration: same results in the same order
+    C = kin.integrate(time, k_dt=0.01, return_NDDataset=False)
+    Cw = kin.integrate(time, k_dt=0.01, return_NDDataset=False, workers=2)
+    for c, cw in zip(C, Cw, strict=True):
+        assert np.array_equal(c, cw)
+
+    # sensitivities compared with finite differences
+    params = ["k[0].A", "k[1].Ea", "k[2].b"]
+    scale = np.abs(kin._arrhenius[[0, 1, 2], [0, 2, 1]])
+    scale[scale == 0] = 1.0
+    bunches = kin._solve(time, 0.01, "LSODA", False, 1e-8, 1e-8, params, scale)
+    for j, param in enumerate(params):
+        i, column = kin._parse_parameter(param)
+        value = kin._arrhenius[i, column]
+        # (large steps limit the noise of the integration of the non-isothermal
+        # condition)
+        h = 1.0e-3 * scale[j]
+        kin._arrhenius[i, column] = value + h
+        Cp = kin._solve(time, 0.01, "LSODA", False, 1e-10, 1e-10)
+        kin._arrhenius[i, column] = value - h
+        Cm = kin._solve(time, 0.01, "LSODA", False, 1e-10, 1e-10)
+        kin._arrhenius[i, column] = value
+        for bunch, bp, bm in zip(bunches, Cp, Cm, strict=True):
+            S = bunch.y[3:].reshape(3, 3, -1)[:, j]
+            fd = (bp.y - bm.y) / (2 * h) * scale[j]
+            assert np.allclose(S, fd, rtol=1e-3, atol=1e-4)
+
+    # gradient-based fit
+    T = (298.0, 308.0)
+    species_concentrations = species_concentrations[:2]
+    time = time[:2]
+    k_exp = k_exp[:2]
+    kin_exp = ku.ActionMassKinetics(reactions[:2], species_concentrations, k_exp, T=T)
+    C_exp = kin_exp.integrate(time)
+    k_guess = np.array(((1.5e8, 52.0e3), (1.0e8, 55.0e3)))
+    kin_guess = ku.ActionMassKinetics(
+        reactions[:2], species_concentrations, k_guess, T=T
+    )
+    res = kin_guess.fit_to_concentrations(
+        C_exp,
+        iexp=[0, 1, 2],
+        i2iexp=[0, 1, 2],
+        dict_param_to_optimize={"k[0].A": 1.1e8, "k[1].Ea": 49.0e3},
+        optimizer_kwargs={"jac": True},
+        ivp_solver_kwargs={"atol": 1e-10, "rtol": 1e-8, "workers": 2},
+    )
+    assert np.allclose(res[2]["x"], [1.0e8, 50.0e3], rtol=1e-3)
+    assert res[2]["nfev"] < 50
@@ -12,6 +12,7 @@ import spectrochempy as scp
 from spectrochempy.application.application import app
 from unittest.mock import patch
 import subprocess
+import sys
 
 
 def test_app_initialization():
@@ -107,5 +108,37 @@ def test_get_release_date_with_git():
     assert date != "unknown"
 
 
+def test_headless_mode():
+    """Test that plotting, IPython and network threads are deferred in headless mode"""
+    script = """
+import sys
+import threading
+import spectrochempy as scp
+
+ds = scp.NDDataset([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+ds = (ds * 2).sum(dim="x")
+assert "matplotlib" not in sys.modules
+assert "IPython" not in sys.modules
+assert threading.enumerate() == [threading.main_thread()]
+
+# matplotlib is set up at the first plot
+ax = ds.plot()
+assert "matplotlib" in sys.modules
+assert scp.preferences.method_1D == "pen"
+print("done")
+"""
+    env = os.environ | {"SCPY_HEADLESS": "1"}
+    env.pop("MPLBACKEND", None)
+    res = subprocess.run(
+        [sys.executable, "-c", script],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert res.returncode == 0, res.stderr
+    assert "done" in res.stdout
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,59 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+# ruff: noqa
+import io
+
+import pytest
+
+import spectrochempy as scp
+
+
+def test_import_profile():
+    """Test the report of the import cost of lazily resolved names"""
+    out = io.StringIO()
+    profile = scp.diagnostics.import_profile(["Coord", "NDDataset", "smooth"], file=out)
+    assert list(profile) == ["spectrochempy", "Coord", "NDDataset", "smooth"]
+
+    coord = profile["Coord"]
+    assert coord["error"] is None
+    assert coord["time"] > 0
+    assert "spectrochempy.core.dataset.coord" in coord["modules"]
+    assert coord["modules"]["spectrochempy.core.dataset.coord"] > 0
+    assert coord["total_modules"] > profile["spectrochempy"]["total_modules"]
+
+    # the modules shared with Coord are only charged to Coord
+    assert "spectrochempy.core.dataset.coord" not in profile["NDDataset"]["modules"]
+    assert "spectrochempy.processing.filter.filter" in profile["smooth"]["modules"]
+
+    report = out.getvalue()
+    assert "most expensive packages" in report
+    assert "smooth" in report
+
+    # in isolated mode, each name is charged with all its modules
+    profile = scp.diagnostics.import_profile(
+        ["Coord", "NDDataset"], isolated=True, file=None
+    )
+    assert "spectrochempy.core.dataset.coord" in profile["NDDataset"]["modules"]
+
+    with pytest.raises(ValueError, match="Unknown names"):
+        scp.diagnostics.import_profile("not_a_name")
+
+
+def test_import_budget():
+    """Check that importing the core objects stays within the module budget"""
+    overruns = scp.diagnostics.check_import_budget(max_time=float("inf"))
+    assert not overruns, "\n".join(overruns)
+
+    overruns = scp.diagnostics.check_import_budget(["Coord"], max_modules=10)
+    assert len(overruns) == 1
+    assert "Coord: " in overruns[0] and "modules loaded > 10" in overruns[0]
+
+
+@pytest.mark.import_time
+def test_import_time_budget():
+    """Check that importing the core objects stays within the time budget"""
+    overruns = scp.diagnostics.check_import_budget(max_modules=float("inf"))
+    assert not overruns, "\n".join(overruns)
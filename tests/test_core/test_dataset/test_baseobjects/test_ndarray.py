@@ -116,6 +116,44 @@ def test_ndarray_slicing_operations(slice_spec, expected_shape):
     assert isinstance(result, NDArray)
 
 
+def test_ndarray_view_slicing():
+    nd = NDArray(np.arange(20.0).reshape(4, 5), units="s", title="time")
+    nd[3] = MASKED
+
+    # basic slicing shares the buffers
+    row = nd.view[1:]
+    assert row.shape == (3, 5)
+    assert row.units == nd.units
+    assert row.title == "time"
+    assert np.shares_memory(row.data, nd.data)
+    assert np.shares_memory(row.mask, nd.mask)
+    assert not row.data.flags.writeable
+    assert_array_equal(row.data, nd.data[1:])
+    assert_array_equal(row.mask, nd.mask[1:])
+
+    # copy-on-write
+    row[0, 0] = -1.0
+    row[1] = MASKED
+    assert row.data[0, 0] == -1.0
+    assert nd.data[1, 0] == 5.0
+    assert row.mask[1].all()
+    assert not nd.mask[2].any()
+    assert not np.shares_memory(row.data, nd.data)
+
+    # modification of the original are seen in the view
+    row = nd.view[0]
+    nd.data[0, 1] = 100.0
+    assert row.data[0, 1] == 100.0
+
+    # fancy indexing always copies
+    sel = nd.view[[0, 2]]
+    assert not np.shares_memory(sel.data, nd.data)
+    assert sel.data.flags.writeable
+
+    # the default slicing still copies
+    assert not np.shares_memory(nd[0].data, nd.data)
+
+
 def test_ndarray_copy():
     d0 = NDArray(
         np.linspace(4000, 1000, 10),
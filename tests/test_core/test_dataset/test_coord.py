@@ -543,3 +543,79 @@ def test_linearcoord():
     assert isinstance(coord0, LinearCoord)
     assert coord0[0] == 1
     assert_array_equal(coord0.data, Coord.arange(1, 100, 10).data)
+
+
+def test_coord_rounded_data_cache():
+    # a non-linear axis, whose data are rounded at the first access only
+    x = np.sort(np.random.default_rng(0).uniform(100.0, 3500.0, 200))
+    coord0 = Coord(x, units="cm^-1", title="raman shift")
+    assert not coord0.linear
+    data = coord0.data
+    assert_array_equal(data, np.around(x, 3))
+    hits, misses = coord0._data_cache_hits, coord0._data_cache_misses
+    assert coord0.data is data
+    coord0.loc2index(1000.0)
+    assert coord0._data_cache_hits > hits
+    assert coord0._data_cache_misses == misses
+
+    # the rounded data are read-only, and so are the data while the rounded data are
+    # kept (the array given at the creation is left unchanged)
+    with pytest.raises(ValueError, match="read-only"):
+        data += 1000.0
+    with pytest.raises(ValueError, match="read-only"):
+        coord0._data *= 2
+    assert x.flags.writeable
+    assert_array_equal(coord0.data, np.around(x, 3))
+
+    # the cache is invalidated when the data, sigdigits or rounding change
+    coord0.sigdigits = 2
+    assert_array_equal(coord0.data, np.around(x, 3))
+    assert coord0._data_cache_misses == misses + 1
+    coord0[0] = 50.00001
+    assert coord0.data[0] == 50.0
+    coord0 += 1.00001
+    assert coord0.data[0] == 51.0
+    coord0._rounding = False
+    assert coord0.data[0] == 51.00001
+    coord0._rounding = True
+    coord0.data = x * 2
+    assert_array_equal(coord0.data, np.around(x * 2, 3))
+
+
+def test_coord_linear_range():
+    from spectrochempy.utils.numutils import LinearRange
+
+    x = np.linspace(4000.0, 1000.0, 3001)
+    coord0 = Coord(x, units="cm^-1", title="wavenumber")
+    # linear coordinates are stored as a range, and the array computed only on demand
+    assert coord0.linear
+    assert isinstance(coord0._deferred, LinearRange)
+    assert "_data" not in coord0._trait_values
+    assert not coord0.is_deferred
+    assert coord0.spacing == -1.0 * ur("cm^-1")
+    assert coord0.is_descendant
+
+    # copies and slices are ranges too
+    assert coord0.copy()._deferred is coord0._deferred
+    coord1 = coord0[10:2000:5]
+    assert isinstance(coord1._deferred, LinearRange)
+    assert_array_equal(coord1.data, np.around(x[10:2000:5], 3))
+    assert coord0[3000.0:2000.0].size == 1001
+    assert "_data" not in coord0._trait_values
+    coord2 = coord0[[1, 5, 7]]
+    assert_array_equal(coord2.data, x[[1, 5, 7]])
+    assert coord2[1] == coord0[5]
+
+    # location of values
+    for loc in [3999.0, 2500.4, 2500.5, 1000.0]:
+        assert coord0.loc2index(loc) == np.abs(x - loc).argmin()
+    assert coord0.loc2index(5000.0, return_error=True) == (0, "out_of_limits")
+    assert coord0._loc2index([3000.0, 2000.0]) == [1000, 2000]
+
+    # any modification of the data replaces the range
+    coord0[0] = 5000.0
+    assert coord0._deferred is None
+    assert coord0.data[0] == 5000.0
+    coord1 += 1.0
+    assert coord1._deferred is None
+    assert coord1.data[0] == 3991.0
@@ -596,6 +596,31 @@ def test_slicing_with_quantities(ds1):
         _ = da[1000.0 * ur.K, 0]  # wrong units
 
 
+def test_nddataset_view_slicing(ds1):
+    da = ds1.copy()
+
+    # same result as slicing by copy, but data are shared
+    dv = da.view[1000.0 * ur("cm^-1") :, 0]
+    dc = da[1000.0 * ur("cm^-1") :, 0]
+    assert_dataset_equal(dv, dc)
+    assert np.shares_memory(dv.data, da.data)
+    assert "Slice extracted" in dv.history[-1]
+
+    # copy-on-write
+    dv = da.view[2:4]
+    dv[0] = 0.0
+    assert np.all(dv.data[0] == 0.0)
+    assert_array_equal(da.data, ds1.data)
+
+    # global preference
+    prefs.view_slicing = True
+    try:
+        assert np.shares_memory(da[0].data, da.data)
+    finally:
+        prefs.view_slicing = False
+    assert not np.shares_memory(da[0].data, da.data)
+
+
 def test_nddataset_mask_array_input():
     marr = np.ma.array([1.0, 2.0, 5.0])  # Masked array with no masked entries
     nd = scp.NDDataset(marr)
@@ -8,6 +8,7 @@
 """Tests for the ndplugin module"""
 
 import pathlib
+import sys
 import tempfile
 
 import pytest
@@ -85,6 +86,150 @@ def test_ndio_2D(IR_dataset_2D):
     f.unlink()
 
 
+def test_ndio_scp_v2(tmp_path):
+    import json
+    import zipfile
+
+    import numpy as np
+
+    from spectrochempy.core.dataset.coord import Coord
+    from spectrochempy.utils.jsonutils import json_encoder
+
+    x = Coord(np.linspace(4000.0, 1000.0, 50), units="cm^-1", title="wavenumber")
+    y = Coord(np.arange(10.0), units="s", title="time", labels=list("abcdefghij"))
+    nd = NDDataset(np.random.rand(10, 50), coordset=[y, x], units="absorbance")
+    nd[3] = True  # mask a row
+
+    f = nd.save_as(tmp_path / "v2", confirm=False)
+    with zipfile.ZipFile(f) as zf:
+        names = zf.namelist()
+        assert names[0].endswith(".json")
+        assert all(
+            zf.getinfo(name).compress_type == zipfile.ZIP_STORED for name in names[1:]
+        )
+        assert zf.comment == b"spectrochempy-scp:3"
+
+    # arrays are read in memory by default...
+    assert not isinstance(NDDataset.load(f).data.base, np.memmap)
+
+    # ... or memory-mapped (copy-on-write)
+    nd2 = NDDataset.load(f, mmap_mode="c")
+    assert isinstance(nd2.data.base, np.memmap)
+    assert_dataset_equal(nd2, nd)
+    nd2 += 1.0
+    assert_array_equal(NDDataset.load(f).data, nd.data)
+
+    # overwriting a memory-mapped file is safe (except on Windows)
+    if sys.platform != "win32":
+        f = nd2.save()
+        assert_array_equal(NDDataset.load(f).data, nd2.data)
+
+    # compressed arrays
+    f = nd.save_as(tmp_path / "compressed", compress=True, confirm=False)
+    nd3 = NDDataset.load(f)
+    assert not isinstance(nd3.data.base, np.memmap)
+    assert_dataset_equal(nd3, nd)
+
+    # files in the previous (json only) format can still be read
+    old = tmp_path / "v1.scp"
+    with zipfile.ZipFile(old, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("v1.json", json.dumps(json_encoder(nd, encoding="base64")))
+    assert_dataset_equal(NDDataset.load(old), nd)
+
+
+def test_ndio_load_closes_file(tmp_path):
+    import os
+
+    import numpy as np
+
+    nd = NDDataset(np.random.rand(10, 50), units="absorbance")
+    f = nd.save_as(tmp_path / "closed", confirm=False)
+
+    def open_files():
+        fds = pathlib.Path("/proc/self/fd")
+        return [os.path.realpath(fd) for fd in fds.iterdir()] if fds.exists() else []
+
+    # no handle is kept on the file by eager loads...
+    loaded = [NDDataset.load(f) for _ in range(20)]
+    assert str(f.resolve()) not in open_files()
+
+    # ... so that a dataset can be saved over the file it was just loaded from
+    nd2 = loaded[0]
+    nd2 += 1.0
+    f2 = nd2.save()
+    assert f2 == f
+    assert_array_equal(NDDataset.load(f).data, nd2.data)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_ndio_lazy(tmp_path, compress):
+    import numpy as np
+
+    from spectrochempy.core.dataset.coord import Coord
+
+    x = Coord(np.linspace(4000.0, 1000.0, 50), units="cm^-1", title="wavenumber")
+    y = Coord(np.arange(20.0), units="s", title="time")
+    nd = NDDataset(np.random.rand(20, 50), coordset=[y, x], units="absorbance")
+    nd[3] = True  # mask a row
+    f = nd.save_as(tmp_path / "lazy", compress=compress, confirm=False)
+
+    lz = NDDataset.load(f, lazy=True)
+    assert lz.is_deferred
+    assert lz.shape == nd.shape
+    assert lz.dtype == nd.dtype
+    assert_array_equal(lz.x.data, nd.x.data)
+    assert "deferred" in lz._str_value()
+
+    # slicing reads only the selected part of the data
+    assert_dataset_equal(lz[2:8, 4000.0:2000.0], nd[2:8, 4000.0:2000.0])
+    assert_dataset_equal(lz[::3, 10:20], nd[::3, 10:20])
+    assert_dataset_equal(lz[[5, 1, 3]], nd[[5, 1, 3]])
+    assert_dataset_equal(lz[7], nd[7])
+    assert lz.is_deferred
+
+    # copies share the deferred data
+    assert lz.copy().is_deferred
+
+    # any other access to the data reads the full array
+    assert_array_equal(lz.data, nd.data)
+    assert not lz.is_deferred
+    assert_dataset_equal(lz, nd)
+
+
+def test_ndio_linear_coords(tmp_path):
+    import json
+    import zipfile
+
+    import numpy as np
+
+    from spectrochempy.core.dataset.coord import Coord
+
+    x = Coord(np.linspace(4000.0, 1000.0, 3001), units="cm^-1", title="wavenumber")
+    t = Coord([0.0, 1.0, 3.0, 7.0, 15.0], units="s", title="time")
+    nd = NDDataset(np.random.rand(5, 3001), coordset=[t, x], units="absorbance")
+    assert nd.x.linear and not nd.y.linear
+
+    # only the first value, spacing and size of the linear coordinates are saved
+    f = nd.save_as(tmp_path / "linear", confirm=False)
+    with zipfile.ZipFile(f) as zf:
+        names = zf.namelist()
+        js = json.loads(zf.read(names[0]))
+    assert len(names) == 3  # json, data and time coordinates
+    coords = {c["title"]: c["data"] for c in js["coordset"]["coords"]}
+    assert coords["wavenumber"] == {
+        "start": 4000.0,
+        "step": -1.0,
+        "size": 3001,
+        "__class__": "LINEAR_RANGE",
+    }
+
+    nd2 = NDDataset.load(f)
+    assert nd2.x.linear
+    assert nd2.x._deferred.size == 3001
+    assert not nd2.x.is_deferred
+    assert_dataset_equal(nd2, nd)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
 
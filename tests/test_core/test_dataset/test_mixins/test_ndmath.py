@@ -8,6 +8,7 @@
 import numpy as np
 import pytest
 from pint.errors import DimensionalityError
+from pint.errors import OffsetUnitCalculusError
 
 import spectrochempy as scp
 from spectrochempy.application.application import error_
@@ -15,6 +16,8 @@ from spectrochempy.application.application import info_
 from spectrochempy.core.dataset.arraymixins.ndmath import _binary_ufuncs
 from spectrochempy.core.dataset.arraymixins.ndmath import _comp_ufuncs
 from spectrochempy.core.dataset.arraymixins.ndmath import _unary_ufuncs
+from spectrochempy.core.dataset.arraymixins.ndmath import units_cache_clear
+from spectrochempy.core.dataset.arraymixins.ndmath import units_cache_info
 from spectrochempy.core.dataset.coord import Coord
 from spectrochempy.core.dataset.coordset import CoordSet
 from spectrochempy.core.dataset.nddataset import NDDataset
@@ -238,6 +241,41 @@ def test_nddataset_add_inplace():
     assert np.all(d1.data == 1.5)
 
 
+def test_nddataset_inplace_no_copy():
+    """Test that in-place operations work on the data buffer and copy nothing else."""
+    d1 = NDDataset(np.ones((5, 5)), units="m")
+    d2 = NDDataset(np.full((5, 5), 50.0), units="cm")
+    data = d1.data
+    d1 += d2
+    d1 *= 2.0
+    d1 -= d1[0]
+    assert d1.data is data
+    assert np.all(d1.data == 0.0)
+    assert np.all(d2.data == 50.0)
+    assert d2.units == ur.cm
+
+    # the read-only data of a view are copied before being modified
+    d1 = NDDataset(np.ones((5, 5)))
+    row = d1.view[0]
+    row += 1.0
+    assert np.all(row.data == 2.0)
+    assert np.all(d1.data == 1.0)
+
+    # in-place operation on the reversed operands must not modify the other operand
+    c = Coord(np.arange(5.0))
+    d = NDDataset(np.ones((5,)), coordset=[c.copy()])
+    c += d
+    assert np.all(d.data == 1.0)
+
+    # the result of an operation owns its data
+    d3 = d2 + 1.0 * ur.m
+    assert not np.shares_memory(d3.data, d2.data)
+    d4 = NDDataset(np.ones((5, 5)))
+    d3 = 2.0**d4
+    assert np.all(d3.data == 2.0)
+    assert np.all(d4.data == 1.0)
+
+
 def test_nddataset_add_mismatch_coords():
     """Test addition with mismatched coordinates."""
     coord1 = Coord(np.arange(5.0))
@@ -456,6 +494,47 @@ def test_arithmetic_unit_calculation(unit1, unit2, op, result_units):
         assert_units_equal(ndd1_method(ndd2).units, result_units)
 
 
+def test_units_cache():
+    """Test the cache of the units calculations."""
+    units_cache_clear()
+    d1 = NDDataset(np.ones((3, 4)), units="m")
+    d2 = NDDataset(np.full((3, 4), 50.0), units="cm")
+
+    x = d1 + d2
+    info = units_cache_info()
+    assert info.misses == 1
+    assert_array_equal(x.data, np.full((3, 4), 1.5))
+    assert x.units == ur.m
+
+    for _ in range(5):
+        x = d1 + d2
+    info = units_cache_info()
+    assert info.misses == 1
+    assert info.hits == 5
+
+    # the exponent is part of the key for power functions
+    assert (d1**2).units == ur.m**2
+    assert (d1**3).units == ur.m**3
+    assert np.sqrt(d1 * d1).units == ur.m
+
+    # conversion which are not a simple scaling
+    t1 = NDDataset([20.0, 30.0], units="degC")
+    t2 = NDDataset([293.15, 303.15], units="K")
+    assert_array_equal((t1 - t2).data, [0.0, 0.0])
+    with pytest.raises(OffsetUnitCalculusError):
+        t1 + 1 * ur.K
+
+    # bare units
+    assert (d1 * ur.m).units == ur.m**2
+    assert (d1 / ur.s).units == ur.m / ur.s
+
+    # array of exponents: the largest one gives the units
+    assert (NDDataset([2.0, 2.0], units="m") ** np.array([2, 3])).units == ur.m**3
+
+    with pytest.raises(DimensionalityError):
+        np.exp(d1)
+
+
 def test_coord_add_units_with_different_scale():
     """Test addition with different unit scales on coordinates."""
     d1 = Coord.arange(3.0, units="m")
@@ -7,6 +7,7 @@
 import os
 import pathlib
 
+import numpy as np
 import pytest
 
 import spectrochempy as scp
@@ -15,7 +16,9 @@ from spectrochempy import NDDataset
 from spectrochempy.application.preferences import preferences as prefs
 from spectrochempy.core.readers.filetypes import registry
 from spectrochempy.core.readers.importer import Importer
+from spectrochempy.core.readers.importer import _concatenate_rows
 from spectrochempy.core.readers.importer import _importer_method
+from spectrochempy.core.readers.importer import merge_datasets
 from spectrochempy.core.readers.importer import read
 from spectrochempy.core.readers.importer import read_dir
 from spectrochempy.utils.file import pathclean
@@ -282,6 +285,48 @@ class TestImporterMerging:
         assert datasets.origin == "merged [omnic, opus]"
         assert datasets.name == "merged [omnic, opus]"
 
+    def test_parallel_read(self, monkeypatch, fs):
+        """Test reading files in parallel."""
+        self.setup_method()
+
+        monkeypatch.setattr(os.path, "exists", lambda p: True)
+        monkeypatch.setattr(scp, "read_fk", MockDatasetFactory.create_reader())
+
+        all_files = self.opus_files + self.omnic_files
+        expected = read(all_files, protocol="fake", local_only=True, merge=False)
+        for workers in [2, -1]:
+            datasets = read(
+                all_files,
+                protocol="fake",
+                local_only=True,
+                merge=False,
+                workers=workers,
+            )
+            assert [ds.name for ds in datasets] == [ds.name for ds in expected]
+
+        merged = read(all_files, protocol="fake", local_only=True, workers=4)
+        assert merged.shape == (5, 3)
+        assert merged.origin == "merged [omnic, opus]"
+
+        with pytest.raises(ValueError):
+            read(all_files, protocol="fake", local_only=True, executor="fork")
+
+    def test_parallel_read_not_found(self, monkeypatch, fs):
+        """Test that a missing file is reported once all files have been read."""
+        self.setup_method()
+
+        read_files = []
+
+        def exists(path):
+            read_files.append(pathlib.Path(path).name)
+            return "opus1" not in str(path)
+
+        monkeypatch.setattr(os.path, "exists", exists)
+
+        with pytest.raises(FileNotFoundError):
+            read(self.opus_files, protocol="fake", local_only=True, workers=2)
+        assert sorted(read_files) == ["opus0.fk", "opus1.fk", "opus2.fk"]
+
 
 class TestImporterDirectoryReading:
     """Test directory reading functionality."""
@@ -359,5 +404,54 @@ class TestImporterDirectoryReading:
         assert nd is None  # Should return None for empty directory
 
 
+def _spectra_series(n, nx=50):
+    # series of single spectra as read from individual files (e.g. omnic .spa)
+    rng = np.random.default_rng(0)
+    datasets = []
+    for i in range(n):
+        ds = NDDataset(rng.random((1, nx)), units="absorbance", title="absorbance")
+        ds.set_coordset(
+            y=scp.Coord(
+                [float(rng.integers(10**6))],
+                title="acquisition timestamp (GMT)",
+                units="s",
+                labels=[f"file{i}.spa"],
+            ),
+            x=scp.Coord.linspace(4000.0, 400.0, nx, units="cm^-1"),
+        )
+        ds.name = f"spectrum{i}"
+        datasets.append(ds)
+    datasets[2][0, 3] = scp.MASKED
+    return datasets
+
+
+def test_merge_spectra_series():
+    datasets = _spectra_series(10)
+
+    for sortbydate in [True, False]:
+        expected = scp.concatenate(datasets, axis=0)
+        if sortbydate:
+            expected.sort(dim=0, inplace=True)
+            assert np.all(np.diff(expected.y.data) >= 0)
+
+        merged = merge_datasets(datasets, sortbydate=sortbydate)[0]
+        assert np.array_equal(merged.data, expected.data)
+        assert np.array_equal(merged.mask, expected.mask)
+        assert np.array_equal(merged.y.data, expected.y.data)
+        assert np.array_equal(merged.y.labels, expected.y.labels)
+        assert merged.x == expected.x
+        assert merged.description == expected.description
+        assert merged.history[-1].endswith("Merged from several files")
+
+    # equal x coordinates need not be the same object
+    datasets[1].x = datasets[0].x.copy()
+    assert _concatenate_rows(datasets) is not None
+
+    # datasets with different x coordinates are merged by the general method
+    datasets[1].x = datasets[1].x + 1
+    assert _concatenate_rows(datasets) is None
+    assert merge_datasets(datasets)[0].shape == (10, 50)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
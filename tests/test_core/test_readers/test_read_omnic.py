@@ -5,11 +5,15 @@
 # ======================================================================================
 # ruff: noqa
 
+import io
+
+import numpy as np
 import pytest
 
 import spectrochempy as scp
 from spectrochempy.application.preferences import preferences as prefs
 from spectrochempy.core.dataset.nddataset import NDDataset
+from spectrochempy.core.readers.read_omnic import _read_srs_spectra, _readbtext
 from spectrochempy.utils.testing import assert_dataset_equal
 
 DATADIR = prefs.datadir
@@ -90,6 +94,39 @@ def test_read_omnic():
     a = scp.read_srs("irdata/omnic_series/high_speed.srs")
     assert str(a) == "NDDataset: [float64] a.u. (shape: (y:897, x:13898))"
 
+    # skipping the reading of spectra names
+    b = scp.read_srs("irdata/omnic_series/high_speed.srs", read_names=False)
+    assert np.array_equal(b.data, a.data)
+    assert not b.y.is_labeled
+
     # high speed series, import bg
     a = scp.read_srs("irdata/omnic_series/high_speed.srs", return_bg=True)
     assert str(a) == "NDDataset: [float64] unitless (shape: (y:1, x:13898))"
+
+
+def test_read_srs_spectra():
+    # synthetic series: records made of a name, the data and 16 bytes of padding
+    n_spectra, n_points, pos_data = 5, 20, 32
+    rng = np.random.default_rng(0)
+    expected = rng.random((n_spectra, n_points)).astype("float32")
+    content = bytearray(pos_data)
+    for i, row in enumerate(expected):
+        content += f"spectrum #{i}".encode().ljust(84, b"\x00")
+        content += row.tobytes() + bytes(16)
+    content = bytes(content)
+
+    names, data = _read_srs_spectra(content, pos_data, n_spectra, n_points)
+    assert data.dtype == np.float64
+    assert np.array_equal(data, expected)
+    stride = 84 + 4 * n_points + 16
+    fid = io.BytesIO(content)
+    assert names == [
+        _readbtext(fid, pos_data + i * stride, 256) for i in range(n_spectra)
+    ]
+    assert names[1].startswith("spectrum #1")
+
+    names, data = _read_srs_spectra(
+        content, pos_data, n_spectra, n_points, read_names=False
+    )
+    assert names is None
+    assert np.array_equal(data, expected)
@@ -3,6 +3,7 @@ import pytest
 from scipy import sparse
 
 from spectrochempy.extern.whittaker_smooth import speyediff
+from spectrochempy.extern.whittaker_smooth import whittaker_factor
 from spectrochempy.extern.whittaker_smooth import whittaker_smooth
 
 
@@ -102,12 +103,38 @@ def test_whittaker_smooth_known_signal():
     assert right_mean > 0.8, "Right side not close enough to 1"
 
     # Test smoothness
-    assert np.std(np.diff(y_smooth[:45])) < np.std(
-        np.diff(y_noisy[:45])
-    ), "Left side not smoothed"
-    assert np.std(np.diff(y_smooth[55:])) < np.std(
-        np.diff(y_noisy[55:])
-    ), "Right side not smoothed"
+    assert np.std(np.diff(y_smooth[:45])) < np.std(np.diff(y_noisy[:45])), (
+        "Left side not smoothed"
+    )
+    assert np.std(np.diff(y_smooth[55:])) < np.std(np.diff(y_noisy[55:])), (
+        "Right side not smoothed"
+    )
+
+
+def test_whittaker_smooth_2D():
+    """Test smoothing of all the rows of an array with a single factorization."""
+    rng = np.random.default_rng(0)
+    X = rng.random((20, 150))
+
+    whittaker_factor.cache_clear()
+    X_smooth = whittaker_smooth(X, lmbd=1.5, d=2)
+    expected = np.array([whittaker_smooth(row, lmbd=1.5, d=2) for row in X])
+    assert X_smooth.shape == X.shape
+    assert np.array_equal(X_smooth, expected)
+
+    # the matrix has been factorized only once
+    info = whittaker_factor.cache_info()
+    assert info.misses == 1
+    assert info.hits == 20
+
+    # other parameters give another factorization
+    whittaker_smooth(X, lmbd=10, d=2)
+    whittaker_smooth(X[:, :100], lmbd=1.5, d=2)
+    assert whittaker_factor.cache_info().misses == 3
+
+    # higher dimensions
+    X3 = X.reshape(4, 5, 150)
+    assert np.array_equal(whittaker_smooth(X3, lmbd=1.5), expected.reshape(4, 5, 150))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+# ======================================================================================
+# Copyright (©) 2015-2025 LCS - Laboratoire Catalyse et Spectrochimie, Caen, France.
+# CeCILL-B FREE SOFTWARE LICENSE AGREEMENT
+# See full LICENSE agreement in the root directory.
+# ======================================================================================
+import numpy as np
+import pytest
+
+import spectrochempy as scp
+
+
+def _spiky_dataset(nrows=20, ncols=300):
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 1, ncols)
+    data = np.exp(-(((x - 0.5) / 0.05) ** 2)) + 0.01 * rng.standard_normal(
+        (nrows, ncols)
+    )
+    # isolated and wide spikes
+    rows = rng.integers(0, nrows, 3 * nrows)
+    cols = rng.integers(0, ncols - 2, 3 * nrows)
+    data[rows, cols] += rng.uniform(0.5, 3, 3 * nrows)
+    data[rows[:nrows], cols[:nrows] + 1] += 2.0
+    return scp.NDDataset(data)
+
+
+def _whitaker_row(X, size, delta):
+    # straightforward implementation of the whitaker method for a single spectrum
+    s = int((size - 1) / 2)
+    DX = np.zeros_like(X)
+    DX[1:] = X[1:] - X[:-1]
+    m = np.median(DX)
+    M = np.median(np.abs(DX - m))
+    Z = (DX - m) / M
+    Z[0] = Z[-1] = delta + 1
+    select = abs(Z) >= delta
+    X = X.copy()
+    for i in np.flatnonzero(select):
+        indexes = [j for j in range(max(0, i - s), min(len(X), i + s)) if not select[j]]
+        A = np.mean(X[indexes]) if indexes else X[i]
+        X[i] -= X[i] - A
+    return X
+
+
+@pytest.mark.parametrize("size", [4, 9, 21])
+def test_despike_whitaker(size):
+    ds = _spiky_dataset()
+    new = scp.despike(ds, size=size, delta=3, method="whitaker")
+    expected = np.array([_whitaker_row(row, size, 3) for row in ds.data])
+    assert np.array_equal(new.data, expected)
+
+
+@pytest.mark.parametrize("method", ["katsumoto", "whitaker"])
+def test_despike_chunks(method):
+    ds = _spiky_dataset()
+    new = scp.despike(ds, method=method)
+    assert new.shape == ds.shape
+    assert not np.array_equal(new.data, ds.data)
+    assert "Despiked" in new.history[-1]
+
+    # each row is processed independently
+    for i in [0, 7]:
+        row = scp.despike(ds[i : i + 1], method=method)
+        assert np.array_equal(row.data, new.data[i : i + 1])
+
+    # processing by chunks, possibly in parallel, gives the same result
+    chunked = scp.despike(ds, method=method, chunksize=6)
+    assert np.array_equal(chunked.data, new.data)
+    parallel = scp.despike(ds, method=method, chunksize=6, workers=3)
+    assert np.array_equal(parallel.data, new.data)
+
+    with pytest.raises(ValueError):
+        scp.despike(ds, method="unknown")
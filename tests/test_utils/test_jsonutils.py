@@ -96,6 +96,33 @@ def test_numpy_arrays():
         ), f"Failed with base64 encoding for {name}"
 
 
+def test_numpy_arrays_npy_encoding():
+    """Test that arrays are collected outside the json with the npy encoding."""
+    obj = {
+        "data": np.random.rand(3, 4),
+        "labels": np.array(["a", "b"]),
+        "objects": np.array([datetime(2025, 1, 1), None], dtype=object),
+    }
+    arrays = {}
+    js = json_encoder(obj, encoding="npy", arrays=arrays)
+    js_string = json.dumps(js)
+
+    # object arrays can not be stored as npy: they are still pickled
+    assert len(arrays) == 2
+    assert "base64" in js["objects"]
+
+    decoded = json.loads(
+        js_string, object_hook=lambda dic: json_decoder(dic, arrays=arrays)
+    )
+    assert decoded["data"] is obj["data"]
+    assert np.array_equal(decoded["labels"], obj["labels"])
+    assert decoded["objects"][0] == obj["objects"][0]
+
+    # references can not be resolved without the arrays
+    with pytest.raises(ValueError):
+        json.loads(js_string, object_hook=json_decoder)
+
+
 def test_complex_numbers():
     """Test encoding and decoding of complex numbers."""
     # Test using NumPy complex array with base64 encoding to avoid complex number handling issue
@@ -7,6 +7,7 @@
 import numpy as np
 import pytest
 
+from spectrochempy.utils.numutils import LinearRange
 from spectrochempy.utils.numutils import get_n_decimals
 from spectrochempy.utils.numutils import gt_eps
 from spectrochempy.utils.numutils import largest_power_of_2
@@ -103,3 +104,32 @@ class TestLargestPowerOf2:
     def test_large_values(self):
         assert largest_power_of_2(1023) == 1024
         assert largest_power_of_2(1025) == 2048
+
+
+class TestLinearRange:
+    def test_array(self):
+        rng = LinearRange(4000, -2.5, 5)
+        assert rng.shape == (5,) and rng.ndim == 1 and len(rng) == 5
+        assert rng.dtype == np.float64
+        assert np.array_equal(np.asarray(rng), [4000.0, 3997.5, 3995.0, 3992.5, 3990.0])
+        assert np.asarray(rng, dtype=np.float32).dtype == np.float32
+
+    def test_getitem(self):
+        rng = LinearRange(10.0, 2.0, 10)
+        arr = np.asarray(rng)
+        for key in [slice(2, 7), slice(None, None, 3), slice(8, 1, -2), slice(5, 2)]:
+            new = rng[key]
+            assert isinstance(new, LinearRange)
+            assert np.allclose(np.asarray(new), arr[key])
+        assert isinstance(rng[(slice(1, 3),)], LinearRange)
+        assert rng[3] == 16.0 and rng[-1] == 28.0
+        assert np.array_equal(rng[[0, 4, 2]], arr[[0, 4, 2]])
+        with pytest.raises(IndexError):
+            rng[10]
+
+    def test_index(self):
+        rng = LinearRange(4000.0, -10.0, 301)
+        arr = np.asarray(rng)
+        for value in [3999.0, 3995.0, 3123.4, 1000.0, 5000.0, 0.0]:
+            assert rng.index(value) == np.abs(arr - value).argmin()
+        assert LinearRange(1.0, 1.0, 1).index(5.0) == 0
@@ -13,6 +13,7 @@ from unittest import mock
 import pytest
 
 from spectrochempy.utils.system import (
+    get_n_workers,
     get_node,
     get_user,
     get_user_and_node,
@@ -27,6 +28,16 @@ def test_get_user():
     assert len(res) > 0
 
 
+def test_get_n_workers():
+    assert get_n_workers(None) == 1
+    assert get_n_workers(1) == 1
+    assert get_n_workers(3) == 3
+    assert get_n_workers(-1) == os.cpu_count()
+    for workers in [0, -2]:
+        with pytest.raises(ValueError, match="workers must be"):
+            get_n_workers(workers)
+
+
 def test_get_node():
     res = get_node()
     assert res is not None
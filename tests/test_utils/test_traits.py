@@ -4,11 +4,13 @@
 # See full LICENSE agreement in the root directory.
 # ======================================================================================
 import unittest
+from fractions import Fraction
 
 import numpy as np
 import traitlets as tr
 
 from spectrochempy.utils.traits import CoordType
+from spectrochempy.utils.traits import LazyInstance
 from spectrochempy.utils.traits import NDDatasetType
 from spectrochempy.utils.traits import PositiveInteger
 from spectrochempy.utils.traits import PositiveOddInteger
@@ -193,5 +195,23 @@ class TestPositiveOddInteger(unittest.TestCase):
         self.assertIsNone(trait_allow_none.validate(model, None))
 
 
+class TestLazyInstance(unittest.TestCase):
+    def test_validate(self):
+        """Test that the class of LazyInstance is resolved only at validation."""
+
+        class _Model(tr.HasTraits):
+            value = LazyInstance("fractions.Fraction", allow_none=True)
+
+        model = _Model()
+        trait = _Model.class_traits()["value"]
+        self.assertEqual(trait.klass, "fractions.Fraction")
+        self.assertIsNone(model.value)
+
+        model.value = Fraction(1, 2)
+        self.assertIs(trait.klass, Fraction)
+        with self.assertRaises(tr.TraitError):
+            model.value = 0.5
+
+
 if __name__ == "__main__":
     unittest.main()
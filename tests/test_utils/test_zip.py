@@ -3,6 +3,7 @@ import zipfile
 import numpy as np
 import pytest
 
+from spectrochempy.utils.zip import DeferredArray
 from spectrochempy.utils.zip import ScpFile
 from spectrochempy.utils.zip import make_zipfile
 
@@ -41,6 +42,62 @@ def test_scpfile(tmp_path):
         assert scp["test.json"] == {"key": "value"}
 
 
+def test_scpfile_memmap(tmp_path):
+    test_file = tmp_path / "test.scp"
+    arr = np.arange(12.0).reshape(3, 4)
+    with make_zipfile(test_file, mode="w") as zf:
+        zf.writestr(
+            "test.json", '{"data": {"npy": "a.npy", "__class__": "NUMPY_ARRAY"}}'
+        )
+        with zf.open("a.npy", "w") as f:
+            np.save(f, arr)
+        info = zipfile.ZipInfo("b.npy")
+        info.compress_type = zipfile.ZIP_DEFLATED
+        with zf.open(info, "w") as f:
+            np.save(f, arr)
+
+    with ScpFile(test_file, mmap_mode="r") as scp:
+        assert scp.version == 1
+        a = scp["a.npy"]
+        assert isinstance(a.base, np.memmap)
+        assert np.array_equal(a, arr)
+        assert not a.flags.writeable
+        # compressed members are read in memory
+        b = scp["b.npy"]
+        assert not isinstance(b.base, np.memmap)
+        assert np.array_equal(b, arr)
+        # array references in json members are resolved
+        assert np.array_equal(scp["test.json"]["data"], arr)
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+def test_deferred_array(tmp_path, compression):
+    test_file = tmp_path / "test.scp"
+    arr = np.arange(60.0).reshape(10, 6)
+    with make_zipfile(test_file, mode="w") as zf:
+        info = zipfile.ZipInfo("a.npy")
+        info.compress_type = compression
+        with zf.open(info, "w") as f:
+            np.save(f, arr)
+
+    with ScpFile(test_file) as scp:
+        scp.deferred.add("a.npy")
+        d = scp["a.npy"]
+    assert isinstance(d, DeferredArray)
+    assert d.shape == arr.shape
+    assert d.dtype == arr.dtype
+    for keys in [
+        (slice(2, 5), slice(1, 3)),
+        (slice(None, None, 3), slice(None)),
+        ([7, 2, 2], slice(None)),
+        (4, slice(0, 2)),
+        slice(8, 20),
+        (slice(3, 3),),
+    ]:
+        assert np.array_equal(d[keys], arr[keys])
+    assert np.array_equal(np.asarray(d), arr)
+
+
 def test_scpfile_nonexistent_key(tmp_path):
     # Create a temporary zip file
     test_file = tmp_path / "test.scp"